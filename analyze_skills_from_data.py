@@ -3,10 +3,10 @@ ANALISIS SKILLS DARI DATA GLINTS & JOB KEYWORDS
 Untuk membuat skills dictionary yang lebih comprehensive
 """
 
-import pandas as pd
 import re
 from collections import Counter
 import json
+from job_data_loader import load_job_data, SKILLS_ANALYSIS_COLUMNS
 
 def analyze_glints_skills():
     """
@@ -17,7 +17,7 @@ def analyze_glints_skills():
     
     try:
         # Load data Glints
-        df = pd.read_csv('glints_scraped_clean.csv', sep=';')
+        df = load_job_data('glints_scraped_clean.csv', SKILLS_ANALYSIS_COLUMNS)
         print(f"✅ Loaded {len(df):,} job records")
         
         # Ekstrak skills dari kolom skills_clean dan description
@@ -0,0 +1,85 @@
+"""
+ARROW HANDOFF: cleaned_data sebagai Arrow IPC File
+Kolom yang dipakai Fase 2 ditulis sekali ke file IPC tanpa kompresi;
+worker dan fase berikutnya membacanya lewat memory_map sehingga buffer
+teks dibagi lewat page cache (zero-copy), tanpa pickle DataFrame per worker
+"""
+
+import os
+import json
+
+import numpy as np
+import pandas as pd
+
+from job_data_loader import normalize_missing, SCRAPE_DATE_COLUMNS
+
+try:
+    import pyarrow as pa
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+HANDOFF_FILE = 'cleaned_data.arrow'
+HANDOFF_META_KEY = b'handoff'
+ROW_INDEX_COLUMN = '__row_index'
+
+# Kolom teks besar: large_string, tetap berupa buffer Arrow di pandas (ArrowDtype)
+TEXT_COLUMNS = ['cleaned_text', 'skill_tags']
+# Kolom metadata kecil: string biasa, dikonversi ke kolom pandas (NaN seperti read_csv)
+META_COLUMNS = ['posisi', 'company'] + SCRAPE_DATE_COLUMNS
+
+def _require_arrow():
+    if not ARROW_AVAILABLE:
+        raise ImportError("pyarrow dibutuhkan untuk Arrow hand-off (pip install pyarrow)")
+
+def write_handoff(cleaned_data, path=HANDOFF_FILE, order=None, metadata=None):
+    """
+    Tulis kolom Fase 2 + index baris (job_id) ke Arrow IPC file.
+    order: urutan baris (mis. dikelompokkan per shard agar tiap shard
+    berupa slice kontigu); metadata disimpan di schema
+    """
+    _require_arrow()
+    df = cleaned_data if order is None else cleaned_data.iloc[order]
+
+    names = [ROW_INDEX_COLUMN]
+    arrays = [pa.array(df.index.to_numpy(dtype=np.int64))]
+    for columns, arrow_type in ((META_COLUMNS, pa.string()), (TEXT_COLUMNS, pa.large_string())):
+        for col in columns:
+            if col in df.columns:
+                names.append(col)
+                arrays.append(pa.array(df[col].to_numpy(dtype=object), type=arrow_type, from_pandas=True))
+
+    meta = {'rows': len(df), **(metadata or {})}
+    table = pa.Table.from_arrays(arrays, names=names).replace_schema_metadata(
+        {HANDOFF_META_KEY: json.dumps(meta)})
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = path + '.tmp'
+    with pa.OSFile(tmp_path, 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_path, path)
+    return path
+
+def read_handoff_metadata(path=HANDOFF_FILE):
+    _require_arrow()
+    with pa.memory_map(path) as source:
+        schema = pa.ipc.open_file(source).schema
+    return json.loads(schema.metadata[HANDOFF_META_KEY])
+
+def read_handoff(path=HANDOFF_FILE, offset=0, length=None):
+    """
+    cleaned_data dari hand-off file (opsional hanya slice baris
+    [offset, offset + length)). Kolom teks menunjuk langsung ke memory map;
+    index DataFrame = index baris asli sehingga job_id tetap sama.
+    """
+    _require_arrow()
+    with pa.memory_map(path) as source:
+        table = pa.ipc.open_file(source).read_all()
+    table = table.slice(offset, length)
+
+    df = table.to_pandas(types_mapper={pa.large_string(): pd.ArrowDtype(pa.large_string())}.get)
+    df.index = pd.Index(df.pop(ROW_INDEX_COLUMN).to_numpy())
+    return normalize_missing(df)
@@ -0,0 +1,49 @@
+"""
+ARTIFACT I/O: Helper untuk artifact hasil pipeline
+Content hash dan penulisan file JSON secara atomic
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+
+def content_hash(data):
+    """
+    SHA-256 dari representasi JSON kanonik (sorted keys) sebuah object
+    """
+    canonical = json.dumps(data, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+def load_json(file_path, default=None):
+    """
+    Load file JSON, kembalikan default jika file tidak ada
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+
+def _current_umask():
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+def atomic_write_json(file_path, data, indent=2):
+    """
+    Tulis JSON ke file sementara lalu os.replace, sehingga pembaca
+    tidak pernah melihat file yang setengah tertulis
+    """
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, tmp_path = tempfile.mkstemp(prefix='.tmp_', suffix='.json', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
+        # mkstemp membuat file 0600; samakan dengan permission file biasa
+        os.chmod(tmp_path, 0o666 & ~_current_umask())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
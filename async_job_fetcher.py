@@ -0,0 +1,302 @@
+"""
+ASYNC JOB FETCHER: Ambil Detail Lowongan dari File Job Links
+Asyncio + connection pool (keep-alive), rate limit per host, retry dengan
+backoff, dan cache response di disk. Output CSV format Fase 1:
+posisi;company;description;skills_clean
+"""
+
+import os
+import csv
+import glob
+import json
+import time
+import random
+import asyncio
+import hashlib
+import argparse
+from urllib.parse import urlparse
+
+import aiohttp
+from bs4 import BeautifulSoup
+
+LINKS_DIR = 'scrap result'
+LINKS_PATTERN = 'job_links_*.csv'
+CACHE_DIR = 'fetch_cache'
+# File terpisah dari dataset utama (glints_scraped_clean.csv) agar run default tidak menimpanya
+OUTPUT_FILE = 'glints_fetched_jobs.csv'
+OUTPUT_COLUMNS = ['posisi', 'company', 'description', 'skills_clean']
+LINK_COLUMNS = ['link', 'job_link', 'url', 'href']
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+def read_job_links(pattern=os.path.join(LINKS_DIR, LINKS_PATTERN)):
+    """
+    Kumpulkan link unik dari file job_links_*.csv
+    Return: [(url, keyword)], keyword diambil dari nama file
+    """
+    links = []
+    seen = set()
+
+    for file_path in sorted(glob.glob(pattern)):
+        keyword = os.path.basename(file_path)[len('job_links_'):-len('.csv')].replace('_', ' ')
+        with open(file_path, 'r', encoding='utf-8', newline='') as f:
+            sample = f.read(4096)
+            f.seek(0)
+            try:
+                dialect = csv.Sniffer().sniff(sample, delimiters=',;')
+            except csv.Error:
+                dialect = csv.excel
+            rows = list(csv.reader(f, dialect))
+
+        if not rows:
+            continue
+
+        # Kolom link: berdasarkan header, atau kolom pertama yang berisi URL
+        header = [col.strip().lower() for col in rows[0]]
+        column = next((header.index(col) for col in LINK_COLUMNS if col in header), None)
+        if column is None:
+            column = next((i for i, value in enumerate(rows[0]) if value.startswith('http')), 0)
+        else:
+            rows = rows[1:]
+
+        for row in rows:
+            if len(row) <= column:
+                continue
+            url = row[column].strip()
+            if url.startswith('http') and url not in seen:
+                seen.add(url)
+                links.append((url, keyword))
+
+    return links
+
+def _html_to_text(html):
+    return BeautifulSoup(html or '', 'html.parser').get_text(' ', strip=True)
+
+def _iter_json_ld(soup):
+    for script in soup.find_all('script', type='application/ld+json'):
+        try:
+            data = json.loads(script.string or '')
+        except json.JSONDecodeError:
+            continue
+        if isinstance(data, dict):
+            data = data.get('@graph', [data])
+        for item in data if isinstance(data, list) else []:
+            if isinstance(item, dict):
+                yield item
+
+def parse_job_page(html, keyword=''):
+    """
+    Ekstrak baris output dari halaman detail lowongan (JSON-LD JobPosting,
+    fallback ke <h1>/<title>); None jika halaman bukan lowongan
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+
+    for item in _iter_json_ld(soup):
+        if item.get('@type') != 'JobPosting':
+            continue
+        organization = item.get('hiringOrganization') or {}
+        skills = item.get('skills') or []
+        if isinstance(skills, str):
+            skills = [skill.strip() for skill in skills.split(',')]
+        return {
+            'posisi': item.get('title') or keyword,
+            'company': organization.get('name', '') if isinstance(organization, dict) else str(organization),
+            'description': _html_to_text(item.get('description', '')),
+            'skills_clean': ', '.join(skill for skill in skills if skill)
+        }
+
+    title = soup.find('h1') or soup.find('title')
+    description = soup.find(attrs={'name': 'description'})
+    if title is None or description is None:
+        return None
+    return {
+        'posisi': title.get_text(strip=True) or keyword,
+        'company': '',
+        'description': description.get('content', ''),
+        'skills_clean': ''
+    }
+
+class HostRateLimiter:
+    """
+    Jarak minimum antar request ke host yang sama
+    """
+
+    def __init__(self, min_interval):
+        self.min_interval = min_interval
+        self._locks = {}
+        self._last_request = {}
+
+    async def wait(self, host):
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            elapsed = time.monotonic() - self._last_request.get(host, 0)
+            if elapsed < self.min_interval:
+                await asyncio.sleep(self.min_interval - elapsed)
+            self._last_request[host] = time.monotonic()
+
+class AsyncJobFetcher:
+    """
+    Fetch halaman lowongan secara konkuren dengan satu ClientSession
+    (connection pool keep-alive) dan worker pool berukuran tetap
+    """
+
+    def __init__(self, concurrency=10, per_host=4, min_interval=0.5, max_retries=4,
+                 backoff=1.0, timeout=30, cache_dir=CACHE_DIR):
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.cache_dir = cache_dir
+        self.rate_limiter = HostRateLimiter(min_interval)
+        self.stats = {'fetched': 0, 'cached': 0, 'failed': 0, 'retries': 0}
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def _cache_path(self, url):
+        return os.path.join(self.cache_dir, hashlib.sha256(url.encode('utf-8')).hexdigest() + '.html')
+
+    def is_cached(self, url):
+        return bool(self.cache_dir) and os.path.exists(self._cache_path(url))
+
+    def _read_cache(self, url):
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._cache_path(url), 'r', encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def _write_cache(self, url, body):
+        if not self.cache_dir:
+            return
+        path = self._cache_path(url)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(body)
+        os.replace(tmp_path, path)
+
+    async def fetch(self, session, url):
+        """
+        GET dengan retry + exponential backoff (jitter); hormati Retry-After
+        """
+        body = self._read_cache(url)
+        if body is not None:
+            self.stats['cached'] += 1
+            return body
+
+        host = urlparse(url).netloc
+        for attempt in range(self.max_retries + 1):
+            await self.rate_limiter.wait(host)
+            delay = self.backoff * (2 ** attempt) * (1 + random.random() / 2)
+            try:
+                async with session.get(url) as response:
+                    if response.status == 200:
+                        body = await response.text()
+                        self._write_cache(url, body)
+                        self.stats['fetched'] += 1
+                        return body
+                    if response.status not in RETRY_STATUS:
+                        break
+                    retry_after = response.headers.get('Retry-After', '')
+                    if retry_after.isdigit():
+                        delay = max(delay, int(retry_after))
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                pass
+
+            if attempt < self.max_retries:
+                self.stats['retries'] += 1
+                await asyncio.sleep(delay)
+
+        self.stats['failed'] += 1
+        return None
+
+    async def _worker(self, session, queue, results):
+        while True:
+            position, url, keyword = await queue.get()
+            try:
+                body = await self.fetch(session, url)
+                if body is not None:
+                    results[position] = parse_job_page(body, keyword)
+            except Exception as e:
+                # Satu halaman rusak tidak boleh mematikan worker (queue.join() akan menggantung)
+                self.stats['failed'] += 1
+                print(f"⚠️ Gagal memproses {url}: {e!r}")
+            finally:
+                queue.task_done()
+
+    async def fetch_all(self, links):
+        """
+        links: [(url, keyword)] → list baris output (urutan sama dengan input)
+        """
+        queue = asyncio.Queue()
+        for position, (url, keyword) in enumerate(links):
+            queue.put_nowait((position, url, keyword))
+
+        results = {}
+        connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.per_host,
+                                         keepalive_timeout=30)
+        async with aiohttp.ClientSession(connector=connector, timeout=self.timeout) as session:
+            workers = [asyncio.create_task(self._worker(session, queue, results))
+                       for _ in range(self.concurrency)]
+            await queue.join()
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        return [results[position] for position in sorted(results) if results[position]]
+
+def write_rows(rows, output_file=OUTPUT_FILE):
+    """
+    Tulis CSV dengan separator ';' (format yang dibaca step_1_1_data_collection)
+    """
+    tmp_path = output_file + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=OUTPUT_COLUMNS, delimiter=';')
+        writer.writeheader()
+        writer.writerows(rows)
+    os.replace(tmp_path, output_file)
+
+def main():
+    parser = argparse.ArgumentParser(description='Async fetcher detail lowongan dari job links')
+    parser.add_argument('--links', default=os.path.join(LINKS_DIR, LINKS_PATTERN),
+                        help='Glob file job links')
+    parser.add_argument('--output', default=OUTPUT_FILE)
+    parser.add_argument('--concurrency', type=int, default=10)
+    parser.add_argument('--per-host', type=int, default=4, help='Maks koneksi per host')
+    parser.add_argument('--min-interval', type=float, default=0.5,
+                        help='Jarak minimum (detik) antar request ke host yang sama')
+    parser.add_argument('--retries', type=int, default=4)
+    parser.add_argument('--cache-dir', default=CACHE_DIR)
+    parser.add_argument('--no-cache', action='store_true')
+    parser.add_argument('--limit', type=int, help='Ambil N link pertama saja')
+    args = parser.parse_args()
+
+    print("🌐 ASYNC JOB FETCHER")
+    print("="*50)
+
+    links = read_job_links(args.links)
+    if args.limit:
+        links = links[:args.limit]
+    if not links:
+        print(f"❌ Tidak ada link ditemukan pada '{args.links}'")
+        return
+    print(f"🔗 {len(links):,} link unik (concurrency={args.concurrency}, per-host={args.per_host})")
+
+    fetcher = AsyncJobFetcher(concurrency=args.concurrency, per_host=args.per_host,
+                              min_interval=args.min_interval, max_retries=args.retries,
+                              cache_dir=None if args.no_cache else args.cache_dir)
+    start = time.perf_counter()
+    rows = asyncio.run(fetcher.fetch_all(links))
+    elapsed = time.perf_counter() - start
+
+    write_rows(rows, args.output)
+    stats = fetcher.stats
+    print(f"✅ {len(rows):,} lowongan dalam {elapsed:.1f} detik")
+    print(f"📊 Fetched: {stats['fetched']:,} | Cache: {stats['cached']:,} | "
+          f"Retry: {stats['retries']:,} | Gagal: {stats['failed']:,}")
+    print(f"💾 Disimpan ke: {args.output}")
+
+if __name__ == "__main__":
+    main()
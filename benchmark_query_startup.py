@@ -0,0 +1,78 @@
+"""
+BENCHMARK: Cold Start query_cli.py
+Mengukur waktu import (python -X importtime) dan wall time proses baru
+untuk query validasi skill, serta memastikan modul berat tidak ter-import
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+
+HEAVY_MODULES = ['pandas', 'numpy', 'scipy', 'pyarrow', 'fase1_persiapan_data', 'fase2_ekstraksi_informasi']
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def _env():
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [SCRIPT_DIR, env.get('PYTHONPATH')]))
+    return env
+
+def import_time_ms():
+    """
+    Cumulative import time query_cli (µs dari -X importtime → ms)
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import query_cli'],
+                            capture_output=True, text=True, env=_env(), check=True)
+    for line in reversed(result.stderr.splitlines()):
+        parts = [part.strip() for part in line.split('|')]
+        if len(parts) == 3 and parts[2] == 'query_cli':
+            return int(parts[1]) / 1000
+    return None
+
+def heavy_modules_loaded():
+    code = ('import sys, query_cli; '
+            f'print(",".join(m for m in {HEAVY_MODULES!r} if m in sys.modules))')
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                            env=_env(), check=True)
+    return [module for module in result.stdout.strip().split(',') if module]
+
+def end_to_end_ms(skills, runs):
+    """
+    Wall time proses baru: interpreter start + import + query validasi
+    """
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, os.path.join(SCRIPT_DIR, 'query_cli.py'), 'validate', skills],
+                       capture_output=True, env=_env(), check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark cold start query_cli.py')
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--skills', default='python, sql, excel')
+    parser.add_argument('--budget-ms', type=float, default=100)
+    args = parser.parse_args()
+
+    print("⏱️ BENCHMARK COLD START QUERY CLI")
+    print("="*50)
+
+    heavy = heavy_modules_loaded()
+    imports = statistics.median(import_time_ms() for _ in range(args.runs))
+    timings = end_to_end_ms(args.skills, args.runs)
+    end_to_end = statistics.median(timings)
+
+    print(f"📦 Import query_cli (median): {imports:.1f} ms")
+    print(f"🚀 Proses baru + validasi (median {args.runs} run): {end_to_end:.1f} ms "
+          f"(min {min(timings):.1f}, max {max(timings):.1f})")
+    print(f"🪶 Modul berat ter-import: {', '.join(heavy) if heavy else 'tidak ada'}")
+
+    ok = not heavy and end_to_end <= args.budget_ms
+    print(f"{'✅' if ok else '❌'} Budget {args.budget_ms:.0f} ms: {'OK' if ok else 'TERLAMPAUI'}")
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""
+BUILD: Compiled Skills Database (Versioned & Incremental)
+Menggabungkan semua sumber kamus skill, dedup, dan menandai konflik kategori
+"""
+
+import argparse
+from datetime import datetime
+from collections import OrderedDict
+
+from artifact_io import content_hash, load_json, atomic_write_json
+
+COMPILED_DB_FILE = 'compiled_skills_database.json'
+SCHEMA_VERSION = 1
+
+def normalize_skill(skill):
+    """
+    Normalisasi nama skill: lowercase dan whitespace tunggal
+    """
+    return ' '.join(str(skill).lower().split())
+
+def collect_skill_sources():
+    """
+    Kumpulkan sumber kamus skill sesuai urutan prioritas kategori
+    (sumber pertama menentukan kategori utama jika terjadi konflik)
+    """
+    from analyze_skills_from_data import create_comprehensive_skills_db
+    from update_comprehensive_skills import get_non_tech_categories
+
+    return [
+        ('analyze_skills_from_data', create_comprehensive_skills_db()),
+        ('update_comprehensive_skills', get_non_tech_categories()),
+    ]
+
+def merge_skill_sources(sources):
+    """
+    Merge beberapa sumber {category: [skills]} menjadi satu database
+
+    - Kategori dengan nama sama digabung (union), urutan dipertahankan
+    - Duplikat dalam satu kategori dihapus
+    - Skill yang muncul di beberapa kategori hanya disimpan di kategori
+      pertama (primary) dan dicatat sebagai konflik
+    """
+    categories = OrderedDict()
+    skill_index = {}
+    seen_in = OrderedDict()
+
+    for source_name, source_db in sources:
+        for category, skills in source_db.items():
+            bucket = categories.setdefault(category, [])
+            for raw_skill in skills:
+                skill = normalize_skill(raw_skill)
+                if not skill:
+                    continue
+
+                found_in = seen_in.setdefault(skill, [])
+                if category not in found_in:
+                    found_in.append(category)
+
+                if skill not in skill_index:
+                    skill_index[skill] = category
+                    bucket.append(skill)
+
+    conflicts = {
+        skill: {
+            'primary_category': skill_index[skill],
+            'categories': found_in
+        }
+        for skill, found_in in seen_in.items() if len(found_in) > 1
+    }
+
+    return dict(categories), skill_index, conflicts
+
+def build_compiled_skills_database(output_file=COMPILED_DB_FILE, sources=None, force=False):
+    """
+    Build compiled skills database secara incremental
+
+    Artifact hanya ditulis ulang jika hash sumber berubah; versi hanya
+    naik jika content_hash hasil merge berubah.
+    """
+    print("🔧 BUILD COMPILED SKILLS DATABASE")
+    print("="*50)
+
+    if sources is None:
+        sources = collect_skill_sources()
+
+    source_hashes = {name: content_hash(db) for name, db in sources}
+    previous = load_json(output_file)
+
+    if previous and not force and previous.get('schema_version') == SCHEMA_VERSION \
+            and previous.get('source_hashes') == source_hashes:
+        print(f"✅ Sumber tidak berubah, artifact up to date (v{previous['version']}, {previous['content_hash'][:12]})")
+        return previous
+
+    categories, skill_index, conflicts = merge_skill_sources(sources)
+    new_hash = content_hash({'schema_version': SCHEMA_VERSION, 'categories': categories})
+
+    if previous and previous.get('content_hash') == new_hash:
+        version = previous['version']
+        print(f"ℹ️ Sumber berubah tetapi isi kamus identik, versi tetap v{version}")
+    else:
+        version = (previous or {}).get('version', 0) + 1
+
+    total_raw = sum(len(skills) for _, db in sources for skills in db.values())
+    compiled = {
+        'schema_version': SCHEMA_VERSION,
+        'version': version,
+        'content_hash': new_hash,
+        'built_at': datetime.now().isoformat(),
+        'source_hashes': source_hashes,
+        'categories': categories,
+        'skill_index': skill_index,
+        'conflicts': conflicts,
+        'stats': {
+            'total_categories': len(categories),
+            'total_skills': len(skill_index),
+            'raw_entries': total_raw,
+            'duplicates_removed': total_raw - len(skill_index),
+            'cross_category_conflicts': len(conflicts)
+        }
+    }
+
+    atomic_write_json(output_file, compiled)
+
+    print(f"✅ Compiled skills database v{version} ({new_hash[:12]})")
+    print(f"📊 Categories: {len(categories)} | Skills unik: {len(skill_index)}")
+    print(f"🧹 Duplikat dihapus: {compiled['stats']['duplicates_removed']}")
+    print(f"⚠️ Konflik lintas kategori: {len(conflicts)}")
+    for skill, info in list(conflicts.items())[:10]:
+        print(f"   • {skill}: {', '.join(info['categories'])} → {info['primary_category']}")
+    print(f"💾 Disimpan ke: {output_file}")
+
+    return compiled
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Build compiled skills database')
+    parser.add_argument('--output', default=COMPILED_DB_FILE)
+    parser.add_argument('--force', action='store_true', help='Build ulang walaupun sumber tidak berubah')
+    args = parser.parse_args()
+
+    build_compiled_skills_database(output_file=args.output, force=args.force)
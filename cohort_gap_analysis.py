@@ -0,0 +1,282 @@
+"""
+COHORT GAP ANALYSIS: Gap Analysis untuk Satu Kelas / Tim Sekaligus
+Skill anggota cohort sebagai matrix user × skill, dibandingkan dengan
+profil role (persentase lowongan per skill) lewat perkalian matrix;
+hasil agregat ditulis ke CSV/JSON ringkas untuk dashboard
+"""
+
+import os
+import csv
+import argparse
+
+import numpy as np
+
+from artifact_io import atomic_write_json
+from fase3_analisis_kesenjangan import GapAnalysis
+from job_skill_matrix import JobSkillSnapshot, role_ids, group_counts, UNASSIGNED_ROLE
+from mmap_matrix import MappedJobSkillMatrix, MMAP_DIR
+from title_normalization import TitleRoleTable
+
+COHORT_OUTPUT_DIR = 'cohort_gap_output'
+MEMBER_COLUMNS = ['member', 'name', 'nama', 'id']
+SKILL_LIST_COLUMNS = ['skills', 'skill']
+HEATMAP_SKILLS = 20
+TOP_GAPS = 10
+CLOSEST_MEMBERS = 10
+
+# Batas persentase sama dengan GapAnalysis._categorize_requirement_level
+REQUIREMENT_LEVELS = [(70, 'CRITICAL'), (50, 'IMPORTANT'), (30, 'PREFERRED'), (10, 'NICE TO HAVE')]
+
+def requirement_level(percentage):
+    for minimum, level in REQUIREMENT_LEVELS:
+        if percentage >= minimum:
+            return level
+    return 'OPTIONAL'
+
+def read_cohort(file_path):
+    """
+    Baca file cohort (CSV ',' atau ';'), dua format:
+    - long: kolom member + kolom skills berisi daftar skill dipisah koma
+    - wide: kolom member + satu kolom per skill (1/0, ya/tidak)
+    Return: [(member, [skill, ...])]
+    """
+    with open(file_path, 'r', encoding='utf-8-sig', newline='') as f:
+        header_line = f.readline()
+        f.seek(0)
+        rows = list(csv.reader(f, delimiter=';' if ';' in header_line else ','))
+    if not rows:
+        return []
+
+    header = [col.strip().lower() for col in rows[0]]
+    member_col = next((header.index(col) for col in MEMBER_COLUMNS if col in header), 0)
+    skills_col = next((header.index(col) for col in SKILL_LIST_COLUMNS if col in header), None)
+
+    members = []
+    for row in rows[1:]:
+        if not row or not row[member_col].strip():
+            continue
+        if skills_col is not None:
+            skills = [skill.strip().lower() for skill in row[skills_col].split(',') if skill.strip()]
+        else:
+            skills = [header[i] for i, value in enumerate(row)
+                      if i != member_col and value.strip().lower() in ('1', 'true', 'yes', 'ya', 'x')]
+        members.append((row[member_col].strip(), skills))
+    return members
+
+def load_role_profiles(directory=MMAP_DIR, snapshot_dir='.'):
+    """
+    (skills, roles, role_job_counts, role_skill_counts) dari layout mmap;
+    fallback ke snapshot job-skill matrix
+    """
+    try:
+        mapped = MappedJobSkillMatrix(directory)
+        return mapped.skills, mapped.roles, np.asarray(mapped.role_job_counts), np.asarray(mapped.role_skill_counts)
+    except FileNotFoundError:
+        snapshot = JobSkillSnapshot.load(snapshot_dir)
+        title_table = TitleRoleTable.load()
+        roles = sorted(title_table.role_keywords) + [UNASSIGNED_ROLE]
+        job_roles = role_ids(snapshot.job_titles, title_table, roles)
+        role_job_counts, role_skill_counts = group_counts(snapshot.matrix.tocsr(), job_roles, len(roles))
+        return snapshot.skills, roles, role_job_counts, role_skill_counts
+
+class CohortGapAnalysis:
+    """
+    Gap analysis seluruh anggota cohort terhadap satu atau beberapa role
+    """
+
+    def __init__(self, skills, roles, role_job_counts, role_skill_counts):
+        self.skills = list(skills)
+        self.skill_index = {skill: i for i, skill in enumerate(self.skills)}
+        self.roles = list(roles)
+        self.role_index = {role: i for i, role in enumerate(self.roles)}
+        self.role_job_counts = role_job_counts
+        self.role_skill_counts = role_skill_counts
+        self._validator = None
+        self._resolved = {}
+
+    @classmethod
+    def load(cls, directory=MMAP_DIR, snapshot_dir='.'):
+        return cls(*load_role_profiles(directory, snapshot_dir))
+
+    def resolve_skill(self, skill):
+        """
+        Nama kanonik skill anggota dengan resolusi alias/fuzzy yang sama seperti
+        GapAnalysis (non-interaktif, mis. 'reactjs' → 'react'); None jika tidak
+        dikenali. Dihitung sekali per skill unik dalam cohort.
+        """
+        if skill in self.skill_index:
+            return skill
+        if skill not in self._resolved:
+            if self._validator is None:
+                self._validator = GapAnalysis(load_results=False)
+            valid_skills = self._validator.set_user_input(skill, '', interactive=False)['valid_skills']
+            self._resolved[skill] = valid_skills[0] if valid_skills else None
+        return self._resolved[skill]
+
+    def member_matrix(self, members):
+        """
+        Matrix biner anggota × skill; skill yang tidak dikenali kamus dikumpulkan
+        terpisah (skill dikenali tapi tidak pernah diminta lowongan tidak berpengaruh)
+        """
+        matrix = np.zeros((len(members), len(self.skills)), dtype=np.float32)
+        unrecognized = {}
+        for row, (member, skills) in enumerate(members):
+            for skill in skills:
+                canonical = self.resolve_skill(skill)
+                if canonical is None:
+                    unrecognized.setdefault(skill, []).append(member)
+                elif canonical in self.skill_index:
+                    matrix[row, self.skill_index[canonical]] = 1
+        return matrix, unrecognized
+
+    def analyze(self, members, roles, top_gaps=TOP_GAPS, heatmap_skills=HEATMAP_SKILLS,
+                closest=CLOSEST_MEMBERS):
+        """
+        Semua pasangan anggota × role dihitung dengan beberapa perkalian matrix:
+        match = U @ required.T, critical gap = (1 - U) @ critical.T,
+        readiness = U @ demand.T / demand.sum (coverage berbobot persentase)
+        """
+        names = [member for member, _ in members]
+        user_matrix, unrecognized = self.member_matrix(members)
+        role_rows = [self.role_index[role] for role in roles]
+
+        demand = (self.role_skill_counts[role_rows] /
+                  np.maximum(self.role_job_counts[role_rows], 1)[:, None] * 100).astype(np.float32)
+        required = (demand > 0).astype(np.float32)
+        critical = (demand >= REQUIREMENT_LEVELS[0][0]).astype(np.float32)
+        important = ((demand >= REQUIREMENT_LEVELS[1][0]) & (demand < REQUIREMENT_LEVELS[0][0])).astype(np.float32)
+        missing = 1 - user_matrix
+
+        match = user_matrix @ required.T / np.maximum(required.sum(axis=1), 1) * 100
+        readiness = user_matrix @ demand.T / np.maximum(demand.sum(axis=1), 1e-9) * 100
+        critical_gaps = missing @ critical.T
+        important_gaps = missing @ important.T
+
+        # Share anggota yang memiliki tiap skill
+        member_count = max(len(names), 1)
+        members_missing = missing.sum(axis=0)
+        cohort_coverage = user_matrix.sum(axis=0) / member_count * 100
+
+        member_rows = []
+        heatmap_rows = []
+        summary = {'members': len(names), 'roles': {}, 'unrecognized_skills': {
+            skill: len(owners) for skill, owners in sorted(unrecognized.items(), key=lambda x: -len(x[1]))
+        }}
+
+        for k, role in enumerate(roles):
+            for m, member in enumerate(names):
+                member_rows.append({
+                    'member': member,
+                    'role': role,
+                    'match_percentage': round(float(match[m, k]), 1),
+                    'readiness': round(float(readiness[m, k]), 1),
+                    'critical_gaps': int(critical_gaps[m, k]),
+                    'important_gaps': int(important_gaps[m, k])
+                })
+
+            top_demand = np.argsort(-demand[k], kind='stable')[:heatmap_skills]
+            for s in top_demand:
+                if not demand[k, s]:
+                    break
+                heatmap_rows.append({
+                    'role': role,
+                    'skill': self.skills[s],
+                    'requirement_level': requirement_level(demand[k, s]),
+                    'demand_percentage': round(float(demand[k, s]), 1),
+                    'cohort_coverage': round(float(cohort_coverage[s]), 1),
+                    'members_missing': int(members_missing[s])
+                })
+
+            common = np.flatnonzero(critical[k] * members_missing)
+            common = common[np.argsort(-members_missing[common], kind='stable')][:top_gaps]
+            ranking = np.lexsort((-readiness[:, k], critical_gaps[:, k]))[:closest]
+
+            summary['roles'][role] = {
+                'jobs': int(self.role_job_counts[role_rows[k]]),
+                'mean_match_percentage': round(float(match[:, k].mean()), 1) if names else 0.0,
+                'mean_readiness': round(float(readiness[:, k].mean()), 1) if names else 0.0,
+                'members_without_critical_gaps': int(np.count_nonzero(critical_gaps[:, k] == 0)),
+                'common_critical_gaps': [
+                    {'skill': self.skills[s], 'members_missing': int(members_missing[s]),
+                     'demand_percentage': round(float(demand[k, s]), 1)}
+                    for s in common
+                ],
+                'closest_members': [
+                    {'member': names[m], 'readiness': round(float(readiness[m, k]), 1),
+                     'critical_gaps': int(critical_gaps[m, k])}
+                    for m in ranking
+                ]
+            }
+
+        return {'members': member_rows, 'heatmap': heatmap_rows, 'summary': summary}
+
+def _write_csv(file_path, rows):
+    if not rows:
+        return
+    with open(file_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]), delimiter=';')
+        writer.writeheader()
+        writer.writerows(rows)
+
+def save_cohort_results(result, output_dir=COHORT_OUTPUT_DIR):
+    """
+    member_readiness.csv, skill_heatmap.csv (format long) + cohort_summary.json
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    _write_csv(os.path.join(output_dir, 'member_readiness.csv'), result['members'])
+    _write_csv(os.path.join(output_dir, 'skill_heatmap.csv'), result['heatmap'])
+    atomic_write_json(os.path.join(output_dir, 'cohort_summary.json'), result['summary'])
+    return output_dir
+
+def main():
+    parser = argparse.ArgumentParser(description='Gap analysis untuk satu cohort (kelas/tim)')
+    parser.add_argument('cohort_file', help='CSV anggota cohort (member + skills, atau satu kolom per skill)')
+    parser.add_argument('targets', nargs='+', help='Posisi target (dipetakan ke role cluster)')
+    parser.add_argument('--dir', default=MMAP_DIR)
+    parser.add_argument('--output', default=COHORT_OUTPUT_DIR)
+    args = parser.parse_args()
+
+    print("👥 COHORT GAP ANALYSIS")
+    print("="*50)
+
+    if not os.path.exists(args.cohort_file):
+        print(f"❌ File cohort '{args.cohort_file}' tidak ditemukan")
+        return
+    members = read_cohort(args.cohort_file)
+    if not members:
+        print(f"❌ Tidak ada anggota cohort di '{args.cohort_file}'")
+        return
+
+    analysis = CohortGapAnalysis.load(args.dir)
+    title_table = TitleRoleTable.load()
+    roles = []
+    for target in args.targets:
+        role = title_table.resolve_target(target.lower())
+        if role not in analysis.role_index:
+            print(f"⚠️ '{target}' tidak terpetakan ke role cluster, dilewati")
+        elif role not in roles:
+            roles.append(role)
+    if not roles:
+        print("❌ Tidak ada posisi target yang valid")
+        return
+
+    result = analysis.analyze(members, roles)
+    save_cohort_results(result, args.output)
+
+    summary = result['summary']
+    print(f"📊 {summary['members']} anggota × {len(roles)} role")
+    for role, info in summary['roles'].items():
+        print(f"\n🎯 {role} ({info['jobs']:,} lowongan)")
+        print(f"   Rata-rata match: {info['mean_match_percentage']:.1f}% | readiness: {info['mean_readiness']:.1f}%")
+        print(f"   Tanpa critical gap: {info['members_without_critical_gaps']}/{summary['members']} anggota")
+        if info['common_critical_gaps']:
+            print("   🚨 Critical gap terbanyak: " + ", ".join(
+                f"{gap['skill']} ({gap['members_missing']})" for gap in info['common_critical_gaps'][:5]))
+        print("   🏁 Paling siap: " + ", ".join(
+            f"{member['member']} ({member['readiness']:.0f}%)" for member in info['closest_members'][:5]))
+    if summary['unrecognized_skills']:
+        print(f"\n⚠️ {len(summary['unrecognized_skills'])} skill tidak dikenali (lihat cohort_summary.json)")
+    print(f"\n💾 Hasil disimpan ke: {args.output}/")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+COMPACT EVIDENCE: Representasi Kolumnar Bukti Match Skill
+Menyimpan skill id, jumlah match, dan offset start/end (CSR-style arrays)
+alih-alih string match yang diduplikasi di setiap lowongan
+"""
+
+from array import array
+
+import numpy as np
+
+EVIDENCE_FILE = 'extracted_skills_evidence.npz'
+
+class EvidenceBuilder:
+    """
+    Akumulasi evidence per lowongan ke buffer kolumnar (array module),
+    tanpa menyimpan string match
+    """
+
+    def __init__(self, skills=None):
+        self.skills = list(skills or [])
+        self.skill_index = {skill: i for i, skill in enumerate(self.skills)}
+        self.job_ids = []
+
+        # job_ptr[i]:job_ptr[i+1] → entry skill milik job i
+        self.job_ptr = array('q', [0])
+        self.skill_ids = array('i')
+        self.counts = array('i')
+
+        # span_ptr[k]:span_ptr[k+1] → offset milik entry skill k
+        self.span_ptr = array('q', [0])
+        self.span_starts = array('i')
+        self.span_ends = array('i')
+
+    def skill_id(self, skill):
+        if skill not in self.skill_index:
+            self.skill_index[skill] = len(self.skills)
+            self.skills.append(skill)
+        return self.skill_index[skill]
+
+    def add_job(self, job_id, skill_spans):
+        """
+        skill_spans: {skill_name: [(start, end), ...]} untuk satu lowongan
+        """
+        self.job_ids.append(job_id)
+        for skill, spans in skill_spans.items():
+            self.skill_ids.append(self.skill_id(skill))
+            self.counts.append(len(spans))
+            for start, end in spans:
+                self.span_starts.append(start)
+                self.span_ends.append(end)
+            self.span_ptr.append(len(self.span_starts))
+        self.job_ptr.append(len(self.skill_ids))
+
+    def build(self):
+        return CompactEvidence(
+            skills=self.skills,
+            job_ids=self.job_ids,
+            job_ptr=np.frombuffer(self.job_ptr, dtype=np.int64).copy(),
+            skill_ids=np.frombuffer(self.skill_ids, dtype=np.int32).copy(),
+            counts=np.frombuffer(self.counts, dtype=np.int32).copy(),
+            span_ptr=np.frombuffer(self.span_ptr, dtype=np.int64).copy(),
+            span_starts=np.frombuffer(self.span_starts, dtype=np.int32).copy(),
+            span_ends=np.frombuffer(self.span_ends, dtype=np.int32).copy()
+        )
+
+class CompactEvidence:
+    """
+    Evidence kolumnar read-only; snippet teks hanya dibuat saat diminta
+    """
+
+    ARRAY_FIELDS = ['job_ptr', 'skill_ids', 'counts', 'span_ptr', 'span_starts', 'span_ends']
+
+    def __init__(self, skills, job_ids, job_ptr, skill_ids, counts, span_ptr, span_starts, span_ends):
+        self.skills = list(skills)
+        self.job_ids = list(job_ids)
+        self.job_ptr = job_ptr
+        self.skill_ids = skill_ids
+        self.counts = counts
+        self.span_ptr = span_ptr
+        self.span_starts = span_starts
+        self.span_ends = span_ends
+
+        self._job_index = None
+        self._skill_index = None
+
+    @property
+    def nbytes(self):
+        return sum(getattr(self, field).nbytes for field in self.ARRAY_FIELDS)
+
+    def save(self, file_path=EVIDENCE_FILE):
+        np.savez_compressed(
+            file_path,
+            skills=np.array(self.skills, dtype=str),
+            job_ids=np.array(self.job_ids, dtype=str),
+            **{field: getattr(self, field) for field in self.ARRAY_FIELDS}
+        )
+
+    @classmethod
+    def load(cls, file_path=EVIDENCE_FILE):
+        with np.load(file_path) as data:
+            return cls(
+                skills=data['skills'].tolist(),
+                job_ids=data['job_ids'].tolist(),
+                **{field: data[field] for field in cls.ARRAY_FIELDS}
+            )
+
+    def _entry_range(self, job_id):
+        if self._job_index is None:
+            self._job_index = {job: i for i, job in enumerate(self.job_ids)}
+        i = self._job_index[job_id]
+        return self.job_ptr[i], self.job_ptr[i + 1]
+
+    def skills_for_job(self, job_id):
+        """
+        [(skill, match_count), ...] untuk satu lowongan
+        """
+        start, end = self._entry_range(job_id)
+        return [(self.skills[sid], int(count))
+                for sid, count in zip(self.skill_ids[start:end], self.counts[start:end])]
+
+    def spans(self, job_id, skill):
+        """
+        Offset (start, end) match sebuah skill pada cleaned_text lowongan
+        """
+        if self._skill_index is None:
+            self._skill_index = {name: i for i, name in enumerate(self.skills)}
+        sid = self._skill_index.get(skill)
+        start, end = self._entry_range(job_id)
+
+        for entry in range(start, end):
+            if self.skill_ids[entry] == sid:
+                lo, hi = self.span_ptr[entry], self.span_ptr[entry + 1]
+                return list(zip(self.span_starts[lo:hi].tolist(), self.span_ends[lo:hi].tolist()))
+        return []
+
+    def explain(self, job_id, skill, text, context=40):
+        """
+        Materialisasi snippet "kenapa skill ini terdeteksi" dari teks asli
+        """
+        snippets = []
+        for start, end in self.spans(job_id, skill):
+            left = text[max(0, start - context):start]
+            right = text[end:end + context]
+            snippets.append({
+                'match': text[start:end],
+                'start': start,
+                'end': end,
+                'snippet': f"...{left}[{text[start:end]}]{right}..."
+            })
+        return snippets
@@ -0,0 +1,178 @@
+"""
+COMPANY PROFILES: Agregat Company × Skill
+Sparse group-by atas job-skill matrix + index company → row range,
+sehingga query per perusahaan tidak perlu membaca lowongan mentah
+"""
+
+import os
+import argparse
+
+import numpy as np
+from scipy import sparse
+
+from artifact_io import load_json, atomic_write_json
+from job_skill_matrix import JobSkillSnapshot
+
+COMPANY_PROFILES_FILE = 'company_skill_profiles.npz'
+COMPANY_INDEX_FILE = 'company_index.json'
+
+class CompanySkillProfiles:
+    """
+    profiles[c, s] = jumlah lowongan perusahaan c yang meminta skill s
+    job_order[row_ranges[c][0]:row_ranges[c][1]] = baris job milik perusahaan c
+    """
+
+    def __init__(self, companies, skills, profiles, job_counts, job_order, row_ranges):
+        self.companies = list(companies)
+        self.skills = list(skills)
+        self.profiles = profiles
+        self.job_counts = job_counts
+        self.job_order = job_order
+        self.row_ranges = row_ranges
+
+        self.company_index = {company: i for i, company in enumerate(self.companies)}
+        self.skill_index = {skill: i for i, skill in enumerate(self.skills)}
+        self._share_matrix = None
+        self._share_norms = None
+
+    @classmethod
+    def build(cls, snapshot):
+        """
+        Sparse group-by: indicator matrix (companies × jobs) @ job-skill matrix
+        """
+        companies, company_ids = np.unique(np.asarray(snapshot.companies, dtype=str), return_inverse=True)
+        n_jobs = len(company_ids)
+
+        indicator = sparse.csr_matrix(
+            (np.ones(n_jobs, dtype=np.int32), (company_ids, np.arange(n_jobs))),
+            shape=(len(companies), n_jobs)
+        )
+        profiles = (indicator @ snapshot.matrix.astype(np.int32)).tocsr()
+
+        job_counts = np.bincount(company_ids, minlength=len(companies))
+        job_order = np.argsort(company_ids, kind='stable')
+        ends = np.cumsum(job_counts)
+        row_ranges = np.column_stack([ends - job_counts, ends])
+
+        return cls(companies.tolist(), snapshot.skills, profiles, job_counts, job_order, row_ranges)
+
+    def save(self, directory='.'):
+        tmp_path = os.path.join(directory, '.tmp_' + COMPANY_PROFILES_FILE)
+        np.savez_compressed(
+            tmp_path,
+            data=self.profiles.data, indices=self.profiles.indices, indptr=self.profiles.indptr,
+            shape=np.asarray(self.profiles.shape), job_counts=self.job_counts,
+            job_order=self.job_order, row_ranges=self.row_ranges
+        )
+        os.replace(tmp_path, os.path.join(directory, COMPANY_PROFILES_FILE))
+        atomic_write_json(os.path.join(directory, COMPANY_INDEX_FILE), {
+            'companies': self.companies,
+            'skills': self.skills
+        }, indent=None)
+
+    @classmethod
+    def load(cls, directory='.'):
+        index = load_json(os.path.join(directory, COMPANY_INDEX_FILE))
+        if index is None:
+            raise FileNotFoundError(f"{COMPANY_INDEX_FILE} tidak ditemukan. Jalankan 'company_profiles.py build'.")
+
+        with np.load(os.path.join(directory, COMPANY_PROFILES_FILE)) as data:
+            profiles = sparse.csr_matrix((data['data'], data['indices'], data['indptr']),
+                                         shape=tuple(data['shape']))
+            return cls(index['companies'], index['skills'], profiles,
+                       data['job_counts'], data['job_order'], data['row_ranges'])
+
+    def job_rows(self, company):
+        """
+        Index baris job (pada snapshot matrix) milik sebuah perusahaan
+        """
+        start, end = self.row_ranges[self.company_index[company]]
+        return self.job_order[start:end]
+
+    def top_skills(self, company, top_n=10):
+        """
+        Skill paling sering diminta sebuah perusahaan: [(skill, jobs_count, percentage)]
+        """
+        if company not in self.company_index:
+            return []
+        c = self.company_index[company]
+        row = self.profiles.getrow(c)
+        total = int(self.job_counts[c])
+
+        order = np.argsort(-row.data, kind='stable')[:top_n]
+        return [(self.skills[row.indices[i]], int(row.data[i]), row.data[i] / total * 100)
+                for i in order]
+
+    def similar_companies(self, user_skills, top_n=10, min_jobs=1):
+        """
+        Perusahaan yang profil skill-nya paling mirip dengan skill user (cosine)
+        """
+        user_vector = np.zeros(len(self.skills), dtype=np.float64)
+        for skill in user_skills:
+            if skill in self.skill_index:
+                user_vector[self.skill_index[skill]] = 1
+        if not user_vector.any():
+            return []
+
+        if self._share_matrix is None:
+            # Share per perusahaan: jumlah job per skill / total job perusahaan
+            inv_counts = sparse.diags(1.0 / np.maximum(self.job_counts, 1))
+            self._share_matrix = (inv_counts @ self.profiles.astype(np.float64)).tocsr()
+            self._share_norms = np.sqrt(np.asarray(
+                self._share_matrix.multiply(self._share_matrix).sum(axis=1)).ravel())
+
+        scores = self._share_matrix @ user_vector / (
+            np.maximum(self._share_norms, 1e-12) * np.linalg.norm(user_vector))
+        scores[self.job_counts < min_jobs] = -1
+
+        top = np.argsort(-scores, kind='stable')[:top_n]
+        return [(self.companies[c], float(scores[c]), int(self.job_counts[c]))
+                for c in top if scores[c] > 0]
+
+def main():
+    parser = argparse.ArgumentParser(description='Company × skill profiles')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('build', help='Bangun agregat dari job-skill matrix')
+
+    top = subparsers.add_parser('top', help='Top skills sebuah perusahaan')
+    top.add_argument('company')
+    top.add_argument('--n', type=int, default=10)
+
+    similar = subparsers.add_parser('similar', help='Perusahaan paling cocok dengan skill user')
+    similar.add_argument('skills', help='Daftar skill, pisahkan dengan koma')
+    similar.add_argument('--n', type=int, default=10)
+    similar.add_argument('--min-jobs', type=int, default=3)
+
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        print("🏢 BUILD COMPANY × SKILL PROFILES")
+        print("="*50)
+        snapshot = JobSkillSnapshot.load()
+        profiles = CompanySkillProfiles.build(snapshot)
+        profiles.save()
+        print(f"✅ {len(profiles.companies):,} perusahaan × {len(profiles.skills):,} skills "
+              f"({profiles.profiles.nnz:,} non-zero)")
+        print(f"💾 Disimpan ke: {COMPANY_PROFILES_FILE}, {COMPANY_INDEX_FILE}")
+        return
+
+    profiles = CompanySkillProfiles.load()
+
+    if args.command == 'top':
+        results = profiles.top_skills(args.company, top_n=args.n)
+        if not results:
+            print(f"❌ Perusahaan '{args.company}' tidak ditemukan")
+            return
+        print(f"\n🏢 TOP SKILLS: {args.company} ({len(profiles.job_rows(args.company))} lowongan)")
+        for skill, count, percentage in results:
+            print(f"   • {skill}: {count} lowongan ({percentage:.1f}%)")
+
+    elif args.command == 'similar':
+        user_skills = [skill.strip().lower() for skill in args.skills.split(',') if skill.strip()]
+        print(f"\n🤝 PERUSAHAAN PALING COCOK UNTUK: {', '.join(user_skills)}")
+        for company, score, job_count in profiles.similar_companies(user_skills, args.n, args.min_jobs):
+            print(f"   • {company}: similarity {score:.3f} ({job_count} lowongan)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+DEDUP MEMO: Cache Hasil per Teks Unik
+Banyak lowongan memakai deskripsi yang byte-identik (iklan yang sama untuk
+beberapa kota/posisi); hasil cleaning/ekstraksi dihitung sekali per teks
+lalu dipakai ulang. Cache dibatasi (LRU) agar aman untuk mode chunked/streaming.
+"""
+
+import hashlib
+from collections import OrderedDict
+
+DEFAULT_MEMO_SIZE = 50000
+
+def text_key(text):
+    """
+    Digest 16 byte dari isi teks; cache tidak menahan string asli
+    """
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+class TextMemo:
+    """
+    Memo LRU {hash teks: hasil}; maxsize=0 menonaktifkan cache
+    """
+
+    def __init__(self, maxsize=DEFAULT_MEMO_SIZE):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, text, compute):
+        """
+        Hasil compute(text), dihitung hanya jika teks belum ada di cache
+        """
+        if not self.maxsize:
+            self.misses += 1
+            return compute(text)
+
+        key = text_key(text)
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+        self.misses += 1
+        value = compute(text)
+        self.entries[key] = value
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    @property
+    def dedup_ratio(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        return {
+            'texts': self.hits + self.misses,
+            'computed': self.misses,
+            'reused': self.hits,
+            'dedup_ratio': self.dedup_ratio,
+            'evictions': self.evictions
+        }
+
+    def report(self, label, unit='baris'):
+        stats = self.stats()
+        print(f"♻️ Dedup {label}: {stats['computed']:,} teks diproses untuk {stats['texts']:,} {unit} "
+              f"({stats['dedup_ratio']:.1%} dipakai ulang"
+              + (f", {stats['evictions']:,} eviction" if stats['evictions'] else "") + ")")
+        return stats
@@ -0,0 +1,260 @@
+"""
+EXTRACTION STORE: Hasil Ekstraksi dalam SQLite
+Tabel jobs, skills, job_skills, dan title_tokens dengan index pada skill,
+token judul, company, dan role cluster, sehingga consumer bisa query
+langsung tanpa load seluruh JSON
+"""
+
+import os
+import re
+import sqlite3
+import argparse
+from collections import Counter
+
+from artifact_io import load_json
+from title_normalization import TitleRoleTable, normalize_title
+
+STORE_FILE = 'extraction_store.sqlite'
+
+SCHEMA = """
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE jobs (
+    id INTEGER PRIMARY KEY,
+    job_id TEXT NOT NULL UNIQUE,
+    job_title TEXT,
+    normalized_title TEXT,
+    role_cluster TEXT,
+    company TEXT,
+    total_skills INTEGER,
+    scraped_at TEXT
+);
+CREATE TABLE skills (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    category TEXT,
+    frequency INTEGER
+);
+CREATE TABLE job_skills (
+    job INTEGER NOT NULL,
+    skill INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (job, skill)
+) WITHOUT ROWID;
+CREATE TABLE title_tokens (
+    token TEXT NOT NULL,
+    job INTEGER NOT NULL,
+    PRIMARY KEY (token, job)
+) WITHOUT ROWID;
+"""
+
+# Index dibuat setelah bulk insert (lebih cepat daripada maintain per row)
+INDEXES = """
+CREATE INDEX idx_job_skills_skill ON job_skills (skill, job);
+CREATE INDEX idx_jobs_company ON jobs (company);
+CREATE INDEX idx_jobs_role ON jobs (role_cluster);
+"""
+
+def title_tokens(title):
+    """
+    Token judul: kata mentah (lowercase) + token hasil normalize_title
+    """
+    return set(re.findall(r'\w+', str(title).lower())) | set(normalize_title(title).split())
+
+def write_extraction_store(extracted_jobs, skill_frequency, skill_categories=None, file_path=STORE_FILE):
+    """
+    Bangun store baru di file sementara (bulk insert dalam satu transaksi),
+    lalu os.replace agar pembaca tidak melihat store setengah jadi
+    """
+    skill_categories = skill_categories or {}
+    try:
+        title_table = TitleRoleTable.load()
+    except FileNotFoundError:
+        title_table = None
+
+    tmp_path = file_path + '.tmp'
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.execute('PRAGMA journal_mode = OFF')
+        conn.execute('PRAGMA synchronous = OFF')
+        conn.executescript(SCHEMA)
+
+        with conn:
+            skill_names = sorted(skill_frequency)
+            skill_ids = {name: i for i, name in enumerate(skill_names, 1)}
+            conn.executemany(
+                'INSERT INTO skills (id, name, category, frequency) VALUES (?, ?, ?, ?)',
+                ((skill_ids[name], name, skill_categories.get(name), skill_frequency[name])
+                 for name in skill_names)
+            )
+
+            job_rows, job_skill_rows, token_rows = [], [], []
+            for row_id, job in enumerate(extracted_jobs, 1):
+                job_title = str(job['job_title'])
+                job_rows.append((
+                    row_id, job['job_id'], job_title, normalize_title(job_title),
+                    title_table.role_for_title(job_title) if title_table else None,
+                    str(job['company']), job['total_skills_found'], job.get('scraped_at')
+                ))
+                job_skill_rows.extend((row_id, skill_ids[skill], position)
+                                      for position, skill in enumerate(job['required_skills']))
+                token_rows.extend((token, row_id) for token in title_tokens(job_title))
+
+            conn.executemany('INSERT INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?)', job_rows)
+            conn.executemany('INSERT INTO job_skills VALUES (?, ?, ?)', job_skill_rows)
+            conn.executemany('INSERT INTO title_tokens VALUES (?, ?)', token_rows)
+            conn.executescript(INDEXES)
+            conn.execute("INSERT INTO meta VALUES ('jobs', ?)", (str(len(job_rows)),))
+        conn.execute('ANALYZE')
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, file_path)
+    return file_path
+
+class ExtractionStore:
+    """
+    Query read-only atas extraction_store.sqlite
+    """
+
+    def __init__(self, file_path=STORE_FILE):
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"{file_path} tidak ditemukan. Jalankan Fase 2 terlebih dahulu.")
+        self.conn = sqlite3.connect(f"file:{file_path}?mode=ro", uri=True)
+
+    def close(self):
+        self.conn.close()
+
+    def _jobs(self, where, params):
+        """
+        Record job (format extracted_skills_database) untuk job yang memenuhi where
+        """
+        rows = self.conn.execute(f"""
+            SELECT j.id, j.job_id, j.job_title, j.company, j.total_skills, j.scraped_at
+            FROM jobs j WHERE {where} ORDER BY j.id
+        """, params).fetchall()
+        if not rows:
+            return []
+
+        skills = {}
+        for start in range(0, len(rows), 500):
+            chunk = [row[0] for row in rows[start:start + 500]]
+            placeholders = ','.join('?' * len(chunk))
+            for job, name in self.conn.execute(f"""
+                SELECT js.job, s.name FROM job_skills js JOIN skills s ON s.id = js.skill
+                WHERE js.job IN ({placeholders}) ORDER BY js.job, js.position
+            """, chunk):
+                skills.setdefault(job, []).append(name)
+
+        jobs = []
+        for row_id, job_id, job_title, company, total_skills, scraped_at in rows:
+            job = {
+                'job_id': job_id,
+                'job_title': job_title,
+                'company': company,
+                'required_skills': skills.get(row_id, []),
+                'total_skills_found': total_skills
+            }
+            if scraped_at is not None:
+                job['scraped_at'] = scraped_at
+            jobs.append(job)
+        return jobs
+
+    def jobs_for_role(self, role):
+        return self._jobs('j.role_cluster = ?', (role,))
+
+    def jobs_for_company(self, company):
+        return self._jobs('j.company = ?', (company,))
+
+    def jobs_matching_title(self, target, match='any'):
+        """
+        Job yang judulnya memuat token target ('any': minimal satu token, 'all': semua)
+        """
+        tokens = sorted(title_tokens(target))
+        if not tokens:
+            return []
+        placeholders = ','.join('?' * len(tokens))
+        having = f"HAVING COUNT(*) = {len(tokens)}" if match == 'all' else ''
+        return self._jobs(f"""j.id IN (
+            SELECT job FROM title_tokens WHERE token IN ({placeholders})
+            GROUP BY job {having})""", tokens)
+
+    def skill_prevalence(self, skill, role=None):
+        """
+        (jobs_with_skill, total_jobs) untuk seluruh data atau dalam satu role cluster
+        """
+        if role is None:
+            total = self.conn.execute('SELECT COUNT(*) FROM jobs').fetchone()[0]
+            count = self.conn.execute("""
+                SELECT COUNT(*) FROM job_skills js JOIN skills s ON s.id = js.skill
+                WHERE s.name = ?""", (skill,)).fetchone()[0]
+        else:
+            total = self.conn.execute('SELECT COUNT(*) FROM jobs WHERE role_cluster = ?',
+                                      (role,)).fetchone()[0]
+            count = self.conn.execute("""
+                SELECT COUNT(*) FROM job_skills js
+                JOIN skills s ON s.id = js.skill
+                JOIN jobs j ON j.id = js.job
+                WHERE s.name = ? AND j.role_cluster = ?""", (skill, role)).fetchone()[0]
+        return count, total
+
+    def role_skill_counts(self, role):
+        """
+        [(skill, jobs_count)] dalam satu role cluster, terurut menurun
+        """
+        return self.conn.execute("""
+            SELECT s.name, COUNT(*) AS n FROM jobs j
+            JOIN job_skills js ON js.job = j.id
+            JOIN skills s ON s.id = js.skill
+            WHERE j.role_cluster = ?
+            GROUP BY s.name ORDER BY n DESC, s.name""", (role,)).fetchall()
+
+    def skill_frequency(self):
+        return dict(self.conn.execute('SELECT name, frequency FROM skills'))
+
+def main():
+    parser = argparse.ArgumentParser(description='Query extraction store (SQLite)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build = subparsers.add_parser('build', help='Bangun store dari extracted_skills_database.json')
+    build.add_argument('--input', default='extracted_skills_database.json')
+
+    title = subparsers.add_parser('title', help='Lowongan yang cocok dengan judul')
+    title.add_argument('target')
+    title.add_argument('--all', action='store_true', help='Semua token harus cocok')
+
+    prevalence = subparsers.add_parser('prevalence', help='Prevalensi skill (opsional per role)')
+    prevalence.add_argument('skill')
+    prevalence.add_argument('--role')
+
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        extracted_jobs = load_json(args.input)
+        if extracted_jobs is None:
+            print(f"❌ File {args.input} tidak ditemukan. Jalankan Fase 2 terlebih dahulu.")
+            return
+        frequency = Counter(skill for job in extracted_jobs for skill in job['required_skills'])
+        write_extraction_store(extracted_jobs, frequency)
+        print(f"✅ {len(extracted_jobs):,} lowongan disimpan ke: {STORE_FILE}")
+        return
+
+    store = ExtractionStore()
+    if args.command == 'title':
+        jobs = store.jobs_matching_title(args.target, match='all' if args.all else 'any')
+        print(f"🔍 {len(jobs):,} lowongan cocok dengan '{args.target}'")
+        for job in jobs[:10]:
+            print(f"   • {job['job_title']} @ {job['company']}")
+    else:
+        count, total = store.skill_prevalence(args.skill.lower(), role=args.role)
+        scope = args.role or 'semua lowongan'
+        percentage = count / total * 100 if total else 0
+        print(f"📊 {args.skill}: {count:,}/{total:,} lowongan ({percentage:.1f}%) — {scope}")
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,8 @@ FASE 1: PERSIAPAN DATA (DATA FOUNDATION)
 Sistem Career Learning Roadmap - Analisis Gap Skills
 """
 
+import os
+import sys
 import pandas as pd
 import numpy as np
 import re
@@ -10,18 +12,94 @@ import json
 import string
 from collections import Counter, defaultdict
 import warnings
+import argparse
+from artifact_io import content_hash, load_json
+from build_skills_database import COMPILED_DB_FILE
+from job_data_loader import load_job_data, PREPARATION_COLUMNS
+from dedup_memo import TextMemo, DEFAULT_MEMO_SIZE
+from arrow_handoff import write_handoff, read_handoff, HANDOFF_FILE, ARROW_AVAILABLE
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+try:
+    import pyarrow  # noqa: F401
+    LEAN_STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    LEAN_STRING_DTYPE = 'string'
 
 warnings.filterwarnings('ignore')
 
+# Kolom dengan nilai berulang (dijadikan categorical pada memory-lean mode)
+CATEGORICAL_COLUMNS = ['posisi', 'company']
+
+# Kolom teks mentah yang dibuang setelah cleaned_text dibuat (memory-lean mode)
+CONSUMED_TEXT_COLUMNS = ['description', 'skills_clean', 'requirements', 'full_text']
+
+# skills_clean berisi daftar skill ter-delimit; token bersih disimpan dipisah koma
+TAG_COLUMN = 'skills_clean'
+TAG_DELIMITERS = re.compile(r'[,;|]')
+TAG_SEPARATOR = ','
+
+def clean_text(text):
+    """
+    Pembersihan teks lowongan untuk ekstraksi skill
+    """
+    if pd.isna(text):
+        return ""
+    
+    # Konversi ke lowercase
+    text = text.lower()
+    
+    # Hapus karakter khusus tapi pertahankan yang penting untuk skill
+    # Pertahankan +, #, ., - untuk skill seperti C++, C#, Node.js, etc.
+    text = re.sub(r'[^\w\s\+\#\.\-]', ' ', text)
+    
+    # Hapus multiple spaces
+    text = re.sub(r'\s+', ' ', text)
+    
+    # Trim
+    text = text.strip()
+    
+    return text
+
+def split_skill_tags(value):
+    """
+    Token skills_clean yang sudah dibersihkan (clean_text per token), dipisah
+    TAG_SEPARATOR. ' '.join(token) sama dengan clean_text(value), sehingga
+    token selalu berada di ujung cleaned_text.
+    """
+    if pd.isna(value):
+        return ""
+    tokens = (clean_text(token) for token in TAG_DELIMITERS.split(value))
+    return TAG_SEPARATOR.join(token for token in tokens if token)
+
+def _peak_rss_mb():
+    """
+    Peak resident memory proses (MB), None jika tidak tersedia
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS melaporkan bytes, Linux/BSD melaporkan KB
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
 class DataPreparation:
     """
     Fase 1: Persiapan Data (Data Foundation)
     """
     
-    def __init__(self):
+    def __init__(self, memory_lean=False, memo_size=DEFAULT_MEMO_SIZE):
+        self.memory_lean = memory_lean
+        self.clean_memo = TextMemo(memo_size)
+        self.memory_report = {}
         self.raw_data = None
         self.cleaned_data = None
         self.skills_dictionary = None
+        self.dictionary_hash = None
+        self.skills_source_version = None
         
     def step_1_1_data_collection(self, file_path='glints_scraped_clean.csv'):
         """
@@ -32,8 +110,8 @@ class DataPreparation:
         print("="*60)
         
         try:
-            # Load data dengan berbagai metode
-            self.raw_data = pd.read_csv(file_path, sep=';')
+            # Load data: schema eksplisit, hanya kolom yang dipakai pipeline (cache binary)
+            self.raw_data = load_job_data(file_path, PREPARATION_COLUMNS)
             print(f"✅ Data berhasil dimuat: {len(self.raw_data):,} lowongan")
             print(f"📊 Kolom yang tersedia: {list(self.raw_data.columns)}")
             
@@ -49,6 +127,11 @@ class DataPreparation:
             # Cek kolom skills_clean sebagai alternatif requirements
             if 'skills_clean' in self.raw_data.columns:
                 print(f"✅ Ditemukan kolom 'skills_clean' sebagai alternatif requirements")
+            
+            if self.memory_lean:
+                self._report_memory('load_default_dtypes', self.raw_data)
+                self._apply_lean_dtypes(self.raw_data)
+                self._report_memory('load_lean_dtypes', self.raw_data)
                 
             return True
             
@@ -107,6 +190,9 @@ class DataPreparation:
             print("❌ Data belum dimuat. Jalankan step_1_1 terlebih dahulu.")
             return False
         
+        if self.memory_lean:
+            return self._text_preprocessing_lean()
+        
         # Copy data untuk pembersihan
         self.cleaned_data = self.raw_data.copy()
         
@@ -124,28 +210,13 @@ class DataPreparation:
         
         print("🔄 Memproses pembersihan teks...")
         
-        # Fungsi pembersihan teks
-        def clean_text(text):
-            if pd.isna(text):
-                return ""
-            
-            # Konversi ke lowercase
-            text = text.lower()
-            
-            # Hapus karakter khusus tapi pertahankan yang penting untuk skill
-            # Pertahankan +, #, ., - untuk skill seperti C++, C#, Node.js, etc.
-            text = re.sub(r'[^\w\s\+\#\.\-]', ' ', text)
-            
-            # Hapus multiple spaces
-            text = re.sub(r'\s+', ' ', text)
-            
-            # Trim
-            text = text.strip()
-            
-            return text
+        # Apply pembersihan (sekali per teks unik)
+        self.cleaned_data['cleaned_text'] = self.cleaned_data['full_text'].apply(self._clean_text_memo)
+        self.clean_memo.report('cleaning')
         
-        # Apply pembersihan
-        self.cleaned_data['cleaned_text'] = self.cleaned_data['full_text'].apply(clean_text)
+        # Tag skill untuk fast path ekstraksi (lookup alias, tanpa regex)
+        if requirements_col == TAG_COLUMN:
+            self.cleaned_data['skill_tags'] = self.cleaned_data[TAG_COLUMN].apply(split_skill_tags)
         
         print(f"✅ Pembersihan teks selesai untuk {len(self.cleaned_data)} lowongan")
         
@@ -157,6 +228,104 @@ class DataPreparation:
         
         return True
     
+    def _text_preprocessing_lean(self):
+        """
+        Memory-lean text preprocessing: tanpa full copy, full_text hanya
+        sementara, dan kolom teks mentah dibuang setelah dipakai
+        """
+        print("🪶 Memory-lean mode aktif")
+        self._report_memory('preprocessing_before', self.raw_data)
+        
+        requirements_col = 'skills_clean' if 'skills_clean' in self.raw_data.columns else 'requirements'
+        
+        full_text = self.raw_data['description'].fillna('').astype(str)
+        if requirements_col in self.raw_data.columns:
+            full_text = full_text + ' ' + self.raw_data[requirements_col].fillna('').astype(str)
+        
+        print("🔄 Memproses pembersihan teks...")
+        sample_original = full_text.iloc[0] if len(full_text) else ''
+        cleaned_text = full_text.map(self._clean_text_memo).astype(LEAN_STRING_DTYPE)
+        del full_text
+        self.clean_memo.report('cleaning')
+        derived = {'cleaned_text': cleaned_text}
+        if requirements_col == TAG_COLUMN:
+            derived['skill_tags'] = self.raw_data[TAG_COLUMN].map(split_skill_tags).astype(LEAN_STRING_DTYPE)
+        
+        # Buang kolom teks mentah yang sudah dikonsumsi (tanpa deep copy)
+        consumed = [col for col in CONSUMED_TEXT_COLUMNS if col in self.raw_data.columns]
+        self.raw_data = self.raw_data.drop(columns=consumed)
+        self.cleaned_data = self.raw_data.assign(**derived)
+        
+        self._report_memory('preprocessing_after', self.cleaned_data)
+        
+        print(f"✅ Pembersihan teks selesai untuk {len(self.cleaned_data)} lowongan")
+        print(f"🧹 Kolom teks mentah dibuang: {consumed}")
+        
+        print(f"\n📋 Contoh hasil pembersihan:")
+        if len(self.cleaned_data):
+            print(f"Original: {sample_original[:150]}...")
+            print(f"Cleaned:  {self.cleaned_data['cleaned_text'].iloc[0][:150]}...")
+        
+        self._print_memory_report()
+        return True
+    
+    def export_handoff(self, path=HANDOFF_FILE):
+        """
+        Tulis cleaned_data ke Arrow IPC file; fase/proses berikutnya membacanya
+        lewat memory_map tanpa menjalankan ulang step 1.1-1.2
+        """
+        if self.cleaned_data is None:
+            print("❌ Data belum dibersihkan. Jalankan step_1_2 terlebih dahulu.")
+            return False
+        if not ARROW_AVAILABLE:
+            print("⚠️ pyarrow tidak terpasang, Arrow hand-off dilewati")
+            return False
+        
+        write_handoff(self.cleaned_data, path)
+        print(f"🏹 cleaned_data di-hand-off ke: {path} ({os.path.getsize(path) / (1024 * 1024):.1f} MB)")
+        return True
+    
+    def load_handoff(self, path=HANDOFF_FILE):
+        """
+        Pengganti step 1.1-1.2: cleaned_data dari Arrow hand-off (zero-copy)
+        """
+        try:
+            self.cleaned_data = read_handoff(path)
+        except (ImportError, FileNotFoundError) as e:
+            print(f"❌ Arrow hand-off tidak bisa dibaca: {e}")
+            return False
+        
+        print(f"✅ cleaned_data dimuat dari hand-off {path}: {len(self.cleaned_data):,} lowongan")
+        return True
+    
+    def _clean_text_memo(self, text):
+        return self.clean_memo.get(text, clean_text)
+    
+    def _apply_lean_dtypes(self, df):
+        """
+        Categorical untuk kolom berulang, Arrow-backed string untuk kolom teks
+        """
+        for col in df.columns:
+            if col in CATEGORICAL_COLUMNS:
+                df[col] = df[col].astype('category')
+            elif df[col].dtype == object or str(df[col].dtype) in ('str', 'string'):
+                df[col] = df[col].astype(LEAN_STRING_DTYPE)
+    
+    def _report_memory(self, label, df):
+        """
+        Catat ukuran DataFrame (deep) dan peak RSS proses saat ini
+        """
+        self.memory_report[label] = {
+            'dataframe_mb': df.memory_usage(deep=True).sum() / (1024 * 1024),
+            'peak_rss_mb': _peak_rss_mb()
+        }
+    
+    def _print_memory_report(self):
+        print(f"\n🧠 LAPORAN MEMORI:")
+        for label, info in self.memory_report.items():
+            peak = f"{info['peak_rss_mb']:.1f} MB" if info['peak_rss_mb'] is not None else "n/a"
+            print(f"   • {label}: DataFrame {info['dataframe_mb']:.1f} MB | Peak RSS {peak}")
+    
     def step_1_3_build_skills_dictionary(self):
         """
         Langkah 1.3: Pembangunan Kamus Skill (Skill Ontology/Dictionary)
@@ -164,11 +333,21 @@ class DataPreparation:
         print("\n📚 LANGKAH 1.3: PEMBANGUNAN KAMUS SKILL")
         print("="*50)
         
+        # Load compiled skills database (hasil build_skills_database.py)
+        compiled_db = load_json(COMPILED_DB_FILE)
+        
         # Load comprehensive skills database (UPDATED!)
         try:
-            with open('comprehensive_skills_database.json', 'r', encoding='utf-8') as f:
-                skills_database = json.load(f)
-            print(f"✅ Loaded comprehensive skills database from file")
+            if compiled_db is not None:
+                skills_database = compiled_db['categories']
+                self.skills_source_version = compiled_db['version']
+                print(f"✅ Loaded compiled skills database v{compiled_db['version']} ({compiled_db['content_hash'][:12]})")
+                if compiled_db.get('conflicts'):
+                    print(f"⚠️ {len(compiled_db['conflicts'])} skill konflik lintas kategori (lihat {COMPILED_DB_FILE})")
+            else:
+                with open('comprehensive_skills_database.json', 'r', encoding='utf-8') as f:
+                    skills_database = json.load(f)
+                print(f"✅ Loaded comprehensive skills database from file")
             print(f"📊 Categories: {len(skills_database)}")
             print(f"🎯 Total skills: {sum(len(skills) for skills in skills_database.values())}")
         except FileNotFoundError:
@@ -360,7 +539,11 @@ class DataPreparation:
                         'aliases': []
                     }
         
+        # Hash kamus final (termasuk sinonim) untuk invalidasi cache downstream
+        self.dictionary_hash = content_hash(self.skills_dictionary)
+        
         print(f"✅ Kamus skill berhasil dibuat dengan {len(self.skills_dictionary)} entri")
+        print(f"🔑 Dictionary hash: {self.dictionary_hash[:12]}")
         print(f"📊 Kategori skills: {len(skills_database)} kategori")
         
         # Show category breakdown
@@ -385,7 +568,9 @@ class DataPreparation:
             'total_skills': len(self.skills_dictionary),
             'categories_count': len(skills_database),
             'tech_categories': len([c for c in tech_categories if c in skills_database]),
-            'non_tech_categories': len(non_tech_categories)
+            'non_tech_categories': len(non_tech_categories),
+            'dictionary_hash': self.dictionary_hash,
+            'source_version': self.skills_source_version
         }
         
         with open('skills_dictionary.json', 'w', encoding='utf-8') as f:
@@ -454,7 +639,7 @@ class DataPreparation:
             'total_skills': len(self.skills_dictionary) if self.skills_dictionary is not None else 0
         }
 
-def main():
+def main(memory_lean=False):
     """
     Main function untuk menjalankan Fase 1
     """
@@ -463,7 +648,7 @@ def main():
     print("="*70)
     
     # Inisialisasi
-    data_prep = DataPreparation()
+    data_prep = DataPreparation(memory_lean=memory_lean)
     
     # Langkah 1.1: Pengumpulan Data
     success_1_1 = data_prep.step_1_1_data_collection()
@@ -477,6 +662,9 @@ def main():
             success_1_3 = data_prep.step_1_3_build_skills_dictionary()
             
             if success_1_3:
+                # Hand-off cleaned_data untuk Fase 2 / worker (Arrow IPC, mmap)
+                data_prep.export_handoff()
+                
                 # Ringkasan
                 summary = data_prep.get_preparation_summary()
                 
@@ -492,4 +680,9 @@ def main():
     return None
 
 if __name__ == "__main__":
-    result = main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--memory-lean', action='store_true',
+                        help='Categorical/Arrow dtypes dan buang kolom teks mentah setelah dipakai')
+    args = parser.parse_args()
+    
+    result = main(memory_lean=args.memory_lean)
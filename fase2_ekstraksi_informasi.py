@@ -3,31 +3,80 @@ FASE 2: EKSTRAKSI INFORMASI DARI LOWONGAN (INFORMATION EXTRACTION)
 Sistem Career Learning Roadmap - Ekstraksi Skills dari Job Description
 """
 
+import os
+import shutil
 import pandas as pd
 import numpy as np
 import re
 import json
+import hashlib
 from collections import Counter, defaultdict
 import warnings
-from fase1_persiapan_data import DataPreparation
+import argparse
+from fase1_persiapan_data import DataPreparation, clean_text, TAG_SEPARATOR
+from artifact_io import content_hash, load_json, atomic_write_json
+from compact_evidence import EvidenceBuilder, CompactEvidence, EVIDENCE_FILE
+from job_skill_matrix import JobSkillSnapshot, MATRIX_FILE, MATRIX_META_FILE
+from extraction_store import write_extraction_store, STORE_FILE
+from mmap_matrix import export_mmap, MMAP_DIR
+from dedup_memo import TextMemo, DEFAULT_MEMO_SIZE
+from arrow_handoff import HANDOFF_FILE
+from job_data_loader import SCRAPE_DATE_COLUMNS
 
 warnings.filterwarnings('ignore')
 
+PATTERN_CACHE_FILE = 'skill_patterns_cache.json'
+# Naikkan jika cara membangun pattern berubah (cache & checkpoint lama dibuang)
+PATTERN_VERSION = 2
+CHECKPOINT_DIR = 'extraction_checkpoint'
+CHECKPOINT_STATE_FILE = 'state.json'
+PARTIALS_DIR = 'extraction_partials'
+PARTIALS_INDEX_FILE = 'jobs.json'
+PARTIAL_OUTPUT_DIR = 'merged'
+# Kolom yang menentukan hasil ekstraksi; isinya ikut di-hash pada fingerprint data
+FINGERPRINT_COLUMNS = ['posisi', 'company', 'cleaned_text', 'skill_tags']
+
+def description_hash(job_text):
+    """
+    Identitas isi posting (cleaned_text), stabil walau urutan baris berubah
+    """
+    return hashlib.blake2b(job_text.encode('utf-8'), digest_size=8).hexdigest()
+
+def _skill_source(spans, tag_start):
+    """
+    Provenance skill dari posisi span (terurut): tag, description, atau both
+    """
+    if spans[0][0] >= tag_start:
+        return 'tag'
+    return 'both' if spans[-1][0] >= tag_start else 'description'
+
 class SkillExtraction:
     """
     Fase 2: Ekstraksi Informasi dari Lowongan (Information Extraction)
     """
     
-    def __init__(self, data_preparation=None):
+    def __init__(self, data_preparation=None, compact_evidence=True, memo_size=DEFAULT_MEMO_SIZE):
         self.data_prep = data_preparation
+        self.compact_evidence = compact_evidence
+        self.memo_size = memo_size
+        self.scan_memo = None
+        self.evidence = None
         self.extracted_skills_db = None
         self.skill_frequency = None
         self.job_skill_matrix = None
-        
-    def step_2_1_design_extraction_method(self):
+        self.job_skill_snapshot = None
+        self.categories = None
+        self.all_skill_patterns = None
+        self.has_skill_tags = False
+        self.missing_categories = []
+        self._content_hash = None
+        self._content_hash_source = None
+        
+    def step_2_1_design_extraction_method(self, categories=None):
         """
         Langkah 2.1: Desain Metode Ekstraksi Skill
         Menggunakan pendekatan Pattern Matching dengan Regular Expression
+        categories: hanya pattern kategori ini yang dipakai (mode refresh per kategori)
         """
         print("\n🔧 LANGKAH 2.1: DESAIN METODE EKSTRAKSI SKILL")
         print("="*60)
@@ -43,6 +92,16 @@ class SkillExtraction:
         print("   • Mudah di-customize dan di-maintain")
         print("   • Dapat mengenali skill dengan karakter khusus (C++, C#, Node.js)")
         
+        # Pakai pattern cache jika kamus tidak berubah (dictionary_hash sama)
+        dictionary_hash = getattr(self.data_prep, 'dictionary_hash', None)
+        cached = load_json(PATTERN_CACHE_FILE)
+        if (dictionary_hash and cached and cached.get('dictionary_hash') == dictionary_hash
+                and cached.get('pattern_version') == PATTERN_VERSION):
+            self.skill_patterns = cached['skill_patterns']
+            print(f"♻️ Pattern cache valid ({dictionary_hash[:12]}), build ulang dilewati")
+            print(f"✅ Pattern dimuat untuk {len(self.skill_patterns)} skills")
+            return self._select_categories(categories)
+        
         # Buat pattern untuk setiap skill dalam dictionary
         self.skill_patterns = {}
         
@@ -53,7 +112,9 @@ class SkillExtraction:
             
             # Combine canonical name dengan aliases
             all_variations = [skill_name, canonical_name] + aliases
-            all_variations = list(set(all_variations))  # Remove duplicates
+            # Remove duplicates; urutan deterministik (bukan urutan hash set) dan
+            # variasi terpanjang dicoba dulu agar 'node.js' tidak terpotong jadi 'node'
+            all_variations = sorted(set(all_variations), key=lambda v: (-len(v), v))
             
             # Escape karakter khusus untuk regex tapi pertahankan makna untuk skill
             patterns = []
@@ -75,6 +136,13 @@ class SkillExtraction:
         
         print(f"✅ Pattern berhasil dibuat untuk {len(self.skill_patterns)} skills")
         
+        if dictionary_hash:
+            atomic_write_json(PATTERN_CACHE_FILE, {
+                'dictionary_hash': dictionary_hash,
+                'pattern_version': PATTERN_VERSION,
+                'skill_patterns': self.skill_patterns
+            })
+        
         # Sample patterns
         print(f"\n📋 Contoh patterns:")
         sample_skills = ['python', 'javascript', 'node.js', 'c++', 'aws']
@@ -83,12 +151,41 @@ class SkillExtraction:
                 info = self.skill_patterns[skill]
                 print(f"  • {skill}: {info['variations']}")
         
+        return self._select_categories(categories)
+    
+    def _select_categories(self, categories):
+        """
+        Batasi skill_patterns ke kategori terpilih; pattern lengkap tetap
+        disimpan untuk urutan skill saat partial digabung
+        """
+        self.all_skill_patterns = self.skill_patterns
+        self.categories = None
+        if not categories:
+            return True
+        
+        available = {info['category'] for info in self.skill_patterns.values()}
+        unknown = [category for category in categories if category not in available]
+        if unknown:
+            print(f"⚠️ Kategori tidak dikenal: {', '.join(unknown)}")
+        selected = sorted(set(categories) & available)
+        if not selected:
+            print(f"❌ Tidak ada kategori valid. Tersedia: {', '.join(sorted(available))}")
+            return False
+        
+        self.categories = selected
+        self.skill_patterns = {skill: info for skill, info in self.all_skill_patterns.items()
+                               if info['category'] in selected}
+        print(f"🎯 Mode kategori: {', '.join(selected)} → "
+              f"{len(self.skill_patterns)}/{len(self.all_skill_patterns)} patterns")
         return True
     
-    def step_2_2_mass_extraction(self):
+    def step_2_2_mass_extraction(self, batch_size=1000, checkpoint_dir=None,
+                                 checkpoint_every=10, resume=False):
         """
         Langkah 2.2: Proses Ekstraksi Massal
         Menjalankan ekstraksi skill pada seluruh dataset
+        checkpoint_dir: simpan hasil batch yang selesai setiap checkpoint_every batch
+        resume: lanjutkan dari checkpoint terakhir (output identik dengan run penuh)
         """
         print("\n⚡ LANGKAH 2.2: PROSES EKSTRAKSI MASSAL")
         print("="*50)
@@ -106,12 +203,43 @@ class SkillExtraction:
         # Hasil ekstraksi
         extraction_results = []
         skill_frequency_counter = Counter()
+        evidence_builder = EvidenceBuilder(self.skill_patterns.keys())
+        self._prepare_matchers()
+        
+        # skills_clean sudah ter-tokenisasi di Fase 1: fast path lookup alias
+        self.has_skill_tags = 'skill_tags' in self.data_prep.cleaned_data.columns
+        if self.has_skill_tags:
+            print("🏷️ Kolom skills_clean: tag di-resolve via lookup alias, regex hanya untuk deskripsi")
+        
+        # Kolom tanggal scrape (opsional) untuk agregat tren per time bucket
+        date_column = next((col for col in SCRAPE_DATE_COLUMNS
+                            if col in self.data_prep.cleaned_data.columns), None)
         
         # Process dalam batch untuk efisiensi
-        batch_size = 1000
         total_batches = (len(self.data_prep.cleaned_data) + batch_size - 1) // batch_size
         
-        for batch_idx in range(total_batches):
+        start_batch = 0
+        pending_results = []
+        pending_spans = []
+        if checkpoint_dir:
+            fingerprint = self._checkpoint_fingerprint(batch_size)
+            state = self._load_checkpoint(checkpoint_dir, fingerprint) if resume else None
+            if state is None:
+                shutil.rmtree(checkpoint_dir, ignore_errors=True)
+                os.makedirs(checkpoint_dir)
+                state = {'fingerprint': fingerprint, 'completed_batches': 0, 'parts': []}
+            else:
+                # Replay checkpoint dengan urutan yang sama seperti run tanpa interupsi
+                for part_file in state['parts']:
+                    part = load_json(os.path.join(checkpoint_dir, part_file))
+                    for job_result, skill_spans in zip(part['jobs'], part['spans']):
+                        extraction_results.append(job_result)
+                        skill_frequency_counter.update(job_result['required_skills'])
+                        evidence_builder.add_job(job_result['job_id'], skill_spans)
+                start_batch = state['completed_batches']
+                print(f"♻️ Resume dari checkpoint: {start_batch}/{total_batches} batches selesai")
+        
+        for batch_idx in range(start_batch, total_batches):
             start_idx = batch_idx * batch_size
             end_idx = min((batch_idx + 1) * batch_size, len(self.data_prep.cleaned_data))
             
@@ -123,34 +251,45 @@ class SkillExtraction:
                 job_text = row['cleaned_text']
                 
                 # Ekstraksi skills untuk job ini
-                found_skills = []
-                skill_details = {}
-                
-                for skill_name, pattern_info in self.skill_patterns.items():
-                    pattern = pattern_info['pattern']
-                    
-                    # Cari matches
-                    matches = re.findall(pattern, job_text, re.IGNORECASE)
-                    
-                    if matches:
-                        found_skills.append(skill_name)
-                        skill_frequency_counter[skill_name] += 1
-                        
-                        skill_details[skill_name] = {
-                            'category': pattern_info['category'],
-                            'matches': matches,
-                            'count': len(matches)
-                        }
+                tag_start, tag_spans = self._tag_spans(job_text, row['skill_tags'] if self.has_skill_tags else None)
+                skill_spans = self._extract_job_skills(job_text, tag_start, tag_spans)
+                found_skills = list(skill_spans)
+                skill_frequency_counter.update(found_skills)
+                evidence_builder.add_job(job_id, skill_spans)
                 
                 # Simpan hasil
-                extraction_results.append({
+                job_result = {
                     'job_id': job_id,
                     'job_title': job_title,
                     'company': row['company'],
                     'required_skills': found_skills,
-                    'skill_details': skill_details,
-                    'total_skills_found': len(found_skills)
-                })
+                    'total_skills_found': len(found_skills),
+                    'text_hash': description_hash(job_text)
+                }
+                if not self.compact_evidence:
+                    job_result['skill_details'] = {
+                        skill_name: {
+                            'category': self.skill_patterns[skill_name]['category'],
+                            'matches': [job_text[start:end] for start, end in spans],
+                            'count': len(spans)
+                        }
+                        for skill_name, spans in skill_spans.items()
+                    }
+                if self.has_skill_tags:
+                    job_result['skill_sources'] = {
+                        skill_name: _skill_source(spans, tag_start) for skill_name, spans in skill_spans.items()
+                    }
+                if date_column and not pd.isna(row[date_column]):
+                    job_result['scraped_at'] = str(row[date_column])
+                extraction_results.append(job_result)
+                if checkpoint_dir:
+                    pending_results.append(job_result)
+                    pending_spans.append(skill_spans)
+            
+            if checkpoint_dir and ((batch_idx + 1) % checkpoint_every == 0 or batch_idx == total_batches - 1):
+                self._write_checkpoint(checkpoint_dir, state, batch_idx + 1, pending_results, pending_spans)
+                pending_results = []
+                pending_spans = []
             
             # Progress update
             if (batch_idx + 1) % 10 == 0 or batch_idx == total_batches - 1:
@@ -160,10 +299,15 @@ class SkillExtraction:
         # Simpan hasil
         self.extracted_skills_db = extraction_results
         self.skill_frequency = dict(skill_frequency_counter)
+        self.evidence = evidence_builder.build()
         
         # Buat job-skill matrix
         self._create_job_skill_matrix()
         
+        # Run selesai, checkpoint tidak diperlukan lagi
+        if checkpoint_dir:
+            shutil.rmtree(checkpoint_dir, ignore_errors=True)
+        
         print(f"✅ Ekstraksi selesai!")
         print(f"📊 Total lowongan diproses: {len(self.extracted_skills_db):,}")
         print(f"🎯 Skills unik ditemukan: {len(self.skill_frequency)}")
@@ -175,8 +319,178 @@ class SkillExtraction:
         print(f"📈 Total skill mentions: {total_skills_found:,}")
         print(f"📊 Rata-rata skills per lowongan: {avg_skills_per_job:.1f}")
         
+        self.scan_memo.report('ekstraksi (deskripsi)')
+        if self.has_skill_tags:
+            self.tag_memo.report('tag', unit='token')
+            sources = Counter(source for job in self.extracted_skills_db for source in job['skill_sources'].values())
+            print(f"🏷️ Sumber skill: tag {sources['tag']:,} | deskripsi {sources['description']:,} | "
+                  f"keduanya {sources['both']:,}")
+        
         return True
     
+    def _data_fingerprint(self):
+        """
+        Identitas data + kamus; checkpoint dan partial per kategori hanya
+        dipakai ulang jika sama (termasuk isi teks, bukan hanya jumlah baris)
+        """
+        return {
+            'rows': len(self.data_prep.cleaned_data),
+            'index_hash': content_hash(self.data_prep.cleaned_data.index.tolist()),
+            'content_hash': self._data_content_hash(),
+            'dictionary_hash': getattr(self.data_prep, 'dictionary_hash', None),
+            'pattern_version': PATTERN_VERSION,
+            'compact_evidence': self.compact_evidence
+        }
+    
+    def _data_content_hash(self):
+        """
+        sha256 isi FINGERPRINT_COLUMNS per baris (independen dari dtype:
+        object, categorical, Arrow); dihitung sekali per DataFrame
+        """
+        df = self.data_prep.cleaned_data
+        if self._content_hash_source is not df:
+            digest = hashlib.sha256()
+            columns = [df[col] for col in FINGERPRINT_COLUMNS if col in df.columns]
+            for values in zip(*columns):
+                digest.update('\x1f'.join(value if isinstance(value, str) else '' for value in values).encode('utf-8'))
+                digest.update(b'\x1e')
+            self._content_hash = digest.hexdigest()
+            self._content_hash_source = df
+        return self._content_hash
+    
+    def _checkpoint_fingerprint(self, batch_size):
+        """
+        Identitas run: checkpoint hanya valid untuk data, batch size, kamus, dan kategori yang sama
+        """
+        return {
+            **self._data_fingerprint(),
+            'batch_size': batch_size,
+            'categories': self.categories
+        }
+    
+    def _load_checkpoint(self, checkpoint_dir, fingerprint):
+        state = load_json(os.path.join(checkpoint_dir, CHECKPOINT_STATE_FILE))
+        if state is None:
+            print("ℹ️ Checkpoint tidak ditemukan, mulai dari awal")
+            return None
+        if state['fingerprint'] != fingerprint:
+            print("⚠️ Checkpoint dibuat untuk data/kamus yang berbeda, mulai dari awal")
+            return None
+        return state
+    
+    def _write_checkpoint(self, checkpoint_dir, state, completed_batches, job_results, skill_spans):
+        """
+        Tulis part baru lalu state.json (atomic); state hanya merujuk part yang utuh
+        """
+        part_file = f"part_{completed_batches:06d}.json"
+        atomic_write_json(os.path.join(checkpoint_dir, part_file),
+                          {'jobs': job_results, 'spans': skill_spans}, indent=None)
+        state['parts'].append(part_file)
+        state['completed_batches'] = completed_batches
+        atomic_write_json(os.path.join(checkpoint_dir, CHECKPOINT_STATE_FILE), state)
+    
+    def _prepare_matchers(self):
+        """
+        Regex ter-compile per skill + lookup alias tag → canonical skill
+        (variasi dibersihkan seperti token skills_clean; satu variasi bisa
+        milik beberapa skill)
+        """
+        self.compiled_patterns = {skill_name: re.compile(pattern_info['pattern'], re.IGNORECASE)
+                                  for skill_name, pattern_info in self.skill_patterns.items()}
+        self.skill_position = {skill_name: i for i, skill_name in enumerate(self.skill_patterns)}
+        # Hasil scan regex bergantung pada set pattern: memo dimulai ulang per run
+        self.scan_memo = TextMemo(self.memo_size)
+        self.tag_memo = TextMemo(self.memo_size)
+        self.tag_lookup = defaultdict(list)
+        for skill_name, pattern_info in self.skill_patterns.items():
+            for variation in {clean_text(variation) for variation in pattern_info['variations']}:
+                self.tag_lookup[variation].append(skill_name)
+    
+    def _tag_spans(self, job_text, skill_tags):
+        """
+        Offset token skills_clean di ujung cleaned_text
+        Return: (tag_start, [(token, (start, end)), ...]); tanpa tag → (len(job_text), [])
+        """
+        tokens = skill_tags.split(TAG_SEPARATOR) if skill_tags else []
+        tags_text = ' '.join(tokens)
+        if not tokens or not job_text.endswith(tags_text):
+            return len(job_text), []
+        
+        tag_start = position = len(job_text) - len(tags_text)
+        tag_spans = []
+        for token in tokens:
+            tag_spans.append((token, (position, position + len(token))))
+            position += len(token) + 1
+        return tag_start, tag_spans
+    
+    def _match_tag(self, token):
+        """
+        Semua skill yang cocok pada satu token tag: regex setiap pattern
+        (sama seperti scan teks penuh, mis. 'sql server' → sql + sql server)
+        ditambah alias persis yang tidak tertangkap regex (mis. 'c++')
+        Return: {skill_name: [(start, end), ...]} (offset relatif ke token)
+        """
+        matches = self._scan_patterns(token)
+        for skill_name in self.tag_lookup.get(token, []):
+            matches.setdefault(skill_name, [(0, len(token))])
+        return matches
+    
+    def _extract_job_skills(self, job_text, tag_start=None, tag_spans=()):
+        """
+        Cari semua skill pada satu teks lowongan
+        Regex memindai deskripsi; setiap token tag unik dicocokkan sekali lalu
+        hasilnya dipakai ulang lewat lookup per token
+        Return: {skill_name: [(start, end), ...]} (offset pada cleaned_text)
+        """
+        # Key memo = deskripsi saja (spasi pemisah tag dibuang, hasil regex sama),
+        # sehingga baris dengan deskripsi sama tapi tag berbeda tetap berbagi scan
+        scan_text = job_text if tag_start is None else job_text[:tag_start].rstrip()
+        skill_spans = dict(self.scan_memo.get(scan_text, self._scan_patterns))
+        
+        if tag_spans:
+            for token, (start, _) in tag_spans:
+                for skill_name, spans in self.tag_memo.get(token, self._match_tag).items():
+                    skill_spans[skill_name] = (skill_spans.get(skill_name, []) +
+                                               [(start + lo, start + hi) for lo, hi in spans])
+            skill_spans = {skill_name: skill_spans[skill_name]
+                           for skill_name in sorted(skill_spans, key=self.skill_position.__getitem__)}
+        
+        return skill_spans
+    
+    def _scan_patterns(self, text):
+        """
+        Regex semua pattern pada satu teks: {skill_name: [(start, end), ...]}
+        """
+        skill_spans = {}
+        
+        for skill_name, pattern in self.compiled_patterns.items():
+            spans = [match.span() for match in pattern.finditer(text)]
+            if spans:
+                skill_spans[skill_name] = spans
+        
+        return skill_spans
+    
+    def explain_skill_detection(self, job_id, skill, context=40):
+        """
+        Snippet teks yang menjelaskan kenapa sebuah skill terdeteksi pada lowongan
+        (dimaterialisasi lazily dari compact evidence + cleaned_text)
+        """
+        if self.evidence is None:
+            try:
+                self.evidence = CompactEvidence.load()
+            except FileNotFoundError:
+                print("❌ Evidence belum tersedia. Jalankan step_2_2 terlebih dahulu.")
+                return []
+        
+        if self.data_prep is None or self.data_prep.cleaned_data is None:
+            print("❌ cleaned_text tidak tersedia untuk membuat snippet.")
+            return []
+        
+        row_label = int(job_id.split('_', 1)[1])
+        job_text = self.data_prep.cleaned_data.loc[row_label, 'cleaned_text']
+        
+        return self.evidence.explain(job_id, skill, job_text, context=context)
+    
     def _create_job_skill_matrix(self):
         """
         Membuat matrix job-skill untuk analisis lebih lanjut
@@ -186,22 +500,14 @@ class SkillExtraction:
         # Get all unique skills
         all_skills = sorted(self.skill_frequency.keys())
         
-        # Create matrix
-        matrix_data = []
-        job_titles = []
-        
-        for job in self.extracted_skills_db:
-            job_titles.append(job['job_title'])
-            
-            # Create row for this job
-            row = [1 if skill in job['required_skills'] else 0 for skill in all_skills]
-            matrix_data.append(row)
+        # Sparse CSR matrix (dipakai analisis lanjutan: company profiles, dll)
+        self.job_skill_snapshot = JobSkillSnapshot.from_extraction(self.extracted_skills_db, all_skills)
         
         # Convert to DataFrame
         self.job_skill_matrix = pd.DataFrame(
-            matrix_data, 
+            self.job_skill_snapshot.matrix.toarray(), 
             columns=all_skills,
-            index=job_titles
+            index=self.job_skill_snapshot.job_titles
         )
         
         print(f"✅ Matrix dibuat: {self.job_skill_matrix.shape[0]} jobs × {self.job_skill_matrix.shape[1]} skills")
@@ -272,9 +578,140 @@ class SkillExtraction:
         
         return dict(category_stats)
     
-    def save_extraction_results(self):
+    def save_category_partials(self, partial_dir=PARTIALS_DIR):
+        """
+        Simpan hasil run per kategori sebagai partial ({kategori}.npz, format
+        CompactEvidence: hanya span) agar bisa digabung dengan run kategori lain;
+        jobs.json menyimpan metadata lowongan, urutan skill lengkap, dan daftar
+        kategori yang tersedia. Run penuh menulis partial semua kategori.
+        Partial dari data/kamus lama dihapus.
+        """
+        if self.extracted_skills_db is None:
+            print("❌ Tidak ada hasil ekstraksi untuk disimpan sebagai partial.")
+            return False
+        
+        fingerprint = self._data_fingerprint()
+        index_file = os.path.join(partial_dir, PARTIALS_INDEX_FILE)
+        index = load_json(index_file)
+        if index is not None and index['fingerprint'] != fingerprint:
+            print("⚠️ Partial lama dibuat untuk data/kamus yang berbeda, dihapus")
+            shutil.rmtree(partial_dir, ignore_errors=True)
+            index = None
+        os.makedirs(partial_dir, exist_ok=True)
+        
+        categories = self.categories or sorted({info['category'] for info in self.skill_patterns.values()})
+        builders = {
+            category: EvidenceBuilder(skill for skill, info in self.skill_patterns.items()
+                                      if info['category'] == category)
+            for category in categories
+        }
+        for job in self.extracted_skills_db:
+            category_spans = defaultdict(dict)
+            for skill in job['required_skills']:
+                category_spans[self.skill_patterns[skill]['category']][skill] = self.evidence.spans(job['job_id'], skill)
+            for category, spans in category_spans.items():
+                builders[category].add_job(job['job_id'], spans)
+        
+        for category, builder in builders.items():
+            builder.build().save(os.path.join(partial_dir, f"{category}.npz"))
+            if self.categories:
+                print(f"💾 Partial {category}: {len(builder.job_ids):,} lowongan dengan skill kategori ini")
+        
+        # Index ditulis terakhir: partial hanya dipakai jika tercatat di sini
+        saved_categories = set(index['categories']) if index else set()
+        atomic_write_json(index_file, {
+            'fingerprint': fingerprint,
+            'skill_order': [[skill, info['category']] for skill, info in self.all_skill_patterns.items()],
+            'skill_tags': self.has_skill_tags,
+            'categories': sorted(saved_categories | set(categories)),
+            'jobs': [[job['job_id'], job['job_title'], job['company'], job.get('scraped_at')]
+                     for job in self.extracted_skills_db]
+        }, indent=None)
+        if not self.categories:
+            print(f"💾 Partial {len(categories)} kategori disimpan ke {partial_dir}/")
+        
+        return True
+    
+    def merge_category_partials(self, partial_dir=PARTIALS_DIR):
+        """
+        Gabungkan semua partial kategori yang cocok dengan data saat ini menjadi
+        hasil ekstraksi tunggal. Urutan skill per lowongan mengikuti urutan
+        pattern lengkap, sehingga gabungan semua kategori identik dengan run penuh.
+        skill_details/skill_sources dibangun ulang dari span dan cleaned_text.
+        """
+        fingerprint = self._data_fingerprint()
+        index = load_json(os.path.join(partial_dir, PARTIALS_INDEX_FILE))
+        if index is None or index['fingerprint'] != fingerprint:
+            print("❌ Partial kategori tidak tersedia untuk data/kamus saat ini.")
+            return False
+        
+        merged_spans = defaultdict(dict)
+        categories = index['categories']
+        for category in categories:
+            evidence = CompactEvidence.load(os.path.join(partial_dir, f"{category}.npz"))
+            for job_id in evidence.job_ids:
+                merged_spans[job_id].update({skill: evidence.spans(job_id, skill)
+                                             for skill, _ in evidence.skills_for_job(job_id)})
+        
+        # Teks untuk text_hash, detail match (mode non-compact), dan provenance tag
+        data = self.data_prep.cleaned_data
+        tags = data['skill_tags'] if index['skill_tags'] else [None] * len(data)
+        texts = {f"job_{idx}": (text, tag) for idx, text, tag in zip(data.index, data['cleaned_text'], tags)}
+        
+        skill_order = [skill for skill, category in index['skill_order'] if category in categories]
+        position = {skill: i for i, skill in enumerate(skill_order)}
+        
+        extraction_results = []
+        skill_frequency_counter = Counter()
+        evidence_builder = EvidenceBuilder(skill_order)
+        for job_id, job_title, company, scraped_at in index['jobs']:
+            spans = merged_spans.get(job_id, {})
+            found_skills = sorted(spans, key=position.__getitem__)
+            skill_frequency_counter.update(found_skills)
+            evidence_builder.add_job(job_id, {skill: spans[skill] for skill in found_skills})
+            
+            job_text, skill_tags = texts[job_id]
+            job_result = {
+                'job_id': job_id,
+                'job_title': job_title,
+                'company': company,
+                'required_skills': found_skills,
+                'total_skills_found': len(found_skills),
+                'text_hash': description_hash(job_text)
+            }
+            if not self.compact_evidence:
+                job_result['skill_details'] = {
+                    skill: {
+                        'category': self.all_skill_patterns[skill]['category'],
+                        'matches': [job_text[start:end] for start, end in spans[skill]],
+                        'count': len(spans[skill])
+                    }
+                    for skill in found_skills
+                }
+            if index['skill_tags']:
+                tag_start, _ = self._tag_spans(job_text, skill_tags)
+                job_result['skill_sources'] = {skill: _skill_source(spans[skill], tag_start) for skill in found_skills}
+            if scraped_at is not None:
+                job_result['scraped_at'] = scraped_at
+            extraction_results.append(job_result)
+        
+        self.extracted_skills_db = extraction_results
+        self.skill_frequency = dict(skill_frequency_counter)
+        self.evidence = evidence_builder.build()
+        self.skill_patterns = {skill: self.all_skill_patterns[skill] for skill in skill_order}
+        self._create_job_skill_matrix()
+        
+        all_categories = {category for _, category in index['skill_order']}
+        print(f"🧩 Partial digabung: {len(categories)}/{len(all_categories)} kategori")
+        self.missing_categories = sorted(all_categories - set(categories))
+        if self.missing_categories:
+            print(f"ℹ️ Belum diekstraksi: {', '.join(self.missing_categories)}")
+        return True
+    
+    def save_extraction_results(self, output_dir='.', skill_categories=None):
         """
-        Simpan hasil ekstraksi ke file
+        Simpan hasil ekstraksi ke file; skill_categories ({skill: kategori})
+        wajib diberikan jika extractor tidak punya skill_patterns (mis. merge shard)
         """
         print(f"\n💾 MENYIMPAN HASIL EKSTRAKSI")
         print("="*40)
@@ -283,33 +720,53 @@ class SkillExtraction:
             print("❌ Belum ada hasil ekstraksi untuk disimpan.")
             return False
         
+        os.makedirs(output_dir, exist_ok=True)
+        
         # Save detailed results
-        with open('extracted_skills_database.json', 'w', encoding='utf-8') as f:
+        with open(os.path.join(output_dir, 'extracted_skills_database.json'), 'w', encoding='utf-8') as f:
             json.dump(self.extracted_skills_db, f, indent=2, ensure_ascii=False)
         
+        # Save compact match evidence (skill id, count, offsets)
+        if self.evidence is not None:
+            self.evidence.save(os.path.join(output_dir, EVIDENCE_FILE))
+        
         # Save skill frequency
-        with open('skill_frequency.json', 'w', encoding='utf-8') as f:
+        with open(os.path.join(output_dir, 'skill_frequency.json'), 'w', encoding='utf-8') as f:
             json.dump(self.skill_frequency, f, indent=2, ensure_ascii=False)
         
-        # Save job-skill matrix as CSV
+        # Save job-skill matrix as CSV + sparse snapshot
         if self.job_skill_matrix is not None:
-            self.job_skill_matrix.to_csv('job_skill_matrix.csv')
+            self.job_skill_matrix.to_csv(os.path.join(output_dir, 'job_skill_matrix.csv'))
+            self.job_skill_snapshot.save(output_dir)
+            export_mmap(self.job_skill_snapshot, os.path.join(output_dir, MMAP_DIR))
+        
+        # Save SQLite store (query per skill / judul / company tanpa full load)
+        if skill_categories is None:
+            skill_categories = {skill: info['category'] for skill, info in self.skill_patterns.items()}
+        write_extraction_store(self.extracted_skills_db, self.skill_frequency, skill_categories,
+                               os.path.join(output_dir, STORE_FILE))
         
         # Summary statistics
         summary = {
             'total_jobs_processed': len(self.extracted_skills_db),
             'total_unique_skills': len(self.skill_frequency),
             'total_skill_mentions': sum(self.skill_frequency.values()),
-            'average_skills_per_job': sum(len(job['required_skills']) for job in self.extracted_skills_db) / len(self.extracted_skills_db)
+            'average_skills_per_job': (sum(len(job['required_skills']) for job in self.extracted_skills_db) /
+                                       len(self.extracted_skills_db) if self.extracted_skills_db else 0)
         }
         
-        with open('extraction_summary.json', 'w', encoding='utf-8') as f:
+        with open(os.path.join(output_dir, 'extraction_summary.json'), 'w', encoding='utf-8') as f:
             json.dump(summary, f, indent=2, ensure_ascii=False)
         
         print(f"✅ Hasil disimpan:")
         print(f"   • extracted_skills_database.json - Detail lengkap")
+        if self.evidence is not None:
+            print(f"   • {EVIDENCE_FILE} - Compact match evidence ({self.evidence.nbytes / 1024:.1f} KB in-memory)")
         print(f"   • skill_frequency.json - Frekuensi skills")
         print(f"   • job_skill_matrix.csv - Matrix job-skill")
+        print(f"   • {MATRIX_FILE} + {MATRIX_META_FILE} - Sparse matrix job-skill")
+        print(f"   • {MMAP_DIR}.current → {MMAP_DIR}.v*/ - Matrix + role profile (layout mmap, zero-copy)")
+        print(f"   • {STORE_FILE} - SQLite store (jobs, skills, job_skills, title_tokens)")
         print(f"   • extraction_summary.json - Ringkasan statistik")
         
         return True
@@ -348,9 +805,15 @@ class SkillExtraction:
             'total_skills_found': len(self.skill_frequency) if self.skill_frequency else 0
         }
 
-def main():
+def main(memory_lean=False, compact_evidence=True, resume=False, checkpoint_dir=CHECKPOINT_DIR,
+         categories=None, partial_dir=PARTIALS_DIR, memo_size=DEFAULT_MEMO_SIZE, handoff=None):
     """
     Main function untuk menjalankan Fase 2
+    categories: ekstraksi hanya kategori ini, disimpan sebagai partial lalu
+    digabung dengan partial kategori lain dari run sebelumnya (run penuh juga
+    menulis partial). Jika belum semua kategori tersedia, hasil gabungan
+    disimpan di partial_dir/merged agar artifact utama tidak tertimpa.
+    handoff: path Arrow hand-off Fase 1; step 1.1-1.2 tidak dijalankan ulang
     """
     print("🎯 SISTEM CAREER LEARNING ROADMAP")
     print("📋 FASE 2: EKSTRAKSI INFORMASI DARI LOWONGAN")
@@ -358,28 +821,38 @@ def main():
     
     # Muat hasil Fase 1
     print("🔄 Memuat hasil Fase 1...")
-    data_prep = DataPreparation()
+    data_prep = DataPreparation(memory_lean=memory_lean, memo_size=memo_size)
     
-    # Jalankan Fase 1 jika belum
-    success_prep = data_prep.step_1_1_data_collection()
-    if success_prep:
-        success_prep = data_prep.step_1_2_text_preprocessing()
+    # Jalankan Fase 1 jika belum (atau pakai cleaned_data dari Arrow hand-off)
+    if handoff:
+        success_prep = data_prep.load_handoff(handoff)
+    else:
+        success_prep = data_prep.step_1_1_data_collection()
         if success_prep:
-            success_prep = data_prep.step_1_3_build_skills_dictionary()
+            success_prep = data_prep.step_1_2_text_preprocessing()
+    if success_prep:
+        success_prep = data_prep.step_1_3_build_skills_dictionary()
     
     if not success_prep:
         print("❌ Fase 1 belum berhasil. Pastikan data tersedia.")
         return None
     
     # Inisialisasi Fase 2
-    skill_extractor = SkillExtraction(data_prep)
+    skill_extractor = SkillExtraction(data_prep, compact_evidence=compact_evidence, memo_size=memo_size)
     
     # Langkah 2.1: Desain Metode Ekstraksi
-    success_2_1 = skill_extractor.step_2_1_design_extraction_method()
+    success_2_1 = skill_extractor.step_2_1_design_extraction_method(categories=categories)
     
     if success_2_1:
         # Langkah 2.2: Proses Ekstraksi Massal
-        success_2_2 = skill_extractor.step_2_2_mass_extraction()
+        success_2_2 = skill_extractor.step_2_2_mass_extraction(checkpoint_dir=checkpoint_dir, resume=resume)
+        
+        # Partial per kategori selalu disimpan; mode kategori menggabungkannya
+        # dengan kategori lain dari run sebelumnya
+        if success_2_2:
+            success_2_2 = skill_extractor.save_category_partials(partial_dir)
+        if success_2_2 and categories:
+            success_2_2 = skill_extractor.merge_category_partials(partial_dir)
         
         if success_2_2:
             # Analisis hasil
@@ -387,7 +860,12 @@ def main():
             skill_extractor.analyze_skills_by_category()
             
             # Simpan hasil
-            skill_extractor.save_extraction_results()
+            output_dir = '.'
+            if skill_extractor.missing_categories:
+                output_dir = os.path.join(partial_dir, PARTIAL_OUTPUT_DIR)
+                print(f"⚠️ Partial belum mencakup semua kategori, hasil disimpan ke {output_dir}/ "
+                      f"(artifact utama tidak diubah)")
+            skill_extractor.save_extraction_results(output_dir)
             
             # Ringkasan
             summary = skill_extractor.get_extraction_summary()
@@ -402,4 +880,27 @@ def main():
     return None
 
 if __name__ == "__main__":
-    result = main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--memory-lean', action='store_true',
+                        help='Categorical/Arrow dtypes dan buang kolom teks mentah setelah dipakai')
+    parser.add_argument('--full-evidence', action='store_true',
+                        help='Simpan skill_details (string match) di extracted_skills_database.json')
+    parser.add_argument('--resume', action='store_true',
+                        help='Lanjutkan ekstraksi dari checkpoint terakhir')
+    parser.add_argument('--checkpoint-dir', default=CHECKPOINT_DIR)
+    parser.add_argument('--no-checkpoint', action='store_true',
+                        help='Tanpa checkpoint periodik')
+    parser.add_argument('--categories',
+                        help='Ekstraksi hanya kategori ini (pisahkan dengan koma), digabung dengan partial sebelumnya')
+    parser.add_argument('--partial-dir', default=PARTIALS_DIR)
+    parser.add_argument('--memo-size', type=int, default=DEFAULT_MEMO_SIZE,
+                        help='Maksimum teks unik di cache dedup cleaning/ekstraksi (0 = nonaktif)')
+    parser.add_argument('--from-handoff', nargs='?', const=HANDOFF_FILE,
+                        help='Pakai cleaned_data dari Arrow hand-off Fase 1 (default: %(const)s)')
+    args = parser.parse_args()
+    
+    categories = [category.strip() for category in args.categories.split(',') if category.strip()] if args.categories else None
+    result = main(memory_lean=args.memory_lean, compact_evidence=not args.full_evidence,
+                  resume=args.resume, checkpoint_dir=None if args.no_checkpoint else args.checkpoint_dir,
+                  categories=categories, partial_dir=args.partial_dir, memo_size=args.memo_size,
+                  handoff=args.from_handoff)
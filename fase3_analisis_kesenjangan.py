@@ -3,15 +3,15 @@ FASE 3: ANALISIS KESENJANGAN (GAP ANALYSIS)
 Sistem Career Learning Roadmap - Interaktif Gap Analysis
 """
 
-import pandas as pd
-import numpy as np
 import json
 import re
 from collections import Counter, defaultdict
+from datetime import datetime
 import warnings
-from fase1_persiapan_data import DataPreparation
-from fase2_ekstraksi_informasi import SkillExtraction
+import argparse
 from difflib import SequenceMatcher
+from title_normalization import TitleRoleTable
+from extraction_store import ExtractionStore
 
 warnings.filterwarnings('ignore')
 
@@ -20,19 +20,39 @@ class GapAnalysis:
     Fase 3: Analisis Kesenjangan (Gap Analysis)
     """
     
-    def __init__(self, skill_extractor=None):
+    def __init__(self, skill_extractor=None, use_store=False, load_results=True):
+        """
+        load_results=False: hanya validasi skill (kamus), tanpa membuka hasil ekstraksi
+        """
         self.skill_extractor = skill_extractor
         self.job_profiles = None
         self.user_input = None
         self.gap_analysis_result = None
+        self.title_table = None
+        self.store = None
+        self.scorer = None
+        self.extracted_skills_db = None
+        self.skill_frequency = None
         
         # Load data hasil ekstraksi jika ada
-        self._load_extraction_results()
+        if load_results:
+            self._load_extraction_results(use_store)
     
-    def _load_extraction_results(self):
+    def _load_extraction_results(self, use_store=False):
         """
         Load hasil ekstraksi dari file jika ada
+        use_store: query SQLite store secara langsung, tanpa load seluruh JSON
         """
+        if use_store:
+            try:
+                self.store = ExtractionStore()
+                self.extracted_skills_db = None
+                self.skill_frequency = self.store.skill_frequency()
+                print("✅ SQLite extraction store dibuka (query langsung)")
+                return
+            except FileNotFoundError:
+                print("⚠️ SQLite store tidak ditemukan, fallback ke file JSON")
+        
         try:
             with open('extracted_skills_database.json', 'r', encoding='utf-8') as f:
                 self.extracted_skills_db = json.load(f)
@@ -66,19 +86,7 @@ class GapAnalysis:
         print("Contoh: Data Scientist, Full Stack Developer, Digital Marketing Specialist")
         target_position = input("Masukkan posisi yang Anda inginkan: ").strip()
         
-        # Process user input
-        user_skills = self._process_user_skills(user_skills_input)
-        
-        self.user_input = {
-            'raw_skills_input': user_skills_input,
-            'processed_skills': user_skills,
-            'target_position': target_position,
-            'valid_skills': [],
-            'unrecognized_skills': []
-        }
-        
-        # Validasi skills dengan dictionary
-        self._validate_user_skills()
+        self.set_user_input(user_skills_input, target_position, interactive=True)
         
         print(f"\n✅ Input berhasil diproses!")
         print(f"🎯 Target Posisi: {target_position}")
@@ -94,6 +102,25 @@ class GapAnalysis:
         
         return True
     
+    def set_user_input(self, skills_input, target_position, interactive=False):
+        """
+        Proses dan validasi input user tanpa prompt (interactive=False:
+        saran skill tidak ditanyakan, hanya dicatat di user_input['suggestions'])
+        """
+        user_skills = self._process_user_skills(skills_input)
+        
+        self.user_input = {
+            'raw_skills_input': skills_input,
+            'processed_skills': user_skills,
+            'target_position': target_position,
+            'valid_skills': [],
+            'unrecognized_skills': []
+        }
+        
+        # Validasi skills dengan dictionary
+        self._validate_user_skills(interactive=interactive)
+        return self.user_input
+    
     def _process_user_skills(self, skills_input):
         """
         Memproses input skills dari user
@@ -107,7 +134,7 @@ class GapAnalysis:
         
         return skills
     
-    def _validate_user_skills(self):
+    def _validate_user_skills(self, interactive=True):
         """
         Enhanced validation dengan advanced matching
         """
@@ -121,7 +148,7 @@ class GapAnalysis:
                 return
         
         # Use enhanced validation
-        valid_skills, suggestions = self._validate_user_skills_enhanced()
+        valid_skills, suggestions = self._validate_user_skills_enhanced(interactive=interactive)
         
         # Update unrecognized skills based on suggestions
         unrecognized_skills = []
@@ -143,7 +170,7 @@ class GapAnalysis:
             print("❌ Input pengguna belum ada. Jalankan step_3_1 terlebih dahulu.")
             return False
         
-        if self.extracted_skills_db is None:
+        if self.extracted_skills_db is None and self.store is None:
             print("❌ Database skills belum ada. Jalankan Fase 2 terlebih dahulu.")
             return False
         
@@ -152,14 +179,7 @@ class GapAnalysis:
         print(f"🎯 Mencari lowongan yang cocok dengan: '{self.user_input['target_position']}'")
         
         # Cari jobs yang match dengan target position
-        matching_jobs = []
-        
-        for job in self.extracted_skills_db:
-            job_title = job['job_title'].lower()
-            
-            # Fuzzy matching untuk job title
-            if self._is_job_match(target_position, job_title):
-                matching_jobs.append(job)
+        matching_jobs = self._find_matching_jobs(target_position)
         
         print(f"✅ Ditemukan {len(matching_jobs)} lowongan yang cocok")
         
@@ -169,14 +189,35 @@ class GapAnalysis:
             return False
         
         # Agregasi skills dari matching jobs
+        self.job_profiles = self._build_job_profile(self.user_input['target_position'], matching_jobs)
+        total_jobs = self.job_profiles['matching_jobs_count']
+        sorted_skills = list(self.job_profiles['required_skills'].items())
+        
+        print(f"\n📊 PROFIL SKILLS UNTUK '{self.user_input['target_position'].upper()}'")
+        print("="*60)
+        print(f"📋 Berdasarkan analisis {total_jobs} lowongan")
+        print(f"\n🔥 TOP 15 SKILLS YANG DIBUTUHKAN:")
+        print(f"{'Skill':<25} {'Frequency':<12} {'Percentage':<12} {'Level':<15}")
+        print("-" * 70)
+        
+        for skill, requirements in sorted_skills[:15]:
+            level = requirements['requirement_level']
+            percentage = requirements['percentage']
+            count = requirements['jobs_count']
+            print(f"{skill:<25} {count:<12} {percentage:>8.1f}%     {level:<15}")
+        
+        return True
+    
+    def _build_job_profile(self, target_position, matching_jobs):
+        """
+        Agregasi skills dari lowongan yang cocok menjadi profil pekerjaan
+        """
         skill_aggregation = Counter()
-        job_count_per_skill = Counter()
         
         for job in matching_jobs:
             unique_skills_in_job = set(job['required_skills'])
             for skill in unique_skills_in_job:
                 skill_aggregation[skill] += 1
-                job_count_per_skill[skill] += 1
         
         # Hitung persentase untuk setiap skill
         total_jobs = len(matching_jobs)
@@ -195,28 +236,80 @@ class GapAnalysis:
                              key=lambda x: x[1]['percentage'], 
                              reverse=True)
         
-        self.job_profiles = {
-            'target_position': self.user_input['target_position'],
+        return {
+            'target_position': target_position,
             'matching_jobs_count': total_jobs,
             'required_skills': dict(sorted_skills),
             'top_skills': [skill for skill, _ in sorted_skills[:20]],
             'sample_jobs': matching_jobs[:5]  # Sample jobs untuk referensi
         }
+    
+    def _find_matching_jobs(self, target_position):
+        """
+        Resolve target ke role cluster via tabel judul (lookup), fallback ke
+        fuzzy matching jika target tidak bisa dipetakan ke cluster
+        """
+        title_table = self._get_title_table()
+        target_role = title_table.resolve_target(target_position) if title_table else None
         
-        print(f"\n📊 PROFIL SKILLS UNTUK '{self.user_input['target_position'].upper()}'")
-        print("="*60)
-        print(f"📋 Berdasarkan analisis {total_jobs} lowongan")
-        print(f"\n🔥 TOP 15 SKILLS YANG DIBUTUHKAN:")
-        print(f"{'Skill':<25} {'Frequency':<12} {'Percentage':<12} {'Level':<15}")
-        print("-" * 70)
+        if target_role:
+            print(f"🏷️ Role cluster: {target_role} (lookup tabel judul)")
+            if self.store is not None:
+                return self.store.jobs_for_role(target_role)
+            return [job for job in self.extracted_skills_db
+                    if title_table.role_for_title(job['job_title']) == target_role]
         
-        for skill, requirements in sorted_skills[:15]:
-            level = requirements['requirement_level']
-            percentage = requirements['percentage']
-            count = requirements['jobs_count']
-            print(f"{skill:<25} {count:<12} {percentage:>8.1f}%     {level:<15}")
+        if self.store is not None:
+            # Index token judul: setara dengan word-overlap pada fuzzy matching
+            return self.store.jobs_matching_title(target_position)
         
-        return True
+        matching_jobs = []
+        for job in self.extracted_skills_db:
+            job_title = job['job_title'].lower()
+            
+            # Fuzzy matching untuk job title
+            if self._is_job_match(target_position, job_title):
+                matching_jobs.append(job)
+        
+        return matching_jobs
+    
+    def skill_prevalence(self, skill, target_position=None):
+        """
+        Persentase lowongan (opsional: dalam role cluster target) yang meminta sebuah skill
+        """
+        role = None
+        if target_position:
+            title_table = self._get_title_table()
+            role = title_table.resolve_target(target_position.lower()) if title_table else None
+            if role is None:
+                print(f"⚠️ '{target_position}' tidak terpetakan ke role cluster")
+                return None
+        
+        if self.store is not None:
+            count, total = self.store.skill_prevalence(skill, role)
+        elif self.extracted_skills_db is not None:
+            jobs = (self.extracted_skills_db if role is None else
+                    [job for job in self.extracted_skills_db
+                     if self.title_table.role_for_title(job['job_title']) == role])
+            total = len(jobs)
+            count = sum(1 for job in jobs if skill in job['required_skills'])
+        else:
+            print("❌ Database skills belum ada. Jalankan Fase 2 terlebih dahulu.")
+            return None
+        
+        return (count / total * 100) if total else 0.0
+    
+    def _get_title_table(self):
+        """
+        Load tabel normalisasi judul (title_role_table.json) sekali saja
+        """
+        if self.title_table is None:
+            try:
+                self.title_table = TitleRoleTable.load()
+            except FileNotFoundError:
+                print("⚠️ job_keyword.txt tidak ditemukan, role cluster tidak tersedia")
+                self.title_table = False
+        return self.title_table or None
     
     def _is_job_match(self, target_position, job_title):
         """
@@ -282,8 +375,23 @@ class GapAnalysis:
             print("❌ Data tidak lengkap. Pastikan step sebelumnya sudah dijalankan.")
             return False
         
-        user_skills = set(self.user_input['valid_skills'])
-        required_skills = set(self.job_profiles['required_skills'].keys())
+        self.gap_analysis_result = self._compute_gap(self.user_input['valid_skills'], self.job_profiles)
+        result = self.gap_analysis_result
+        
+        print(f"🎯 Target Posisi: {self.user_input['target_position']}")
+        print(f"📊 Skills Match: {len(result['skills_you_have'])}/{len(result['required_skills'])} ({result['match_percentage']:.1f}%)")
+        print(f"✅ Skills yang Anda miliki: {len(result['skills_you_have'])}")
+        print(f"❌ Skills yang perlu dipelajari: {len(result['skills_you_need'])}")
+        print(f"➕ Skills tambahan Anda: {len(result['skills_extra'])}")
+        
+        return True
+    
+    def _compute_gap(self, user_skills, job_profile):
+        """
+        Bandingkan skills user dengan satu profil pekerjaan
+        """
+        user_skills = set(user_skills)
+        required_skills = set(job_profile['required_skills'].keys())
         
         # Analisis gap
         skills_you_have = user_skills.intersection(required_skills)
@@ -297,7 +405,7 @@ class GapAnalysis:
         nice_to_have_gaps = []
         
         for skill in skills_you_need:
-            requirement_info = self.job_profiles['required_skills'][skill]
+            requirement_info = job_profile['required_skills'][skill]
             level = requirement_info['requirement_level']
             
             if level == "CRITICAL":
@@ -314,7 +422,7 @@ class GapAnalysis:
         skills_matched = len(skills_you_have)
         match_percentage = (skills_matched / total_required * 100) if total_required > 0 else 0
         
-        self.gap_analysis_result = {
+        return {
             'user_skills': list(user_skills),
             'required_skills': list(required_skills),
             'skills_you_have': list(skills_you_have),
@@ -327,14 +435,221 @@ class GapAnalysis:
             'match_percentage': match_percentage,
             'total_gaps': len(skills_you_need)
         }
+    
+    def compare_target_positions(self, target_positions, user_skills=None):
+        """
+        Bandingkan beberapa posisi target sekaligus dalam satu pass atas lowongan
+        """
+        print(f"\n⚖️ PERBANDINGAN {len(target_positions)} POSISI TARGET")
+        print("="*70)
         
-        print(f"🎯 Target Posisi: {self.user_input['target_position']}")
-        print(f"📊 Skills Match: {skills_matched}/{total_required} ({match_percentage:.1f}%)")
-        print(f"✅ Skills yang Anda miliki: {len(skills_you_have)}")
-        print(f"❌ Skills yang perlu dipelajari: {len(skills_you_need)}")
-        print(f"➕ Skills tambahan Anda: {len(skills_extra)}")
+        if self.extracted_skills_db is None and self.store is None:
+            print("❌ Database skills belum ada. Jalankan Fase 2 terlebih dahulu.")
+            return None
+        
+        if user_skills is None:
+            if self.user_input is None:
+                print("❌ Input pengguna belum ada. Jalankan step_3_1 terlebih dahulu.")
+                return None
+            user_skills = self.user_input['valid_skills']
+        
+        # Resolve target → role cluster sekali; sisanya pakai fuzzy matching
+        title_table = self._get_title_table()
+        targets_by_role = defaultdict(list)
+        fuzzy_targets = []
+        for target in target_positions:
+            role = title_table.resolve_target(target.lower()) if title_table else None
+            if role:
+                targets_by_role[role].append(target)
+            else:
+                fuzzy_targets.append(target)
+        
+        # Satu pass atas seluruh lowongan untuk semua target
+        matching_jobs = {target: [] for target in target_positions}
+        if self.store is not None:
+            # Store: satu query ber-index per role/target, tanpa scan lowongan
+            for role, targets in targets_by_role.items():
+                jobs = self.store.jobs_for_role(role)
+                for target in targets:
+                    matching_jobs[target] = jobs
+            for target in fuzzy_targets:
+                matching_jobs[target] = self.store.jobs_matching_title(target.lower())
+        
+        for job in self.extracted_skills_db or []:
+            if targets_by_role:
+                role = title_table.role_for_title(job['job_title'])
+                for target in targets_by_role.get(role, []):
+                    matching_jobs[target].append(job)
+            if fuzzy_targets:
+                job_title = job['job_title'].lower()
+                for target in fuzzy_targets:
+                    if self._is_job_match(target.lower(), job_title):
+                        matching_jobs[target].append(job)
+        
+        comparison = []
+        profiles = {}
+        for target in target_positions:
+            if not matching_jobs[target]:
+                comparison.append({'target_position': target, 'matching_jobs_count': 0})
+                continue
+            
+            profiles[target] = self._build_job_profile(target, matching_jobs[target])
+            gap = self._compute_gap(user_skills, profiles[target])
+            comparison.append({
+                'target_position': target,
+                'matching_jobs_count': profiles[target]['matching_jobs_count'],
+                'match_percentage': gap['match_percentage'],
+                'skills_matched': len(gap['skills_you_have']),
+                'skills_required': len(gap['required_skills']),
+                'critical_gaps': [skill for skill, _ in sorted(gap['critical_gaps'], key=lambda x: x[1]['percentage'], reverse=True)],
+                'important_gaps': [skill for skill, _ in sorted(gap['important_gaps'], key=lambda x: x[1]['percentage'], reverse=True)],
+                'total_gaps': gap['total_gaps']
+            })
+        
+        ranked = sorted((row for row in comparison if row['matching_jobs_count']),
+                        key=lambda row: (row['match_percentage'], -len(row['critical_gaps'])),
+                        reverse=True)
+        closest = ranked[0]['target_position'] if ranked else None
+        
+        print(f"{'Posisi':<28} {'Lowongan':>9} {'Match':>8} {'Critical':>9} {'Important':>10}")
+        print("-" * 70)
+        for row in comparison:
+            if not row['matching_jobs_count']:
+                print(f"{row['target_position']:<28} {0:>9} {'-':>8} {'-':>9} {'-':>10}")
+                continue
+            print(f"{row['target_position']:<28} {row['matching_jobs_count']:>9,} "
+                  f"{row['match_percentage']:>7.1f}% {len(row['critical_gaps']):>9} {len(row['important_gaps']):>10}")
         
-        return True
+        if closest:
+            print(f"\n🏆 Posisi paling dekat: {closest}")
+            closest_row = ranked[0]
+            if closest_row['critical_gaps']:
+                print(f"   🚨 Critical gaps: {', '.join(closest_row['critical_gaps'][:5])}")
+        
+        return {
+            'user_skills': list(user_skills),
+            'comparison': comparison,
+            'closest_position': closest,
+            'job_profiles': profiles
+        }
+    
+    def analyze_qualification_coverage(self):
+        """
+        Distribusi coverage skill user terhadap setiap lowongan (semua & role target)
+        """
+        if self.gap_analysis_result is None:
+            print("❌ Analisis gap belum dilakukan.")
+            return None
+        
+        # Import ditunda: numpy/scipy hanya dimuat jika analisis ini dipakai
+        from qualification_coverage import print_distribution
+        
+        scorer = self._get_scorer()
+        if scorer is None:
+            return None
+        
+        print(f"\n📐 QUALIFICATION COVERAGE")
+        print("="*50)
+        
+        user_skills = self.user_input['valid_skills']
+        coverage = {'all_jobs': scorer.distribution(user_skills)}
+        print_distribution(coverage['all_jobs'], 'Semua lowongan')
+        
+        role = self._get_target_role(scorer)
+        if role is not None:
+            coverage['target_role'] = scorer.distribution(user_skills, role=role)
+            print_distribution(coverage['target_role'], f"Role {role}")
+        
+        self.gap_analysis_result['qualification_coverage'] = coverage
+        return coverage
+    
+    def analyze_marginal_gains(self, threshold=None):
+        """
+        What-if: jumlah lowongan tambahan (coverage >= threshold) per skill
+        yang belum dimiliki, dihitung sekaligus untuk semua skill.
+        Hasilnya dipakai untuk mengurutkan rekomendasi pembelajaran.
+        """
+        if self.gap_analysis_result is None:
+            print("❌ Analisis gap belum dilakukan.")
+            return None
+        
+        from qualification_coverage import QUALIFIED_THRESHOLD
+        
+        scorer = self._get_scorer()
+        if scorer is None:
+            return None
+        
+        threshold = QUALIFIED_THRESHOLD if threshold is None else threshold
+        what_if = scorer.marginal_gains(self.user_input['valid_skills'],
+                                        role=self._get_target_role(scorer), threshold=threshold)
+        
+        scope = f"role {what_if['role']}" if what_if['role'] else "semua lowongan"
+        print(f"\n🔮 WHAT-IF: LOWONGAN TAMBAHAN PER SKILL ({scope}, coverage ≥{threshold:.0%})")
+        print(f"   Saat ini lolos: {what_if['qualified_now']:,}/{what_if['jobs']:,} lowongan")
+        for skill, gain in list(what_if['gains'].items())[:5]:
+            print(f"   • +{skill}: +{gain:,} lowongan")
+        
+        self.gap_analysis_result['marginal_gains'] = what_if
+        return what_if
+    
+    def optimize_learning_plan(self, target_rate=None, threshold=None):
+        """
+        Urutan skill minimal agar share lowongan role target yang memenuhi
+        syarat mencapai target_rate (lazy-greedy set cover, lihat
+        learning_plan_optimizer.py)
+        """
+        if self.gap_analysis_result is None:
+            print("❌ Analisis gap belum dilakukan.")
+            return None
+        
+        from learning_plan_optimizer import optimize_learning_plan, print_plan, TARGET_QUALIFIED_RATE
+        from qualification_coverage import QUALIFIED_THRESHOLD
+        
+        scorer = self._get_scorer()
+        if scorer is None:
+            return None
+        
+        role = self._get_target_role(scorer)
+        plan = optimize_learning_plan(
+            scorer, self.user_input['valid_skills'], role=role,
+            target_rate=TARGET_QUALIFIED_RATE if target_rate is None else target_rate,
+            threshold=QUALIFIED_THRESHOLD if threshold is None else threshold
+        )
+        
+        print(f"\n🧭 OPTIMIZED LEARNING PLAN")
+        print("="*50)
+        print_plan(plan, f"Role {role}" if role else "Semua lowongan")
+        
+        self.gap_analysis_result['optimized_learning_plan'] = plan
+        return plan
+    
+    def _get_scorer(self):
+        """
+        Load QualificationScorer (layout mmap / snapshot) sekali saja
+        """
+        if self.scorer is None:
+            from qualification_coverage import QualificationScorer
+            try:
+                self.scorer = QualificationScorer.load()
+            except FileNotFoundError:
+                print("⚠️ Job-skill matrix belum tersedia. Jalankan Fase 2 terlebih dahulu.")
+                self.scorer = False
+        return self.scorer or None
+    
+    def _get_target_role(self, scorer):
+        """
+        Role cluster posisi target, None jika tidak terpetakan
+        """
+        title_table = self._get_title_table()
+        role = title_table.resolve_target(self.user_input['target_position'].lower()) if title_table else None
+        return role if role in scorer.role_index else None
+    
+    def _skill_gain(self, skill):
+        """
+        Marginal gain sebuah skill (0 jika what-if belum dihitung)
+        """
+        what_if = (self.gap_analysis_result or {}).get('marginal_gains')
+        return what_if['gains'].get(skill, 0) if what_if else 0
     
     def step_3_4_display_results(self):
         """
@@ -420,6 +735,10 @@ class GapAnalysis:
             print("🎉 Selamat! Anda sudah memiliki semua skills yang dibutuhkan!")
             return
         
+        # Urutkan berdasarkan lowongan tambahan yang terbuka (what-if), lalu persentase
+        if result.get('marginal_gains'):
+            all_gaps = sorted(all_gaps, key=lambda x: (self._skill_gain(x[0]), x[1]['percentage']), reverse=True)
+        
         print("📋 PRIORITAS PEMBELAJARAN (urutan yang disarankan):")
         
         for i, (skill, req_info) in enumerate(all_gaps, 1):
@@ -431,6 +750,8 @@ class GapAnalysis:
             print(f"\n{i:2d}. {emoji} {skill.upper()}")
             print(f"    Priority: {priority}")
             print(f"    Dibutuhkan oleh: {percentage:.1f}% perusahaan")
+            if self._skill_gain(skill):
+                print(f"    Membuka: +{self._skill_gain(skill):,} lowongan yang memenuhi syarat")
             
             # Enhanced suggestions
             suggestions = self._get_enhanced_learning_resources(skill)
@@ -466,7 +787,7 @@ class GapAnalysis:
             'user_input': self.user_input,
             'job_profiles': self.job_profiles,
             'gap_analysis': self.gap_analysis_result,
-            'timestamp': pd.Timestamp.now().isoformat()
+            'timestamp': datetime.now().isoformat()
         }
         
         filename = f"gap_analysis_{self.user_input['target_position'].replace(' ', '_').lower()}.json"
@@ -629,10 +950,11 @@ class GapAnalysis:
                 print(f"   ⏰ Duration: {phase['duration']}")
                 print(f"   📋 Skills to learn:")
                 
-                for skill in phase['skills_to_learn']:
+                for skill in sorted(phase['skills_to_learn'], key=self._skill_gain, reverse=True):
                     priority = self._get_skill_priority(skill, result)
                     resources = self._get_enhanced_learning_resources(skill)
-                    print(f"      • {skill} ({priority})")
+                    gain = self._skill_gain(skill)
+                    print(f"      • {skill} ({priority}{f', +{gain:,} lowongan' if gain else ''})")
                     print(f"        💡 Resources: {resources['primary']}")
                     if resources['project']:
                         print(f"        🛠️ Project idea: {resources['project']}")
@@ -906,7 +1228,7 @@ class GapAnalysis:
         
         return 0
 
-    def _validate_user_skills_enhanced(self):
+    def _validate_user_skills_enhanced(self, interactive=True):
         """
         Enhanced validation dengan advanced matching
         """
@@ -943,7 +1265,7 @@ class GapAnalysis:
         self.user_input['suggestions'] = suggestions
         
         # Interactive suggestions
-        if suggestions:
+        if suggestions and interactive:
             print(f"\n🤔 SKILL SUGGESTIONS:")
             for user_skill, suggestion in suggestions.items():
                 if suggestion['suggested_skill']:
@@ -958,27 +1280,27 @@ class GapAnalysis:
                     print(f"   • {suggestion['message']}")
         
         return valid_skills, suggestions
-
-def _get_skill_priority(self, skill, result):
-    """
-    Helper function untuk determine skill priority
-    """
-    # Check dalam gap analysis result
-    for priority_gap in result['critical_gaps']:
-        if priority_gap[0] == skill:
-            return 'CRITICAL'
-    
-    for priority_gap in result['important_gaps']:
-        if priority_gap[0] == skill:
-            return 'IMPORTANT'
-    
-    for priority_gap in result['preferred_gaps']:
-        if priority_gap[0] == skill:
-            return 'PREFERRED'
     
-    return 'OPTIONAL'
+    def _get_skill_priority(self, skill, result):
+        """
+        Helper function untuk determine skill priority
+        """
+        # Check dalam gap analysis result
+        for priority_gap in result['critical_gaps']:
+            if priority_gap[0] == skill:
+                return 'CRITICAL'
+        
+        for priority_gap in result['important_gaps']:
+            if priority_gap[0] == skill:
+                return 'IMPORTANT'
+        
+        for priority_gap in result['preferred_gaps']:
+            if priority_gap[0] == skill:
+                return 'PREFERRED'
+        
+        return 'OPTIONAL'
 
-def main():
+def main(use_store=False):
     """
     Main function untuk menjalankan Fase 3: Gap Analysis
     """
@@ -986,7 +1308,7 @@ def main():
     print("="*60)
     
     # Initialize Gap Analysis
-    gap_analyzer = GapAnalysis()
+    gap_analyzer = GapAnalysis(use_store=use_store)
     
     try:
         # Step 1: User Input Interface
@@ -1010,6 +1332,11 @@ def main():
             print("❌ Step 3.3 failed!")
             return
         
+        # Distribusi coverage terhadap seluruh lowongan
+        gap_analyzer.analyze_qualification_coverage()
+        gap_analyzer.analyze_marginal_gains()
+        gap_analyzer.optimize_learning_plan()
+        
         # Step 4: Display Results
         if gap_analyzer.step_3_4_display_results():
             print("✅ Step 3.4 completed!")
@@ -1038,7 +1365,12 @@ def main():
         return None
 
 if __name__ == "__main__":
-    result = main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--use-store', action='store_true',
+                        help='Query extraction_store.sqlite langsung tanpa load JSON')
+    args = parser.parse_args()
+    
+    result = main(use_store=args.use_store)
     
     if result:
         print("\n🎯 FASE 3 SELESAI! Ready untuk implementasi rekomendasi!")
@@ -0,0 +1,154 @@
+"""
+JOB DATA LOADER: Loader CSV Hasil Scrape dengan Schema Eksplisit
+Kolom diproyeksikan sesuai kebutuhan tiap fase, parser Arrow dipakai jika
+tersedia, dan salinan binary (Feather) di-cache selama isi CSV tidak berubah
+"""
+
+import os
+import csv
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from artifact_io import load_json, atomic_write_json
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+DATA_FILE = 'glints_scraped_clean.csv'
+DATA_CACHE_DIR = 'data_cache'
+CSV_SEPARATOR = ';'
+
+SCRAPE_DATE_COLUMNS = ['scraped_at', 'scrape_date', 'posted_date']
+
+# Semua kolom yang dipakai pipeline diperlakukan sebagai teks (tanpa inferensi tipe)
+CSV_SCHEMA = {
+    'posisi': 'str',
+    'company': 'str',
+    'description': 'str',
+    'skills_clean': 'str',
+    'requirements': 'str',
+    **{col: 'str' for col in SCRAPE_DATE_COLUMNS}
+}
+
+# Proyeksi kolom per consumer
+PREPARATION_COLUMNS = ['posisi', 'company', 'description', 'skills_clean', 'requirements'] + SCRAPE_DATE_COLUMNS
+SKILLS_ANALYSIS_COLUMNS = ['description', 'skills_clean']
+
+# Nilai yang dianggap kosong, sama dengan default pd.read_csv
+CSV_NA_VALUES = ['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND',
+                 '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null']
+
+def _file_sha256(file_path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def read_header(file_path, sep=CSV_SEPARATOR):
+    # utf-8-sig: BOM (CSV dari Excel) tidak ikut menjadi bagian nama kolom pertama
+    with open(file_path, 'r', encoding='utf-8-sig', newline='') as f:
+        return next(csv.reader(f, delimiter=sep), [])
+
+def normalize_missing(df):
+    # Kolom object dari Arrow berisi None untuk nilai kosong; samakan dengan read_csv (NaN)
+    for col in df.columns:
+        if df[col].dtype == object:
+            df[col] = df[col].where(df[col].notna(), np.nan)
+    return df
+
+def _parse_csv_arrow(file_path, usecols, sep=CSV_SEPARATOR):
+    """
+    Parser CSV multi-threaded pyarrow; tipe kolom diberikan langsung ke
+    parser (pd.read_csv engine='pyarrow' menginferensi dulu lalu cast,
+    sehingga '007' menjadi '7')
+    """
+    table = pa_csv.read_csv(
+        file_path,
+        parse_options=pa_csv.ParseOptions(delimiter=sep, newlines_in_values=True),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=usecols,
+            column_types={col: pa.string() for col in usecols},
+            null_values=CSV_NA_VALUES,
+            strings_can_be_null=True
+        )
+    )
+    return normalize_missing(table.to_pandas())
+
+def _parse_csv(file_path, usecols, sep=CSV_SEPARATOR):
+    """
+    Parse dengan pyarrow jika terpasang; fallback ke parser C pandas
+    """
+    if ARROW_AVAILABLE:
+        try:
+            return _parse_csv_arrow(file_path, usecols, sep)
+        except (pa.ArrowInvalid, UnicodeDecodeError) as e:
+            print(f"⚠️ Parser Arrow gagal ({e}), fallback ke parser C")
+    dtype = {col: CSV_SCHEMA.get(col, 'str') for col in usecols}
+    return pd.read_csv(file_path, sep=sep, usecols=usecols, dtype=dtype)
+
+def _cache_paths(file_path, usecols, cache_dir):
+    stem = os.path.splitext(os.path.basename(file_path))[0]
+    columns_key = hashlib.sha256('\x1f'.join(usecols).encode('utf-8')).hexdigest()[:12]
+    base = os.path.join(cache_dir, f"{stem}.{columns_key}")
+    return base + '.feather', base + '.json'
+
+def _read_cache(cache_file, meta_file, file_path, stat):
+    """
+    DataFrame dari cache jika CSV tidak berubah: mtime+size sama, atau
+    mtime berubah tapi hash isi sama (file di-touch / disalin ulang)
+    """
+    meta = load_json(meta_file)
+    if meta is None or not os.path.exists(cache_file):
+        return None
+    if [meta['mtime_ns'], meta['size']] != [stat.st_mtime_ns, stat.st_size]:
+        if meta['size'] != stat.st_size or meta['sha256'] != _file_sha256(file_path):
+            return None
+        meta.update(mtime_ns=stat.st_mtime_ns)
+        atomic_write_json(meta_file, meta)
+
+    return normalize_missing(pd.read_feather(cache_file))
+
+def _write_cache(df, cache_file, meta_file, file_path, stat, sha256, usecols):
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    tmp_path = cache_file + '.tmp'
+    df.to_feather(tmp_path)
+    os.replace(tmp_path, cache_file)
+    atomic_write_json(meta_file, {
+        'source': os.path.abspath(file_path),
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'sha256': sha256,
+        'columns': usecols
+    })
+
+def load_job_data(file_path=DATA_FILE, columns=PREPARATION_COLUMNS, use_cache=True,
+                  cache_dir=DATA_CACHE_DIR, sep=CSV_SEPARATOR):
+    """
+    Load dump CSV lowongan: hanya kolom `columns` yang ada di file, semua
+    bertipe teks. Cache Feather butuh pyarrow; tanpa pyarrow selalu parse CSV.
+    """
+    header = read_header(file_path, sep)
+    usecols = [col for col in header if columns is None or col in columns]
+    stat = os.stat(file_path)
+
+    use_cache = use_cache and ARROW_AVAILABLE
+    if use_cache:
+        cache_file, meta_file = _cache_paths(file_path, usecols, cache_dir)
+        df = _read_cache(cache_file, meta_file, file_path, stat)
+        if df is not None:
+            print(f"♻️ Data dimuat dari cache binary ({os.path.basename(cache_file)})")
+            return df
+
+    # Hash dihitung sebelum parse agar cache tidak pernah lebih baru dari meta-nya
+    sha256 = _file_sha256(file_path) if use_cache else None
+    df = _parse_csv(file_path, usecols, sep)
+    if use_cache:
+        _write_cache(df, cache_file, meta_file, file_path, stat, sha256, usecols)
+    return df
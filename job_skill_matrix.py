@@ -0,0 +1,138 @@
+"""
+JOB-SKILL MATRIX: Sparse Matrix Job × Skill (Snapshot)
+CSR matrix biner + vocabulary yang dipakai bersama oleh analisis lanjutan
+"""
+
+import os
+
+import numpy as np
+from scipy import sparse
+
+from artifact_io import load_json, atomic_write_json
+
+MATRIX_FILE = 'job_skill_matrix.npz'
+MATRIX_META_FILE = 'job_skill_matrix_meta.json'
+# Role id untuk judul yang tidak terpetakan ke role cluster mana pun
+UNASSIGNED_ROLE = '__unassigned__'
+
+def build_job_skill_csr(extracted_jobs, skills=None):
+    """
+    Bangun CSR matrix biner (jobs × skills) dari hasil ekstraksi
+    Return: (csr_matrix, skills)
+    """
+    if skills is None:
+        skills = sorted({skill for job in extracted_jobs for skill in job['required_skills']})
+    skill_index = {skill: i for i, skill in enumerate(skills)}
+
+    indptr = np.zeros(len(extracted_jobs) + 1, dtype=np.int64)
+    indices = []
+    for row, job in enumerate(extracted_jobs):
+        indices.extend(sorted({skill_index[skill] for skill in job['required_skills'] if skill in skill_index}))
+        indptr[row + 1] = len(indices)
+
+    indices = np.asarray(indices, dtype=np.int32)
+    data = np.ones(len(indices), dtype=np.uint8)
+    matrix = sparse.csr_matrix((data, indices, indptr), shape=(len(extracted_jobs), len(skills)))
+
+    return matrix, list(skills)
+
+def role_ids(job_titles, title_table, roles):
+    """
+    Role id per job; role_for_title hanya dipanggil sekali per judul unik
+    """
+    titles, inverse = np.unique(np.asarray(job_titles, dtype=str), return_inverse=True)
+    role_index = {role: i for i, role in enumerate(roles)}
+    unique_roles = np.fromiter(
+        (role_index[title_table.role_for_title(title) or UNASSIGNED_ROLE] for title in titles),
+        dtype=np.int64, count=len(titles)
+    )
+    return unique_roles[inverse]
+
+def group_counts(matrix, group_ids, n_groups):
+    """
+    Sparse group-by: (jumlah job per grup, jumlah job per grup × skill)
+    """
+    n_jobs = matrix.shape[0]
+    indicator = sparse.csr_matrix(
+        (np.ones(n_jobs, dtype=np.int64), (group_ids, np.arange(n_jobs))),
+        shape=(n_groups, n_jobs)
+    )
+    counts = (indicator @ matrix.astype(np.int64)).toarray()
+    return np.bincount(group_ids, minlength=n_groups), counts
+
+class JobSkillSnapshot:
+    """
+    Satu snapshot hasil ekstraksi: matrix + vocabulary skill + metadata job
+    """
+
+    def __init__(self, matrix, skills, job_ids, job_titles, companies):
+        self.matrix = matrix
+        self.skills = list(skills)
+        self.job_ids = list(job_ids)
+        self.job_titles = list(job_titles)
+        self.companies = list(companies)
+        self._skill_index = None
+
+    @classmethod
+    def from_extraction(cls, extracted_jobs, skills=None):
+        matrix, skills = build_job_skill_csr(extracted_jobs, skills)
+        return cls(
+            matrix=matrix,
+            skills=skills,
+            job_ids=[job['job_id'] for job in extracted_jobs],
+            job_titles=[str(job['job_title']) for job in extracted_jobs],
+            companies=[str(job['company']) for job in extracted_jobs]
+        )
+
+    @property
+    def skill_index(self):
+        if self._skill_index is None:
+            self._skill_index = {skill: i for i, skill in enumerate(self.skills)}
+        return self._skill_index
+
+    def skill_vector(self, skills):
+        """
+        Vektor biner (float32) untuk sekumpulan skill; skill tak dikenal diabaikan
+        """
+        vector = np.zeros(len(self.skills), dtype=np.float32)
+        for skill in skills:
+            if skill in self.skill_index:
+                vector[self.skill_index[skill]] = 1
+        return vector
+
+    def save(self, directory='.'):
+        os.makedirs(directory, exist_ok=True)
+        matrix_path = os.path.join(directory, MATRIX_FILE)
+        tmp_path = os.path.join(directory, '.tmp_' + MATRIX_FILE)
+        sparse.save_npz(tmp_path, self.matrix)
+        os.replace(tmp_path, matrix_path)
+
+        atomic_write_json(os.path.join(directory, MATRIX_META_FILE), {
+            'shape': list(self.matrix.shape),
+            'skills': self.skills,
+            'job_ids': self.job_ids,
+            'job_titles': self.job_titles,
+            'companies': self.companies
+        }, indent=None)
+
+    @classmethod
+    def load(cls, directory='.'):
+        """
+        Load snapshot; fallback build dari extracted_skills_database.json
+        """
+        meta = load_json(os.path.join(directory, MATRIX_META_FILE))
+        matrix_path = os.path.join(directory, MATRIX_FILE)
+
+        if meta is not None and os.path.exists(matrix_path):
+            return cls(
+                matrix=sparse.load_npz(matrix_path).tocsr(),
+                skills=meta['skills'],
+                job_ids=meta['job_ids'],
+                job_titles=meta['job_titles'],
+                companies=meta['companies']
+            )
+
+        extracted_jobs = load_json(os.path.join(directory, 'extracted_skills_database.json'))
+        if extracted_jobs is None:
+            raise FileNotFoundError(f"Snapshot job-skill matrix tidak ditemukan di '{directory}'")
+        return cls.from_extraction(extracted_jobs)
@@ -0,0 +1,135 @@
+"""
+LEARNING PLAN OPTIMIZER: Urutan Skill Minimal untuk Target Qualification Rate
+Lazy-greedy set multicover atas lowongan role target: setiap lowongan butuh
+ceil(threshold * |skill job|) skill, tiap langkah memilih skill dengan
+progress terbesar menuju lowongan yang belum terpenuhi
+"""
+
+import time
+import heapq
+import argparse
+
+import numpy as np
+
+from mmap_matrix import MMAP_DIR
+from qualification_coverage import QualificationScorer, QUALIFIED_THRESHOLD
+from title_normalization import TitleRoleTable
+
+TARGET_QUALIFIED_RATE = 0.5
+MAX_PLAN_SKILLS = 30
+
+def optimize_learning_plan(scorer, user_skills, role=None, target_rate=TARGET_QUALIFIED_RATE,
+                           threshold=QUALIFIED_THRESHOLD, max_skills=MAX_PLAN_SKILLS):
+    """
+    Pilih skill satu per satu sampai share lowongan dengan coverage >= threshold
+    mencapai target_rate.
+
+    Fungsi objektif f(S) = sum_job min(hits, required) / required bersifat
+    submodular, sehingga gain yang sudah dihitung adalah batas atas gain
+    terkini: cukup hitung ulang skill di puncak heap (lazy greedy).
+    """
+    matrix, row_nnz = scorer.role_matrix(role)
+    has_skills = row_nnz > 0
+    matrix, row_nnz = matrix[has_skills], row_nnz[has_skills]
+    total = matrix.shape[0]
+    user_vector = scorer.user_vector(user_skills)
+
+    hits = (matrix @ user_vector).astype(np.int64)
+    required = np.ceil(threshold * row_nnz - 1e-9).astype(np.int64)
+    weights = 1.0 / np.maximum(required, 1)
+    qualified = int(np.count_nonzero(hits >= required))
+
+    plan = {
+        'role': role,
+        'threshold': threshold,
+        'target_rate': target_rate,
+        'jobs': total,
+        'qualified_before': qualified,
+        'steps': []
+    }
+    if not total:
+        plan.update(qualified_after=0, reached=False)
+        return plan
+
+    # Kolom = skill → baris lowongan yang memintanya
+    columns = matrix.tocsc()
+    indptr, indices = columns.indptr, columns.indices
+
+    gains = columns.T @ (weights * (hits < required))
+    heap = [(-gain, skill) for skill, gain in enumerate(gains) if gain > 0 and not user_vector[skill]]
+    heapq.heapify(heap)
+
+    while qualified < target_rate * total and heap and len(plan['steps']) < max_skills:
+        _, skill = heapq.heappop(heap)
+        rows = indices[indptr[skill]:indptr[skill + 1]]
+        unmet = rows[hits[rows] < required[rows]]
+        gain = weights[unmet].sum()
+        if not gain:
+            continue
+        if heap and gain < -heap[0][0]:
+            heapq.heappush(heap, (-gain, skill))
+            continue
+
+        # Update inkremental: hanya lowongan yang meminta skill ini yang berubah
+        hits[unmet] += 1
+        newly_qualified = int(np.count_nonzero(hits[unmet] == required[unmet]))
+        qualified += newly_qualified
+        plan['steps'].append({
+            'skill': scorer.skills[skill],
+            'newly_qualified': newly_qualified,
+            'qualified_jobs': qualified,
+            'qualified_rate': qualified / total
+        })
+
+    plan['qualified_after'] = qualified
+    plan['reached'] = qualified >= target_rate * total
+    return plan
+
+def print_plan(plan, label):
+    total = plan['jobs']
+    if not total:
+        print(f"❌ {label}: tidak ada lowongan")
+        return
+    print(f"\n🧭 {label}: target {plan['target_rate']:.0%} lowongan dengan coverage ≥{plan['threshold']:.0%}")
+    print(f"   Saat ini: {plan['qualified_before']:,}/{total:,} ({plan['qualified_before'] / total * 100:.1f}%)")
+    for i, step in enumerate(plan['steps'], 1):
+        print(f"   {i:2d}. {step['skill']:<25} +{step['newly_qualified']:,} → "
+              f"{step['qualified_rate'] * 100:5.1f}%")
+    if plan['reached']:
+        print(f"   ✅ Target tercapai dengan {len(plan['steps'])} skill")
+    else:
+        print(f"   ⚠️ Target belum tercapai ({plan['qualified_after'] / total * 100:.1f}%)")
+
+def main():
+    parser = argparse.ArgumentParser(description='Rencana belajar minimal untuk target qualification rate')
+    parser.add_argument('skills', help='Daftar skill, pisahkan dengan koma')
+    parser.add_argument('--target', help='Posisi target (dipetakan ke role cluster)')
+    parser.add_argument('--rate', type=float, default=TARGET_QUALIFIED_RATE, help='Target share lowongan')
+    parser.add_argument('--threshold', type=float, default=QUALIFIED_THRESHOLD)
+    parser.add_argument('--max-skills', type=int, default=MAX_PLAN_SKILLS)
+    parser.add_argument('--dir', default=MMAP_DIR)
+    args = parser.parse_args()
+
+    print("🧭 LEARNING PLAN OPTIMIZER")
+    print("="*50)
+
+    scorer = QualificationScorer.load(args.dir)
+    user_skills = [skill.strip().lower() for skill in args.skills.split(',') if skill.strip()]
+
+    role = None
+    if args.target:
+        role = TitleRoleTable.load().resolve_target(args.target.lower())
+        if role not in scorer.role_index:
+            print(f"⚠️ '{args.target}' tidak terpetakan ke role cluster, memakai semua lowongan")
+            role = None
+
+    start = time.perf_counter()
+    plan = optimize_learning_plan(scorer, user_skills, role=role, target_rate=args.rate,
+                                  threshold=args.threshold, max_skills=args.max_skills)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print_plan(plan, f"Role {role}" if role else 'Semua lowongan')
+    print(f"\n⚡ Rencana dihitung dalam {elapsed:.1f} ms")
+
+if __name__ == "__main__":
+    main()
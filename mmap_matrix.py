@@ -0,0 +1,243 @@
+"""
+MMAP MATRIX: Job-Skill Matrix dalam Layout Binary Memory-Mappable
+Array CSR, role profile, dan kolom string disimpan sebagai file .npy
+terpisah lalu dibuka dengan mmap_mode='r': banyak proses berbagi satu
+salinan di page cache, load time konstan terhadap ukuran korpus.
+Setiap export ditulis ke direktori versi baru (job_skill_mmap.v<ns>) lalu
+pointer file job_skill_mmap.current diganti secara atomic, sehingga tidak
+ada saat di mana layout aktif tidak ada
+"""
+
+import os
+import time
+import shutil
+import argparse
+
+import numpy as np
+from scipy import sparse
+
+from artifact_io import load_json, atomic_write_json
+from job_skill_matrix import JobSkillSnapshot, role_ids, group_counts, UNASSIGNED_ROLE
+from title_normalization import TitleRoleTable
+
+MMAP_DIR = 'job_skill_mmap'
+MMAP_VOCAB_FILE = 'vocab.json'
+MMAP_POINTER_SUFFIX = '.current'
+# Versi sebelumnya dipertahankan untuk pembaca yang sudah me-resolve pointer lama
+MMAP_KEEP_VERSIONS = 2
+STRING_COLUMNS = ['job_ids', 'job_titles', 'companies']
+
+def _save_strings(directory, name, values):
+    """
+    Kolom string sebagai blob UTF-8 + offsets (keduanya mmap-able)
+    """
+    encoded = [str(value).encode('utf-8') for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(value) for value in encoded], out=offsets[1:])
+    np.save(os.path.join(directory, f"{name}_offsets.npy"), offsets)
+    np.save(os.path.join(directory, f"{name}_blob.npy"), np.frombuffer(b''.join(encoded), dtype=np.uint8))
+
+class MappedStrings:
+    """
+    Akses kolom string secara lazy; hanya elemen yang dibaca yang di-decode
+    """
+
+    def __init__(self, directory, name):
+        self.offsets = np.load(os.path.join(directory, f"{name}_offsets.npy"), mmap_mode='r')
+        self.blob = np.load(os.path.join(directory, f"{name}_blob.npy"), mmap_mode='r')
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        start, end = self.offsets[i], self.offsets[i + 1]
+        return self.blob[start:end].tobytes().decode('utf-8')
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+def mmap_pointer_file(directory=MMAP_DIR):
+    return directory.rstrip(os.sep) + MMAP_POINTER_SUFFIX
+
+def resolve_mmap_dir(directory=MMAP_DIR):
+    """
+    Direktori versi aktif yang ditunjuk pointer file; tanpa pointer
+    (layout lama / path eksplisit) directory dipakai apa adanya
+    """
+    pointer = load_json(mmap_pointer_file(directory))
+    if pointer is None:
+        return directory
+    return os.path.join(os.path.dirname(directory.rstrip(os.sep)), pointer['version'])
+
+def prune_mmap_versions(directory=MMAP_DIR, keep=MMAP_KEEP_VERSIONS):
+    """
+    Hapus direktori versi lama (dan layout non-versi) selain `keep` versi
+    terbaru; versi aktif tidak pernah dihapus
+    """
+    base = directory.rstrip(os.sep)
+    parent = os.path.dirname(base) or '.'
+    prefix = os.path.basename(base) + '.v'
+    versions = sorted((name for name in os.listdir(parent)
+                       if name.startswith(prefix) and name[len(prefix):].isdigit()),
+                      key=lambda name: int(name[len(prefix):]))
+    active = os.path.basename(resolve_mmap_dir(directory))
+    for name in versions[:-keep]:
+        if name != active:
+            # ignore_errors: Windows menolak menghapus file yang masih di-mmap
+            shutil.rmtree(os.path.join(parent, name), ignore_errors=True)
+    if len(versions) >= keep and os.path.isdir(base) and active != os.path.basename(base):
+        shutil.rmtree(base, ignore_errors=True)
+
+def export_mmap(snapshot, directory=MMAP_DIR, title_table=None):
+    """
+    Tulis snapshot + role profile ke direktori versi baru lalu ganti pointer
+    file secara atomic; proses yang masih me-mmap versi lama tetap membaca
+    data yang konsisten. Return: direktori versi yang ditulis
+    """
+    if title_table is None:
+        try:
+            title_table = TitleRoleTable.load()
+        except FileNotFoundError:
+            title_table = None
+
+    matrix = snapshot.matrix.tocsr()
+    matrix.sort_indices()
+    # indptr & indices dtype sama agar scipy tidak meng-copy saat load
+    index_dtype = np.int32 if matrix.nnz < np.iinfo(np.int32).max else np.int64
+
+    if title_table is not None:
+        roles = sorted(title_table.role_keywords) + [UNASSIGNED_ROLE]
+        job_roles = role_ids(snapshot.job_titles, title_table, roles)
+    else:
+        roles = [UNASSIGNED_ROLE]
+        job_roles = np.zeros(matrix.shape[0], dtype=np.int64)
+    role_job_counts, role_skill_counts = group_counts(matrix, job_roles, len(roles))
+
+    base = directory.rstrip(os.sep)
+    version = f"{os.path.basename(base)}.v{time.time_ns()}"
+    version_dir = os.path.join(os.path.dirname(base), version)
+    os.makedirs(version_dir)
+
+    np.save(os.path.join(version_dir, 'indptr.npy'), matrix.indptr.astype(index_dtype))
+    np.save(os.path.join(version_dir, 'indices.npy'), matrix.indices.astype(index_dtype))
+    np.save(os.path.join(version_dir, 'data.npy'), matrix.data.astype(np.uint8))
+    np.save(os.path.join(version_dir, 'job_roles.npy'), job_roles.astype(np.int32))
+    np.save(os.path.join(version_dir, 'role_job_counts.npy'), role_job_counts.astype(np.int64))
+    np.save(os.path.join(version_dir, 'role_skill_counts.npy'), role_skill_counts.astype(np.int32))
+    for name in STRING_COLUMNS:
+        _save_strings(version_dir, name, getattr(snapshot, name))
+
+    atomic_write_json(os.path.join(version_dir, MMAP_VOCAB_FILE), {
+        'shape': list(matrix.shape),
+        'nnz': int(matrix.nnz),
+        'skills': snapshot.skills,
+        'roles': roles
+    }, indent=None)
+
+    # Pointer diganti terakhir: pembaca melihat versi lama atau versi baru yang lengkap
+    atomic_write_json(mmap_pointer_file(directory), {'version': version}, indent=None)
+    prune_mmap_versions(directory)
+    return version_dir
+
+class MappedJobSkillMatrix:
+    """
+    View read-only (zero-copy) atas layout mmap: matrix CSR, role profile, vocab
+    """
+
+    def __init__(self, directory=MMAP_DIR):
+        directory = resolve_mmap_dir(directory)
+        vocab = load_json(os.path.join(directory, MMAP_VOCAB_FILE))
+        if vocab is None:
+            raise FileNotFoundError(f"Layout mmap tidak ditemukan di '{directory}'. Jalankan 'mmap_matrix.py build'.")
+
+        def mapped(name):
+            return np.load(os.path.join(directory, f"{name}.npy"), mmap_mode='r')
+
+        self.skills = vocab['skills']
+        self.roles = vocab['roles']
+        self.matrix = sparse.csr_matrix(
+            (mapped('data'), mapped('indices'), mapped('indptr')),
+            shape=tuple(vocab['shape']), copy=False
+        )
+        self.job_roles = mapped('job_roles')
+        self.role_job_counts = mapped('role_job_counts')
+        self.role_skill_counts = mapped('role_skill_counts')
+        for name in STRING_COLUMNS:
+            setattr(self, name, MappedStrings(directory, name))
+
+        self.skill_index = {skill: i for i, skill in enumerate(self.skills)}
+        self.role_index = {role: i for i, role in enumerate(self.roles)}
+
+    def skill_vector(self, skills):
+        vector = np.zeros(len(self.skills), dtype=np.float32)
+        for skill in skills:
+            if skill in self.skill_index:
+                vector[self.skill_index[skill]] = 1
+        return vector
+
+    def role_profile(self, role):
+        """
+        {skill: persentase lowongan role yang meminta skill}, terurut menurun
+        """
+        r = self.role_index.get(role)
+        if r is None or not self.role_job_counts[r]:
+            return {}
+        counts = self.role_skill_counts[r]
+        order = np.argsort(-counts, kind='stable')
+        total = int(self.role_job_counts[r])
+        return {self.skills[i]: float(counts[i]) / total * 100 for i in order if counts[i]}
+
+    def role_rows(self, role):
+        """
+        Index baris job milik sebuah role cluster
+        """
+        return np.flatnonzero(np.asarray(self.job_roles) == self.role_index[role])
+
+    def job(self, row):
+        start, end = self.matrix.indptr[row], self.matrix.indptr[row + 1]
+        return {
+            'job_id': self.job_ids[row],
+            'job_title': self.job_titles[row],
+            'company': self.companies[row],
+            'required_skills': [self.skills[i] for i in self.matrix.indices[start:end]]
+        }
+
+def main():
+    parser = argparse.ArgumentParser(description='Job-skill matrix dalam layout memory-mappable')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build = subparsers.add_parser('build', help='Export snapshot job-skill matrix ke layout mmap')
+    build.add_argument('--snapshot-dir', default='.')
+    build.add_argument('--output', default=MMAP_DIR)
+
+    profile = subparsers.add_parser('profile', help='Role profile dari layout mmap')
+    profile.add_argument('role')
+    profile.add_argument('--n', type=int, default=15)
+    profile.add_argument('--dir', default=MMAP_DIR)
+
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        print("🗺️ EXPORT JOB-SKILL MATRIX (MMAP LAYOUT)")
+        print("="*50)
+        snapshot = JobSkillSnapshot.load(args.snapshot_dir)
+        version_dir = export_mmap(snapshot, args.output)
+        print(f"✅ {snapshot.matrix.shape[0]:,} jobs × {len(snapshot.skills):,} skills → {version_dir}/")
+        return
+
+    start = time.perf_counter()
+    mapped = MappedJobSkillMatrix(args.dir)
+    load_ms = (time.perf_counter() - start) * 1000
+    print(f"⚡ Layout mmap dibuka dalam {load_ms:.1f} ms ({mapped.matrix.shape[0]:,} jobs)")
+
+    role = TitleRoleTable.load().resolve_target(args.role.lower()) or args.role
+    percentages = mapped.role_profile(role)
+    if not percentages:
+        print(f"❌ Tidak ada data untuk role '{args.role}'")
+        return
+    print(f"\n👔 {role} ({int(mapped.role_job_counts[mapped.role_index[role]]):,} lowongan)")
+    for skill, percentage in list(percentages.items())[:args.n]:
+        print(f"   • {skill}: {percentage:.1f}%")
+
+if __name__ == "__main__":
+    main()
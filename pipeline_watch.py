@@ -0,0 +1,365 @@
+"""
+PIPELINE WATCH: Watch Mode untuk File Scrape Baru
+Memantau job_links_*.csv, glints_scraped_clean.csv, job_keyword.txt dan
+kamus skill; setiap perubahan hanya menjalankan langkah hilir yang
+terdampak (fetch link baru, cleaning + ekstraksi posting baru, update
+matrix/frekuensi/profil role/profil company) lalu mem-publish artifact
+secara atomic
+"""
+
+import os
+import csv
+import glob
+import time
+import shutil
+import asyncio
+import hashlib
+import argparse
+import threading
+from collections import Counter
+
+from artifact_io import load_json, atomic_write_json
+from build_skills_database import COMPILED_DB_FILE
+from compact_evidence import EvidenceBuilder, CompactEvidence, EVIDENCE_FILE
+from company_profiles import CompanySkillProfiles
+from fase1_persiapan_data import DataPreparation
+from fase2_ekstraksi_informasi import SkillExtraction, PATTERN_CACHE_FILE
+from extraction_store import write_extraction_store, STORE_FILE
+from job_skill_matrix import JobSkillSnapshot
+from mmap_matrix import export_mmap, prune_mmap_versions, MMAP_DIR
+from title_normalization import TitleRoleTable, JOB_KEYWORD_FILE
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+
+DATA_FILE = 'glints_scraped_clean.csv'
+LINKS_PATTERN = os.path.join('scrap result', 'job_links_*.csv')
+FETCH_CACHE_DIR = 'fetch_cache'
+WATCH_STATE_FILE = 'pipeline_watch_state.json'
+STAGING_DIR = '.pipeline_staging'
+POLL_INTERVAL = 2.0
+DEBOUNCE_SECONDS = 5.0
+
+def posting_key(values):
+    """
+    Identitas isi satu baris mentah; baris dengan key yang sama menghasilkan
+    cleaned_text dan hasil ekstraksi yang sama
+    """
+    key = '\x1f'.join(str(value) for value in values)
+    return hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+
+def publish_staged(staging_dir=STAGING_DIR, output_dir='.'):
+    """
+    Pindahkan artifact dari staging ke output: direktori dulu (selalu direktori
+    versi baru, mis. job_skill_mmap.v<ns>, tidak pernah menimpa yang aktif),
+    lalu file via os.replace (atomic) termasuk pointer versi mmap; pembaca
+    tidak pernah melihat file setengah jadi atau direktori yang hilang
+    """
+    names = sorted(os.listdir(staging_dir), key=lambda name: (not os.path.isdir(os.path.join(staging_dir, name)), name))
+    published = []
+    for name in names:
+        source, target = os.path.join(staging_dir, name), os.path.join(output_dir, name)
+        if os.path.isdir(source):
+            if os.path.exists(target):
+                raise FileExistsError(f"Direktori '{target}' sudah ada; artifact direktori harus berversi")
+            os.rename(source, target)
+        else:
+            os.replace(source, target)
+        published.append(name)
+    os.rmdir(staging_dir)
+    prune_mmap_versions(os.path.join(output_dir, MMAP_DIR))
+    return published
+
+class PipelineWatcher:
+    """
+    Update inkremental artifact Fase 1-2 berdasarkan input yang berubah
+    """
+
+    def __init__(self, data_file=DATA_FILE, links_pattern=LINKS_PATTERN, fetch_links=True,
+                 compact_evidence=True, state_file=WATCH_STATE_FILE):
+        self.data_file = data_file
+        self.links_pattern = links_pattern
+        self.fetch_links = fetch_links
+        self.compact_evidence = compact_evidence
+        self.state_file = state_file
+        self.state = load_json(state_file, {})
+
+    def input_signature(self):
+        """
+        {path: [mtime_ns, size]} untuk semua input yang dipantau
+        """
+        paths = [self.data_file, JOB_KEYWORD_FILE, COMPILED_DB_FILE] + sorted(glob.glob(self.links_pattern))
+        signature = {}
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            signature[path] = [stat.st_mtime_ns, stat.st_size]
+        return signature
+
+    def changed_inputs(self, signature=None):
+        signature = self.input_signature() if signature is None else signature
+        previous = self.state.get('inputs', {})
+        return sorted(path for path in set(signature) | set(previous)
+                      if signature.get(path) != previous.get(path))
+
+    def run_once(self):
+        """
+        Satu siklus update; False jika tidak ada input yang berubah
+        """
+        changed = self.changed_inputs()
+        if not changed:
+            return False
+
+        print(f"\n🔔 Input berubah: {', '.join(changed)}")
+        start = time.perf_counter()
+
+        links_changed = any(path not in (self.data_file, JOB_KEYWORD_FILE, COMPILED_DB_FILE)
+                            for path in changed)
+        if links_changed and self.fetch_links:
+            self.update_job_links()
+
+        # Data file bisa berubah karena append dari update_job_links
+        postings_stale = (COMPILED_DB_FILE in changed
+                          or self.state.get('data_signature') != self.input_signature().get(self.data_file))
+        success = True
+        if postings_stale and os.path.exists(self.data_file):
+            success = self.update_postings()
+        elif JOB_KEYWORD_FILE in changed and os.path.exists('extracted_skills_database.json'):
+            success = self.update_role_profiles()
+        if not success:
+            print("❌ Update gagal, artifact lama tetap dipakai; dicoba lagi pada perubahan berikutnya")
+            return True
+
+        self.state['inputs'] = self.input_signature()
+        self.state['data_signature'] = self.state['inputs'].get(self.data_file)
+        self.state['generation'] = self.state.get('generation', 0) + 1
+        atomic_write_json(self.state_file, self.state)
+
+        print(f"✅ Siklus #{self.state['generation']} selesai dalam {time.perf_counter() - start:.1f} detik")
+        return True
+
+    def update_job_links(self):
+        """
+        Fetch hanya link yang belum pernah berhasil diambil, lalu append ke data file
+        """
+        # Import ditunda: aiohttp hanya dibutuhkan jika ada link baru
+        from async_job_fetcher import read_job_links, AsyncJobFetcher, OUTPUT_COLUMNS
+
+        fetched = set(self.state.get('fetched_links', []))
+        new_links = [(url, keyword) for url, keyword in read_job_links(self.links_pattern) if url not in fetched]
+        if not new_links:
+            print("🔗 Tidak ada link baru")
+            return 0
+
+        print(f"🔗 {len(new_links):,} link baru, fetch detail lowongan...")
+        fetcher = AsyncJobFetcher(cache_dir=FETCH_CACHE_DIR)
+        rows = asyncio.run(fetcher.fetch_all(new_links))
+
+        # Link yang gagal tidak dicatat, dicoba lagi pada siklus berikutnya
+        self.state['fetched_links'] = sorted(fetched | {url for url, _ in new_links
+                                                        if fetcher.is_cached(url)})
+        if rows:
+            self._append_rows(rows, OUTPUT_COLUMNS)
+        print(f"✅ {len(rows):,} lowongan baru ditambahkan ke {self.data_file} (gagal: {fetcher.stats['failed']:,})")
+        return len(rows)
+
+    def _append_rows(self, rows, default_columns):
+        """
+        Salin data file + baris baru ke file sementara lalu os.replace;
+        baris lama tetap di posisi yang sama sehingga job_id tidak bergeser
+        """
+        tmp_path = self.data_file + '.tmp'
+        exists = os.path.exists(self.data_file)
+        with open(tmp_path, 'w', encoding='utf-8', newline='') as out:
+            if exists:
+                with open(self.data_file, 'r', encoding='utf-8', newline='') as f:
+                    columns = next(csv.reader(f, delimiter=';'))
+                    f.seek(0)
+                    content = f.read()
+                out.write(content if content.endswith('\n') else content + '\n')
+            else:
+                columns = default_columns
+            writer = csv.DictWriter(out, fieldnames=columns, delimiter=';', extrasaction='ignore', restval='')
+            if not exists:
+                writer.writeheader()
+            writer.writerows(rows)
+        os.replace(tmp_path, self.data_file)
+
+    def _posting_cache(self, dictionary_hash):
+        """
+        {posting_key: index job} dari artifact sebelumnya; kosong jika kamus,
+        mode evidence, atau artifact tidak cocok dengan state terakhir
+        """
+        row_keys = self.state.get('row_keys')
+        if (not row_keys or self.state.get('dictionary_hash') != dictionary_hash
+                or self.state.get('compact_evidence') != self.compact_evidence
+                or not os.path.exists(EVIDENCE_FILE)):
+            return {}, None, None
+        jobs = load_json('extracted_skills_database.json')
+        # Artifact sebelum text_hash ada diekstraksi ulang agar formatnya seragam
+        if jobs is None or len(jobs) != len(row_keys) or any('text_hash' not in job for job in jobs[:1]):
+            return {}, None, None
+        return {key: i for i, key in enumerate(row_keys)}, jobs, CompactEvidence.load()
+
+    def update_postings(self):
+        """
+        Cleaning + ekstraksi hanya untuk baris baru/berubah; baris lain memakai
+        hasil sebelumnya. Output identik dengan run Fase 1-2 penuh.
+        """
+        print(f"\n📥 UPDATE POSTING: {self.data_file}")
+        print("="*50)
+
+        data_prep = DataPreparation()
+        if not data_prep.step_1_1_data_collection(self.data_file) or not data_prep.step_1_3_build_skills_dictionary():
+            return False
+        raw_data = data_prep.raw_data
+        keys = [posting_key(values) for values in raw_data.itertuples(index=False, name=None)]
+
+        cache, old_jobs, old_evidence = self._posting_cache(data_prep.dictionary_hash)
+        new_rows = [key not in cache for key in keys]
+        print(f"♻️ {len(keys) - sum(new_rows):,} posting dipakai ulang, {sum(new_rows):,} posting baru/berubah")
+
+        extractor = SkillExtraction(data_prep, compact_evidence=self.compact_evidence)
+        data_prep.raw_data = raw_data[new_rows]
+        if any(new_rows):
+            if not data_prep.step_1_2_text_preprocessing():
+                return False
+            if not extractor.step_2_1_design_extraction_method() or not extractor.step_2_2_mass_extraction():
+                return False
+            delta_jobs = {job['job_id']: job for job in extractor.extracted_skills_db}
+            delta_evidence = extractor.evidence
+        elif not extractor.step_2_1_design_extraction_method():
+            return False
+
+        # Gabungkan dengan urutan baris data file (sama seperti run penuh)
+        jobs = []
+        builder = EvidenceBuilder(extractor.skill_patterns.keys())
+        for idx, key, is_new in zip(raw_data.index, keys, new_rows):
+            job_id = f"job_{idx}"
+            if is_new:
+                job, evidence, source_id = delta_jobs[job_id], delta_evidence, job_id
+            else:
+                old_job = old_jobs[cache[key]]
+                job, evidence, source_id = dict(old_job, job_id=job_id), old_evidence, old_job['job_id']
+            jobs.append(job)
+            builder.add_job(job_id, {skill: evidence.spans(source_id, skill)
+                                     for skill, _ in evidence.skills_for_job(source_id)})
+
+        merged = SkillExtraction(compact_evidence=self.compact_evidence)
+        merged.skill_patterns = extractor.skill_patterns
+        merged.extracted_skills_db = jobs
+        merged.skill_frequency = dict(Counter(skill for job in jobs for skill in job['required_skills']))
+        merged.evidence = builder.build()
+        merged._create_job_skill_matrix()
+
+        # Judul baru dinormalisasi sekali, role cluster ikut ter-update
+        title_table = TitleRoleTable.load()
+        title_table.build(job['job_title'] for job in jobs)
+        title_table.save()
+
+        shutil.rmtree(STAGING_DIR, ignore_errors=True)
+        merged.save_extraction_results(STAGING_DIR)
+        # Profil company dari snapshot yang sama; tanpa ini company_profiles.py membaca posting lama
+        CompanySkillProfiles.build(merged.job_skill_snapshot).save(STAGING_DIR)
+        published = publish_staged(STAGING_DIR)
+        print(f"📤 Dipublish: {', '.join(published)}")
+
+        self.state.update(row_keys=keys, dictionary_hash=data_prep.dictionary_hash,
+                          compact_evidence=self.compact_evidence)
+        return True
+
+    def update_role_profiles(self):
+        """
+        job_keyword.txt berubah: tanpa ekstraksi ulang, cukup bangun ulang
+        tabel judul lalu role cluster di SQLite store dan layout mmap
+        """
+        print(f"\n🏷️ UPDATE ROLE PROFILE: {JOB_KEYWORD_FILE}")
+        print("="*50)
+
+        jobs = load_json('extracted_skills_database.json')
+        title_table = TitleRoleTable.load()
+        title_table.build(job['job_title'] for job in jobs)
+        title_table.save()
+
+        patterns = (load_json(PATTERN_CACHE_FILE) or {}).get('skill_patterns', {})
+        shutil.rmtree(STAGING_DIR, ignore_errors=True)
+        os.makedirs(STAGING_DIR)
+        write_extraction_store(jobs, load_json('skill_frequency.json'),
+                               {skill: info['category'] for skill, info in patterns.items()},
+                               os.path.join(STAGING_DIR, STORE_FILE))
+        export_mmap(JobSkillSnapshot.load(), os.path.join(STAGING_DIR, MMAP_DIR), title_table)
+        published = publish_staged(STAGING_DIR)
+        print(f"📤 Dipublish: {', '.join(published)}")
+        return True
+
+    def watch(self, interval=POLL_INTERVAL, debounce=DEBOUNCE_SECONDS):
+        """
+        Loop utama: notifikasi file-system (watchdog) jika terpasang, polling
+        jika tidak. Update baru dijalankan setelah input tidak berubah
+        selama `debounce` detik (file yang sedang ditulis tidak diproses).
+        """
+        wake = threading.Event()
+        observer = None
+        if Observer is not None:
+            handler = FileSystemEventHandler()
+            handler.on_any_event = lambda event: wake.set()
+            observer = Observer()
+            for directory in {os.path.dirname(self.links_pattern) or '.', '.'}:
+                if os.path.isdir(directory):
+                    observer.schedule(handler, directory, recursive=False)
+            observer.start()
+        print(f"👀 Memantau input ({'watchdog' if observer else f'polling {interval:g} detik'}, "
+              f"debounce {debounce:g} detik). Ctrl+C untuk berhenti.")
+
+        pending, pending_since = None, None
+        try:
+            while True:
+                signature = self.input_signature()
+                if not self.changed_inputs(signature):
+                    pending = None
+                elif signature != pending:
+                    pending, pending_since = signature, time.monotonic()
+                elif time.monotonic() - pending_since >= debounce:
+                    self.run_once()
+                    pending = None
+
+                timeout = debounce if pending else (interval * 15 if observer else interval)
+                wake.wait(timeout)
+                wake.clear()
+        except KeyboardInterrupt:
+            print("\n👋 Watch mode dihentikan")
+        finally:
+            if observer:
+                observer.stop()
+                observer.join()
+
+def main():
+    parser = argparse.ArgumentParser(description='Watch mode: update pipeline inkremental saat input berubah')
+    parser.add_argument('--data-file', default=DATA_FILE)
+    parser.add_argument('--links', default=LINKS_PATTERN, help='Glob file job links')
+    parser.add_argument('--no-fetch', action='store_true', help='Jangan fetch detail untuk link baru')
+    parser.add_argument('--full-evidence', action='store_true')
+    parser.add_argument('--interval', type=float, default=POLL_INTERVAL, help='Interval polling (detik)')
+    parser.add_argument('--debounce', type=float, default=DEBOUNCE_SECONDS)
+    parser.add_argument('--once', action='store_true', help='Satu siklus update lalu keluar')
+    args = parser.parse_args()
+
+    print("👀 PIPELINE WATCH")
+    print("="*50)
+
+    watcher = PipelineWatcher(data_file=args.data_file, links_pattern=args.links,
+                              fetch_links=not args.no_fetch, compact_evidence=not args.full_evidence)
+    if args.once:
+        if not watcher.run_once():
+            print("✅ Semua artifact sudah up to date")
+        return
+    watcher.run_once()
+    watcher.watch(interval=args.interval, debounce=args.debounce)
+
+if __name__ == "__main__":
+    main()
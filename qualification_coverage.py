@@ -0,0 +1,188 @@
+"""
+QUALIFICATION COVERAGE: Distribusi Kecocokan User terhadap Seluruh Lowongan
+coverage[job] = |skill user ∩ skill job| / |skill job|, dihitung untuk semua
+lowongan dengan satu sparse matrix-vector product
+"""
+
+import time
+import argparse
+
+import numpy as np
+
+from job_skill_matrix import JobSkillSnapshot, role_ids, UNASSIGNED_ROLE
+from mmap_matrix import MappedJobSkillMatrix, MMAP_DIR
+from title_normalization import TitleRoleTable
+
+COVERAGE_THRESHOLDS = (0.5, 0.7, 0.9)
+COVERAGE_QUANTILES = (0.25, 0.5, 0.75, 0.9)
+QUALIFIED_THRESHOLD = 0.7
+
+class QualificationScorer:
+    """
+    Scorer vektor di atas job-skill matrix (CSR) + role id per job
+    """
+
+    def __init__(self, matrix, skills, job_roles, roles):
+        self.matrix = matrix
+        self.skills = list(skills)
+        self.skill_index = {skill: i for i, skill in enumerate(self.skills)}
+        self.job_roles = np.asarray(job_roles)
+        self.roles = list(roles)
+        self.role_index = {role: i for i, role in enumerate(self.roles)}
+
+        # Jumlah skill per lowongan; lowongan tanpa skill tidak ikut dihitung
+        self.row_nnz = np.diff(matrix.indptr)
+        self._role_rows = {}
+        self._role_matrices = {}
+
+    @classmethod
+    def load(cls, directory=MMAP_DIR, snapshot_dir='.'):
+        """
+        Pakai layout mmap (zero-copy); fallback ke snapshot job-skill matrix
+        """
+        try:
+            mapped = MappedJobSkillMatrix(directory)
+            return cls(mapped.matrix, mapped.skills, mapped.job_roles, mapped.roles)
+        except FileNotFoundError:
+            snapshot = JobSkillSnapshot.load(snapshot_dir)
+            title_table = TitleRoleTable.load()
+            roles = sorted(title_table.role_keywords) + [UNASSIGNED_ROLE]
+            return cls(snapshot.matrix.tocsr(), snapshot.skills,
+                       role_ids(snapshot.job_titles, title_table, roles), roles)
+
+    def user_vector(self, user_skills):
+        vector = np.zeros(len(self.skills), dtype=np.float32)
+        for skill in user_skills:
+            if skill in self.skill_index:
+                vector[self.skill_index[skill]] = 1
+        return vector
+
+    def role_rows(self, role):
+        if role not in self._role_rows:
+            self._role_rows[role] = np.flatnonzero(self.job_roles == self.role_index[role])
+        return self._role_rows[role]
+
+    def role_matrix(self, role):
+        """
+        (matrix, row_nnz) untuk semua lowongan atau sub-matrix satu role (di-cache)
+        """
+        if role is None:
+            return self.matrix, self.row_nnz
+        if role not in self._role_matrices:
+            rows = self.role_rows(role)
+            self._role_matrices[role] = (self.matrix[rows], self.row_nnz[rows])
+        return self._role_matrices[role]
+
+    def coverage(self, user_skills, rows=None):
+        """
+        Coverage per lowongan (0..1); rows membatasi ke subset baris
+        """
+        matrix = self.matrix if rows is None else self.matrix[rows]
+        row_nnz = self.row_nnz if rows is None else self.row_nnz[rows]
+        hits = matrix @ self.user_vector(user_skills)
+        return hits / np.maximum(row_nnz, 1)
+
+    def distribution(self, user_skills, role=None, thresholds=COVERAGE_THRESHOLDS):
+        """
+        Share lowongan (semua / dalam role) yang coverage-nya >= setiap threshold
+        """
+        matrix, row_nnz = self.role_matrix(role)
+        coverage = (matrix @ self.user_vector(user_skills)) / np.maximum(row_nnz, 1)
+        coverage = coverage[row_nnz > 0]
+
+        total = len(coverage)
+        if not total:
+            return {'role': role, 'jobs': 0}
+
+        qualified = {f"{threshold:.0%}": int(np.count_nonzero(coverage >= threshold))
+                     for threshold in thresholds}
+        return {
+            'role': role,
+            'jobs': total,
+            'mean_coverage': float(coverage.mean()),
+            'quantiles': {f"p{int(q * 100)}": float(value)
+                          for q, value in zip(COVERAGE_QUANTILES, np.quantile(coverage, COVERAGE_QUANTILES))},
+            'qualified_jobs': qualified,
+            'qualified_share': {key: count / total for key, count in qualified.items()}
+        }
+
+    def marginal_gains(self, user_skills, role=None, threshold=QUALIFIED_THRESHOLD):
+        """
+        What-if untuk semua skill sekaligus: berapa lowongan tambahan yang
+        lolos threshold coverage jika user mempelajari satu skill lagi.
+        Hanya lowongan yang kurang tepat satu skill yang bisa berubah status,
+        sehingga gain = column sums sub-matrix baris-baris tersebut.
+        """
+        matrix, row_nnz = self.role_matrix(role)
+        user_vector = self.user_vector(user_skills)
+
+        hits = matrix @ user_vector
+        required = np.ceil(threshold * row_nnz - 1e-9)
+        has_skills = row_nnz > 0
+        one_short = has_skills & (required - hits == 1)
+
+        gains = np.asarray(matrix[one_short].sum(axis=0)).ravel()
+        gains[user_vector > 0] = 0
+
+        order = np.argsort(-gains, kind='stable')
+        return {
+            'role': role,
+            'threshold': threshold,
+            'jobs': int(np.count_nonzero(has_skills)),
+            'qualified_now': int(np.count_nonzero(has_skills & (hits >= required))),
+            'gains': {self.skills[i]: int(gains[i]) for i in order if gains[i] > 0}
+        }
+
+def print_distribution(distribution, label):
+    if not distribution['jobs']:
+        print(f"❌ {label}: tidak ada lowongan")
+        return
+    print(f"\n📐 {label} ({distribution['jobs']:,} lowongan)")
+    print(f"   Rata-rata coverage: {distribution['mean_coverage'] * 100:.1f}%")
+    for key, share in distribution['qualified_share'].items():
+        print(f"   • Coverage ≥{key}: {share * 100:>5.1f}% lowongan "
+              f"({distribution['qualified_jobs'][key]:,})")
+
+def main():
+    parser = argparse.ArgumentParser(description='Distribusi qualification coverage user')
+    parser.add_argument('skills', help='Daftar skill, pisahkan dengan koma')
+    parser.add_argument('--target', help='Posisi target (dipetakan ke role cluster)')
+    parser.add_argument('--dir', default=MMAP_DIR)
+    parser.add_argument('--what-if', action='store_true', help='Ranking marginal gain skill yang belum dimiliki')
+    parser.add_argument('--threshold', type=float, default=QUALIFIED_THRESHOLD)
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    print("📐 QUALIFICATION COVERAGE")
+    print("="*50)
+
+    scorer = QualificationScorer.load(args.dir)
+    user_skills = [skill.strip().lower() for skill in args.skills.split(',') if skill.strip()]
+
+    start = time.perf_counter()
+    overall = scorer.distribution(user_skills)
+    elapsed = (time.perf_counter() - start) * 1000
+    print_distribution(overall, 'Semua lowongan')
+
+    role = None
+    if args.target:
+        role = TitleRoleTable.load().resolve_target(args.target.lower())
+        if role is None or role not in scorer.role_index:
+            print(f"⚠️ '{args.target}' tidak terpetakan ke role cluster")
+        else:
+            print_distribution(scorer.distribution(user_skills, role=role), f"Role {role}")
+
+    print(f"\n⚡ {scorer.matrix.shape[0]:,} lowongan di-score dalam {elapsed:.1f} ms")
+
+    if args.what_if:
+        role = role if role in scorer.role_index else None
+        start = time.perf_counter()
+        what_if = scorer.marginal_gains(user_skills, role=role, threshold=args.threshold)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"\n🔮 WHAT-IF: LOWONGAN TAMBAHAN PER SKILL (coverage ≥{args.threshold:.0%}, {elapsed:.1f} ms)")
+        print(f"   Saat ini lolos: {what_if['qualified_now']:,}/{what_if['jobs']:,} lowongan")
+        for skill, gain in list(what_if['gains'].items())[:args.top]:
+            print(f"   • +{skill}: +{gain:,} lowongan")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+QUERY CLI: Entry Point Ringan untuk Validasi Skill & Gap Analysis
+Hanya memakai artifact yang sudah dikompilasi (skills_dictionary.json,
+title_role_table.json, extraction_store.sqlite) dan modul standard library,
+sehingga cold start cepat (tanpa pandas/numpy)
+"""
+
+import sys
+import json
+import argparse
+
+from fase3_analisis_kesenjangan import GapAnalysis
+
+def _analyzer(skills_input, target_position=''):
+    analyzer = GapAnalysis(use_store=True)
+    analyzer.set_user_input(skills_input, target_position, interactive=False)
+    return analyzer
+
+def validate_skills(skills_input):
+    """
+    Validasi daftar skill (dipisah koma) terhadap kamus skill
+    """
+    user_input = _analyzer(skills_input).user_input
+    return {
+        'valid_skills': user_input['valid_skills'],
+        'unrecognized_skills': user_input['unrecognized_skills'],
+        'suggestions': {skill: suggestion['suggested_skill']
+                        for skill, suggestion in user_input.get('suggestions', {}).items()
+                        if suggestion['suggested_skill']}
+    }
+
+def gap_analysis(skills_input, target_position):
+    """
+    Gap analysis satu posisi target; None jika tidak ada lowongan yang cocok
+    """
+    analyzer = _analyzer(skills_input, target_position)
+    if not analyzer.step_3_2_find_target_job_profile() or not analyzer.step_3_3_gap_analysis():
+        return None
+
+    result = analyzer.gap_analysis_result
+    return {
+        'target_position': target_position,
+        'matching_jobs_count': analyzer.job_profiles['matching_jobs_count'],
+        'match_percentage': result['match_percentage'],
+        'skills_you_have': sorted(result['skills_you_have']),
+        'critical_gaps': [skill for skill, _ in result['critical_gaps']],
+        'important_gaps': [skill for skill, _ in result['important_gaps']],
+        'total_gaps': result['total_gaps']
+    }
+
+def compare_positions(skills_input, target_positions):
+    analyzer = _analyzer(skills_input)
+    comparison = analyzer.compare_target_positions(target_positions)
+    if comparison is not None:
+        comparison.pop('job_profiles')
+    return comparison
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Query cepat: validasi skill & gap analysis')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    validate = subparsers.add_parser('validate', help='Validasi skill terhadap kamus')
+    validate.add_argument('skills', help='Daftar skill, pisahkan dengan koma')
+
+    gap = subparsers.add_parser('gap', help='Gap analysis untuk satu atau beberapa posisi')
+    gap.add_argument('skills', help='Daftar skill, pisahkan dengan koma')
+    gap.add_argument('targets', nargs='+', help='Posisi target')
+
+    args = parser.parse_args(argv)
+
+    # Output manusia (print dari GapAnalysis) ke stderr, hasil JSON ke stdout
+    stdout = sys.stdout
+    sys.stdout = sys.stderr
+    try:
+        if args.command == 'validate':
+            result = validate_skills(args.skills)
+        elif len(args.targets) == 1:
+            result = gap_analysis(args.skills, args.targets[0])
+        else:
+            result = compare_positions(args.skills, args.targets)
+    finally:
+        sys.stdout = stdout
+
+    json.dump(result, sys.stdout, indent=2, ensure_ascii=False)
+    print()
+    return 0 if result is not None else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
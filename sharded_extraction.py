@@ -0,0 +1,273 @@
+"""
+SHARDED EXTRACTION: Ekstraksi Skill per Shard + Merge
+Partisi cleaned_data berdasarkan stable hash posting, setiap shard
+diekstrak secara independen (proses/node terpisah) lalu digabung
+menjadi output Fase 2 yang biasa
+"""
+
+import os
+import copy
+import hashlib
+import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from artifact_io import load_json, atomic_write_json
+from arrow_handoff import write_handoff, read_handoff, HANDOFF_FILE, ARROW_AVAILABLE
+from compact_evidence import EvidenceBuilder, CompactEvidence, EVIDENCE_FILE
+from fase1_persiapan_data import DataPreparation
+from fase2_ekstraksi_informasi import SkillExtraction
+
+SHARDS_DIR = 'shards'
+SHARD_META_FILE = 'shard_meta.json'
+SHARD_KEY_COLUMNS = ['posisi', 'company', 'cleaned_text']
+
+def posting_shard(values, num_shards):
+    """
+    Shard id dari isi posting; stabil antar proses, mesin, dan run
+    (tidak memakai hash() bawaan Python yang di-salt per proses)
+    """
+    key = '\x1f'.join(str(value) for value in values)
+    digest = hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big') % num_shards
+
+def assign_shards(cleaned_data, num_shards):
+    """
+    Array shard id untuk setiap baris cleaned_data
+    """
+    return np.fromiter(
+        (posting_shard(values, num_shards)
+         for values in zip(*(cleaned_data[col] for col in SHARD_KEY_COLUMNS))),
+        dtype=np.int64, count=len(cleaned_data)
+    )
+
+def shard_dir(output_dir, shard_id):
+    return os.path.join(output_dir, f"shard_{shard_id:03d}")
+
+def prepare_phase1(memory_lean=False):
+    """
+    Jalankan Fase 1 (load, cleaning, kamus skill); None jika gagal
+    """
+    data_prep = DataPreparation(memory_lean=memory_lean)
+    if (data_prep.step_1_1_data_collection()
+            and data_prep.step_1_2_text_preprocessing()
+            and data_prep.step_1_3_build_skills_dictionary()):
+        return data_prep
+    return None
+
+def shard_data_prep(data_prep, shard_ids, shard_id):
+    """
+    Salinan dangkal DataPreparation yang hanya berisi baris milik shard
+    """
+    shard_prep = copy.copy(data_prep)
+    shard_prep.raw_data = None
+    shard_prep.clean_memo = None  # cleaning sudah selesai, memo tidak ikut ke worker
+    shard_prep.cleaned_data = data_prep.cleaned_data[shard_ids == shard_id]
+    return shard_prep
+
+def write_shard_handoff(data_prep, shard_ids, num_shards, output_dir=SHARDS_DIR):
+    """
+    cleaned_data dikelompokkan per shard ke satu Arrow IPC file; setiap
+    shard = slice kontigu [offset, offset + length) yang di-mmap worker
+    Return: (path, [(offset, length), ...])
+    """
+    order = np.argsort(shard_ids, kind='stable')
+    bounds = np.searchsorted(shard_ids[order], np.arange(num_shards + 1))
+    slices = [(int(bounds[i]), int(bounds[i + 1] - bounds[i])) for i in range(num_shards)]
+    path = write_handoff(data_prep.cleaned_data, os.path.join(output_dir, HANDOFF_FILE), order=order,
+                         metadata={'num_shards': num_shards, 'dictionary_hash': data_prep.dictionary_hash,
+                                   'shards': slices})
+    return path, slices
+
+def extract_shard(shard_prep, shard_id, num_shards, output_dir=SHARDS_DIR, compact_evidence=True):
+    """
+    Ekstraksi satu shard dan simpan output shard-local
+    """
+    print(f"\n🧩 SHARD {shard_id + 1}/{num_shards}: {len(shard_prep.cleaned_data):,} lowongan")
+    target_dir = shard_dir(output_dir, shard_id)
+
+    extractor = SkillExtraction(shard_prep, compact_evidence=compact_evidence)
+    if not extractor.step_2_1_design_extraction_method():
+        return None
+    if not extractor.step_2_2_mass_extraction():
+        return None
+    extractor.save_extraction_results(target_dir)
+
+    meta = {
+        'shard_id': shard_id,
+        'num_shards': num_shards,
+        'dictionary_hash': shard_prep.dictionary_hash,
+        'jobs': len(extractor.extracted_skills_db),
+        # Node merge tidak membangun pattern; kategori skill dibawa dari shard
+        'skill_categories': {skill: info['category'] for skill, info in extractor.skill_patterns.items()}
+    }
+    atomic_write_json(os.path.join(target_dir, SHARD_META_FILE), meta)
+    return meta
+
+def _extract_shard_task(task):
+    """
+    Worker: satu shard per proses (pengganti satu node); dengan hand-off,
+    baris shard dibaca dari Arrow IPC file (mmap) alih-alih di-pickle
+    """
+    shard_prep, handoff, *args = task
+    if handoff is not None:
+        shard_prep = copy.copy(shard_prep)
+        shard_prep.cleaned_data = read_handoff(*handoff)
+    return extract_shard(shard_prep, *args)
+
+def run_local(num_shards, workers=None, output_dir=SHARDS_DIR, memory_lean=False, compact_evidence=True):
+    """
+    Simulasi multi-node: Fase 1 sekali, setiap shard di proses terpisah
+    """
+    data_prep = prepare_phase1(memory_lean=memory_lean)
+    if data_prep is None:
+        print("❌ Fase 1 belum berhasil. Pastikan data tersedia.")
+        return None
+
+    shard_ids = assign_shards(data_prep.cleaned_data, num_shards)
+    if ARROW_AVAILABLE:
+        # Worker hanya menerima kamus + (path, offset, length); data dibagi via page cache
+        path, slices = write_shard_handoff(data_prep, shard_ids, num_shards, output_dir)
+        print(f"🏹 Arrow hand-off: {path} ({os.path.getsize(path) / (1024 * 1024):.1f} MB)")
+        shared_prep = copy.copy(data_prep)
+        shared_prep.raw_data = None
+        shared_prep.cleaned_data = None
+        shared_prep.clean_memo = None
+        # Proses induk tidak butuh DataFrame lagi selama worker berjalan
+        data_prep.raw_data = data_prep.cleaned_data = None
+        tasks = [(shared_prep, (path, offset, length), shard_id, num_shards, output_dir, compact_evidence)
+                 for shard_id, (offset, length) in enumerate(slices)]
+    else:
+        tasks = [(shard_data_prep(data_prep, shard_ids, shard_id), None, shard_id, num_shards,
+                  output_dir, compact_evidence)
+                 for shard_id in range(num_shards)]
+
+    with ProcessPoolExecutor(max_workers=workers or num_shards) as executor:
+        metas = list(executor.map(_extract_shard_task, tasks))
+
+    if any(meta is None for meta in metas):
+        print("❌ Ada shard yang gagal diekstrak")
+        return None
+    return metas
+
+def _job_sort_key(job_id):
+    # job_id = job_<index cleaned_data>, urutan asli dipulihkan dari index
+    return int(job_id.split('_', 1)[1])
+
+def merge_shards(num_shards, shards_dir=SHARDS_DIR, output_dir='.'):
+    """
+    Gabungkan output semua shard menjadi extracted DB, skill_frequency,
+    evidence, dan job-skill matrix seperti run tunggal
+    """
+    print(f"\n🔗 MERGE {num_shards} SHARD")
+    print("="*50)
+
+    shards = []
+    for shard_id in range(num_shards):
+        directory = shard_dir(shards_dir, shard_id)
+        meta = load_json(os.path.join(directory, SHARD_META_FILE))
+        if meta is None:
+            raise FileNotFoundError(f"Output shard {shard_id} tidak ditemukan di '{directory}'")
+        if meta['num_shards'] != num_shards:
+            raise ValueError(f"Shard {shard_id} dibuat dengan num_shards={meta['num_shards']}, bukan {num_shards}")
+        shards.append((meta, directory))
+
+    dictionary_hashes = {meta['dictionary_hash'] for meta, _ in shards}
+    if len(dictionary_hashes) > 1:
+        raise ValueError("Shard diekstrak dengan kamus skill yang berbeda; jalankan ulang dengan kamus yang sama")
+    if any('skill_categories' not in meta for meta, _ in shards):
+        raise ValueError("Meta shard tanpa skill_categories (format lama); jalankan ulang ekstraksi shard")
+    skill_categories = shards[0][0]['skill_categories']
+
+    jobs = []
+    evidence_rows = []
+    shard_frequency = Counter()
+    for meta, directory in shards:
+        shard_jobs = load_json(os.path.join(directory, 'extracted_skills_database.json'))
+        shard_frequency.update(load_json(os.path.join(directory, 'skill_frequency.json')))
+        jobs.extend(shard_jobs)
+
+        evidence_path = os.path.join(directory, EVIDENCE_FILE)
+        if os.path.exists(evidence_path):
+            evidence = CompactEvidence.load(evidence_path)
+            evidence_rows.extend((job_id, evidence) for job_id in evidence.job_ids)
+        print(f"   • shard {meta['shard_id']:03d}: {meta['jobs']:,} lowongan")
+
+    jobs.sort(key=lambda job: _job_sort_key(job['job_id']))
+
+    # Urutan insertion sama dengan run tunggal (iterasi job berurutan)
+    skill_frequency = Counter()
+    for job in jobs:
+        skill_frequency.update(job['required_skills'])
+    if skill_frequency != shard_frequency:
+        raise ValueError("Frekuensi skill hasil merge tidak cocok dengan counter shard")
+
+    merged = SkillExtraction(compact_evidence=True)
+    merged.extracted_skills_db = jobs
+    merged.skill_frequency = dict(skill_frequency)
+
+    if len(evidence_rows) == len(jobs):
+        evidence_rows.sort(key=lambda item: _job_sort_key(item[0]))
+        builder = EvidenceBuilder(evidence_rows[0][1].skills if evidence_rows else None)
+        for job_id, evidence in evidence_rows:
+            builder.add_job(job_id, {skill: evidence.spans(job_id, skill)
+                                     for skill, _ in evidence.skills_for_job(job_id)})
+        merged.evidence = builder.build()
+
+    merged._create_job_skill_matrix()
+    merged.save_extraction_results(output_dir, skill_categories=skill_categories)
+
+    print(f"✅ Merge selesai: {len(jobs):,} lowongan, {len(skill_frequency)} skills unik")
+    return merged
+
+def main():
+    parser = argparse.ArgumentParser(description='Ekstraksi skill ter-shard + merge')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    shard = subparsers.add_parser('shard', help='Ekstraksi satu shard (satu node)')
+    shard.add_argument('--shard-id', type=int, required=True)
+    shard.add_argument('--num-shards', type=int, required=True)
+
+    local = subparsers.add_parser('local', help='Semua shard di proses lokal, lalu merge')
+    local.add_argument('--num-shards', type=int, required=True)
+    local.add_argument('--workers', type=int)
+
+    merge = subparsers.add_parser('merge', help='Gabungkan output shard')
+    merge.add_argument('--num-shards', type=int, required=True)
+    merge.add_argument('--output-dir', default='.')
+
+    for sub in (shard, local, merge):
+        sub.add_argument('--shards-dir', default=SHARDS_DIR)
+    for sub in (shard, local):
+        sub.add_argument('--memory-lean', action='store_true')
+        sub.add_argument('--full-evidence', action='store_true')
+
+    args = parser.parse_args()
+
+    print("🧩 SHARDED EXTRACTION")
+    print("="*50)
+
+    if args.command == 'shard':
+        if not 0 <= args.shard_id < args.num_shards:
+            parser.error('--shard-id harus di antara 0 dan num-shards - 1')
+        data_prep = prepare_phase1(memory_lean=args.memory_lean)
+        if data_prep is None:
+            print("❌ Fase 1 belum berhasil. Pastikan data tersedia.")
+            return
+        shard_ids = assign_shards(data_prep.cleaned_data, args.num_shards)
+        extract_shard(shard_data_prep(data_prep, shard_ids, args.shard_id), args.shard_id,
+                      args.num_shards, args.shards_dir, compact_evidence=not args.full_evidence)
+
+    elif args.command == 'local':
+        metas = run_local(args.num_shards, workers=args.workers, output_dir=args.shards_dir,
+                          memory_lean=args.memory_lean, compact_evidence=not args.full_evidence)
+        if metas is not None:
+            merge_shards(args.num_shards, shards_dir=args.shards_dir)
+
+    else:
+        merge_shards(args.num_shards, shards_dir=args.shards_dir, output_dir=args.output_dir)
+
+if __name__ == "__main__":
+    main()
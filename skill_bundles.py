@@ -0,0 +1,266 @@
+"""
+SKILL BUNDLES: Frequent Skill-Set Mining (FP-Growth) & Association Rules
+Mencari kombinasi skill yang sering diminta bersamaan dari job-skill matrix,
+per partisi role, dijalankan paralel per partisi
+"""
+
+import math
+import argparse
+from itertools import combinations
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from artifact_io import load_json, atomic_write_json
+from job_skill_matrix import JobSkillSnapshot
+from title_normalization import TitleRoleTable
+
+BUNDLES_FILE = 'skill_bundles.json'
+ALL_JOBS_PARTITION = '__all__'
+
+class _FPNode:
+    __slots__ = ('item', 'count', 'parent', 'children', 'link')
+
+    def __init__(self, item, parent):
+        self.item = item
+        self.count = 0
+        self.parent = parent
+        self.children = {}
+        self.link = None
+
+def _build_fp_tree(weighted_transactions, min_count):
+    """
+    weighted_transactions: [(items, count)] → (root, header)
+    header[item] = [support, first_node, last_node]
+    """
+    support = Counter()
+    for items, count in weighted_transactions:
+        for item in items:
+            support[item] += count
+
+    frequent = {item: sup for item, sup in support.items() if sup >= min_count}
+    root = _FPNode(None, None)
+    header = {item: [sup, None, None] for item, sup in frequent.items()}
+
+    for items, count in weighted_transactions:
+        ordered = sorted((item for item in items if item in frequent),
+                         key=lambda item: (-frequent[item], item))
+        node = root
+        for item in ordered:
+            child = node.children.get(item)
+            if child is None:
+                child = _FPNode(item, node)
+                node.children[item] = child
+                entry = header[item]
+                if entry[1] is None:
+                    entry[1] = child
+                else:
+                    entry[2].link = child
+                entry[2] = child
+            child.count += count
+            node = child
+
+    return root, header
+
+def _mine_tree(header, min_count, suffix, max_len, results):
+    # Item dengan support terkecil diproses terlebih dahulu
+    for item in sorted(header, key=lambda item: (header[item][0], item)):
+        itemset = suffix + (item,)
+        results[frozenset(itemset)] = header[item][0]
+
+        if len(itemset) >= max_len:
+            continue
+
+        # Conditional pattern base: prefix path dari setiap node item
+        conditional = []
+        node = header[item][1]
+        while node is not None:
+            path = []
+            parent = node.parent
+            while parent is not None and parent.item is not None:
+                path.append(parent.item)
+                parent = parent.parent
+            if path:
+                conditional.append((path, node.count))
+            node = node.link
+
+        if conditional:
+            _, conditional_header = _build_fp_tree(conditional, min_count)
+            if conditional_header:
+                _mine_tree(conditional_header, min_count, itemset, max_len, results)
+
+def fp_growth(transactions, min_support=0.05, max_len=4):
+    """
+    Frequent itemsets dari list transaksi (tuple item)
+    Return: {frozenset(items): count}
+    """
+    n_transactions = len(transactions)
+    # ceil: itemset di bawah min_support tidak boleh lolos karena pembulatan
+    min_count = max(1, math.ceil(min_support * n_transactions - 1e-9))
+
+    # Transaksi identik digabung sebagai bobot
+    weighted = list(Counter(tuple(sorted(items)) for items in transactions if items).items())
+    _, header = _build_fp_tree(weighted, min_count)
+
+    results = {}
+    _mine_tree(header, min_count, (), max_len, results)
+    return results
+
+def association_rules(itemsets, n_transactions, min_confidence=0.5):
+    """
+    Rules antecedent → consequent dari frequent itemsets
+    """
+    rules = []
+    for itemset, count in itemsets.items():
+        if len(itemset) < 2:
+            continue
+        for size in range(1, len(itemset)):
+            for antecedent in combinations(sorted(itemset), size):
+                antecedent = frozenset(antecedent)
+                consequent = itemset - antecedent
+                confidence = count / itemsets[antecedent]
+                if confidence < min_confidence:
+                    continue
+                consequent_support = itemsets[consequent] / n_transactions
+                rules.append({
+                    'antecedent': sorted(antecedent),
+                    'consequent': sorted(consequent),
+                    'support': count / n_transactions,
+                    'confidence': confidence,
+                    'lift': confidence / consequent_support
+                })
+
+    rules.sort(key=lambda rule: (rule['lift'], rule['confidence']), reverse=True)
+    return rules
+
+def _mine_partition(task):
+    """
+    Worker: mining satu partisi (dipanggil via ProcessPoolExecutor)
+    """
+    name, transactions, min_support, min_confidence, max_len = task
+    itemsets = fp_growth(transactions, min_support=min_support, max_len=max_len)
+    rules = association_rules(itemsets, len(transactions), min_confidence=min_confidence)
+
+    bundles = sorted(
+        ({'skills': sorted(itemset), 'count': count, 'support': count / len(transactions)}
+         for itemset, count in itemsets.items() if len(itemset) >= 2),
+        key=lambda bundle: bundle['count'], reverse=True
+    )
+    return name, {'jobs': len(transactions), 'bundles': bundles, 'rules': rules}
+
+def mine_skill_bundles(snapshot=None, min_support=0.05, min_confidence=0.5, max_len=4,
+                       by_role=True, min_partition_jobs=50, workers=None, output_file=BUNDLES_FILE):
+    """
+    Mining frequent skill-sets untuk seluruh lowongan (+ per role cluster)
+    """
+    print("🧺 MINING SKILL BUNDLES (FP-GROWTH)")
+    print("="*50)
+
+    if snapshot is None:
+        snapshot = JobSkillSnapshot.load()
+
+    matrix = snapshot.matrix.tocsr()
+    skills = snapshot.skills
+    transactions = [
+        tuple(skills[i] for i in matrix.indices[matrix.indptr[row]:matrix.indptr[row + 1]])
+        for row in range(matrix.shape[0])
+    ]
+
+    partitions = {ALL_JOBS_PARTITION: transactions}
+    if by_role:
+        title_table = TitleRoleTable.load()
+        role_transactions = defaultdict(list)
+        for title, items in zip(snapshot.job_titles, transactions):
+            role = title_table.role_for_title(title)
+            if role:
+                role_transactions[role].append(items)
+        partitions.update({role: items for role, items in role_transactions.items()
+                           if len(items) >= min_partition_jobs})
+
+    print(f"📊 {len(transactions):,} lowongan, {len(partitions)} partisi "
+          f"(min_support={min_support}, min_confidence={min_confidence})")
+
+    tasks = [(name, items, min_support, min_confidence, max_len) for name, items in partitions.items()]
+    if workers == 1 or len(tasks) == 1:
+        results = dict(map(_mine_partition, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = dict(executor.map(_mine_partition, tasks))
+
+    # Index skill → rule index per partisi untuk lookup cepat
+    skill_index = defaultdict(dict)
+    for name, result in results.items():
+        for rule_id, rule in enumerate(result['rules']):
+            for skill in rule['antecedent']:
+                skill_index[skill].setdefault(name, []).append(rule_id)
+
+    output = {
+        'params': {
+            'min_support': min_support,
+            'min_confidence': min_confidence,
+            'max_len': max_len,
+            'min_partition_jobs': min_partition_jobs
+        },
+        'partitions': results,
+        'skill_index': skill_index
+    }
+    atomic_write_json(output_file, output, indent=None)
+
+    overall = results[ALL_JOBS_PARTITION]
+    print(f"✅ {len(overall['bundles']):,} bundles & {len(overall['rules']):,} rules (semua lowongan)")
+    for bundle in overall['bundles'][:5]:
+        print(f"   • {' + '.join(bundle['skills'])} ({bundle['support'] * 100:.1f}%)")
+    print(f"💾 Disimpan ke: {output_file}")
+
+    return output
+
+class SkillBundles:
+    """
+    Lookup hasil mining yang sudah dipersist
+    """
+
+    def __init__(self, file_path=BUNDLES_FILE):
+        self.data = load_json(file_path)
+        if self.data is None:
+            raise FileNotFoundError(f"{file_path} tidak ditemukan. Jalankan 'skill_bundles.py mine'.")
+
+    def rules_for_skill(self, skill, partition=ALL_JOBS_PARTITION, top_n=10):
+        rule_ids = self.data['skill_index'].get(skill, {}).get(partition, [])
+        rules = self.data['partitions'][partition]['rules']
+        return [rules[rule_id] for rule_id in rule_ids[:top_n]]
+
+def main():
+    parser = argparse.ArgumentParser(description='Frequent skill-set mining (FP-growth)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    mine = subparsers.add_parser('mine')
+    mine.add_argument('--min-support', type=float, default=0.05)
+    mine.add_argument('--min-confidence', type=float, default=0.5)
+    mine.add_argument('--max-len', type=int, default=4)
+    mine.add_argument('--min-partition-jobs', type=int, default=50)
+    mine.add_argument('--no-roles', action='store_true', help='Tanpa partisi per role')
+    mine.add_argument('--workers', type=int)
+
+    lookup = subparsers.add_parser('lookup')
+    lookup.add_argument('skill')
+    lookup.add_argument('--role', default=ALL_JOBS_PARTITION)
+    lookup.add_argument('--n', type=int, default=10)
+
+    args = parser.parse_args()
+
+    if args.command == 'mine':
+        mine_skill_bundles(min_support=args.min_support, min_confidence=args.min_confidence,
+                           max_len=args.max_len, by_role=not args.no_roles,
+                           min_partition_jobs=args.min_partition_jobs, workers=args.workers)
+    else:
+        bundles = SkillBundles()
+        rules = bundles.rules_for_skill(args.skill.lower(), partition=args.role, top_n=args.n)
+        if not rules:
+            print(f"❌ Tidak ada rule untuk '{args.skill}' pada partisi '{args.role}'")
+            return
+        print(f"\n🧺 SKILL YANG SERING DIMINTA BERSAMA '{args.skill}':")
+        for rule in rules:
+            print(f"   • {' + '.join(rule['antecedent'])} → {' + '.join(rule['consequent'])} "
+                  f"(conf {rule['confidence']:.2f}, lift {rule['lift']:.2f}, support {rule['support'] * 100:.1f}%)")
+
+if __name__ == "__main__":
+    main()
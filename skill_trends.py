@@ -0,0 +1,295 @@
+"""
+TREND: Agregat Skill per Time Bucket (Incremental)
+Menyimpan jumlah skill dan role-skill per bucket waktu (hari/minggu)
+sehingga query tren tidak perlu scan ulang seluruh lowongan
+"""
+
+import os
+import hashlib
+import argparse
+from datetime import date, datetime, timedelta
+from collections import Counter, defaultdict
+
+from artifact_io import content_hash, load_json, atomic_write_json
+from title_normalization import TitleRoleTable, normalize_title
+
+TRENDS_FILE = 'skill_trends.json'
+POSTING_KEY_SIZE = 8
+
+def _to_date(value):
+    """
+    Konversi string ISO / datetime / date menjadi date
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.fromisoformat(str(value)[:10]).date()
+
+def posting_key(job):
+    """
+    Identitas isi satu posting: judul + company + hash deskripsi (text_hash
+    dari Fase 2), bukan job_id yang berubah jika export diurutkan ulang.
+    Export lama tanpa text_hash memakai tanggal scrape + daftar skill.
+    """
+    content = job.get('text_hash')
+    if content is None:
+        content = '\x1e'.join([str(job.get('scraped_at', ''))] + sorted(job['required_skills']))
+    key = '\x1f'.join([str(job['job_title']), str(job['company']), content])
+    return hashlib.blake2b(key.encode('utf-8'), digest_size=POSTING_KEY_SIZE).digest()
+
+def seen_postings_file(trends_file):
+    """
+    Posting yang sudah di-ingest: file biner terpisah (8 byte per posting,
+    append-only) agar skill_trends.json tidak ditulis ulang seluruhnya
+    """
+    return os.path.splitext(trends_file)[0] + '_seen.bin'
+
+def default_role_key():
+    """
+    Role = role cluster dari tabel judul; judul ternormalisasi jika tanpa cluster
+    """
+    try:
+        title_table = TitleRoleTable.load()
+    except FileNotFoundError:
+        return lambda job: normalize_title(job['job_title'])
+
+    def role_key(job):
+        return title_table.role_for_title(job['job_title']) or normalize_title(job['job_title'])
+
+    return role_key
+
+class SkillTrendAggregator:
+    """
+    Agregat incremental: per bucket disimpan jumlah lowongan, jumlah
+    lowongan per skill, jumlah lowongan per role, dan role × skill
+    """
+
+    def __init__(self, trends_file=TRENDS_FILE, bucket='week'):
+        self.trends_file = trends_file
+        self.data = load_json(trends_file) or {
+            'bucket': bucket,
+            'buckets': {},
+            'ingested_batches': {}
+        }
+        self.bucket = self.data['bucket']
+        # Export Fase 2 bersifat kumulatif: posting yang sudah dihitung tidak dihitung lagi
+        self.seen_file = seen_postings_file(trends_file)
+        self.seen_postings = self._load_seen_postings()
+        self.new_postings = []
+
+    def bucket_key(self, value):
+        """
+        Key bucket: tanggal (day) atau tanggal Senin dari minggu tersebut (week)
+        """
+        day = _to_date(value)
+        if self.bucket == 'week':
+            day = day - timedelta(days=day.weekday())
+        return day.isoformat()
+
+    def ingest_batch(self, extracted_jobs, batch_id=None, default_date=None,
+                     date_field='scraped_at', role_key=None):
+        """
+        Tambahkan satu batch hasil ekstraksi; hanya bucket yang tersentuh
+        yang di-update. Batch yang sama (batch_id) dilewati, dan di dalam
+        batch hanya posting yang belum pernah di-ingest yang dihitung.
+        """
+        if batch_id is None:
+            batch_id = content_hash([(job['job_id'], job['required_skills']) for job in extracted_jobs])
+
+        if batch_id in self.data['ingested_batches']:
+            print(f"ℹ️ Batch {batch_id[:12]} sudah pernah di-ingest, dilewati")
+            return []
+
+        if role_key is None:
+            role_key = default_role_key()
+
+        default_date = default_date or date.today()
+        touched = Counter()
+        new_jobs = 0
+
+        for job in extracted_jobs:
+            posting = posting_key(job)
+            if posting in self.seen_postings:
+                continue
+            self.seen_postings.add(posting)
+            self.new_postings.append(posting)
+            new_jobs += 1
+
+            key = self.bucket_key(job.get(date_field) or default_date)
+            bucket = self.data['buckets'].setdefault(key, {
+                'jobs': 0,
+                'skill_counts': {},
+                'role_jobs': {},
+                'role_skill_counts': {}
+            })
+            role = role_key(job)
+            skills = set(job['required_skills'])
+
+            bucket['jobs'] += 1
+            bucket['role_jobs'][role] = bucket['role_jobs'].get(role, 0) + 1
+            role_counts = bucket['role_skill_counts'].setdefault(role, {})
+            for skill in skills:
+                bucket['skill_counts'][skill] = bucket['skill_counts'].get(skill, 0) + 1
+                role_counts[skill] = role_counts.get(skill, 0) + 1
+            touched[key] += 1
+
+        self.data['ingested_batches'][batch_id] = {
+            'ingested_at': datetime.now().isoformat(),
+            'jobs': new_jobs,
+            'buckets': sorted(touched)
+        }
+
+        print(f"✅ Batch {batch_id[:12]}: {new_jobs:,} lowongan baru dari {len(extracted_jobs):,} "
+              f"→ {len(touched)} bucket di-update")
+        return sorted(touched)
+
+    def _load_seen_postings(self):
+        """
+        Baca key posting sampai panjang yang tercatat di JSON; sisa append dari
+        save yang terputus (JSON belum ter-update) diabaikan
+        """
+        # Format lama: key berbasis job_id di dalam JSON, tidak kompatibel
+        self.data.pop('seen_postings', None)
+        length = self.data.get('seen_postings_bytes', 0)
+        if not length:
+            return set()
+        with open(self.seen_file, 'rb') as f:
+            blob = f.read(length)
+        return {blob[i:i + POSTING_KEY_SIZE] for i in range(0, len(blob), POSTING_KEY_SIZE)}
+
+    def save(self):
+        # Key baru di-append dulu; JSON (dengan panjang file yang valid) ditulis atomic terakhir
+        length = self.data.get('seen_postings_bytes', 0)
+        with open(self.seen_file, 'r+b' if os.path.exists(self.seen_file) else 'wb') as f:
+            f.truncate(length)
+            f.seek(length)
+            f.write(b''.join(self.new_postings))
+            length = f.tell()
+        self.new_postings = []
+        self.data['seen_postings_bytes'] = length
+        atomic_write_json(self.trends_file, self.data)
+        print(f"💾 Agregat tren disimpan ke: {self.trends_file} (+ {self.seen_file})")
+
+    def _window(self, start, end):
+        """
+        Jumlahkan bucket dengan start < key <= end
+        """
+        jobs = 0
+        skill_counts = Counter()
+        role_jobs = Counter()
+        role_skill_counts = defaultdict(Counter)
+
+        for key, bucket in self.data['buckets'].items():
+            day = _to_date(key)
+            if start < day <= end:
+                jobs += bucket['jobs']
+                skill_counts.update(bucket['skill_counts'])
+                role_jobs.update(bucket['role_jobs'])
+                for role, counts in bucket['role_skill_counts'].items():
+                    role_skill_counts[role].update(counts)
+
+        return jobs, skill_counts, role_jobs, role_skill_counts
+
+    def _latest_date(self):
+        if not self.data['buckets']:
+            return date.today()
+        return max(_to_date(key) for key in self.data['buckets'])
+
+    def top_growing_skills(self, window_days=90, top_n=20, as_of=None, min_count=5):
+        """
+        Skill dengan kenaikan share terbesar: window terakhir vs window sebelumnya
+        """
+        as_of = _to_date(as_of) if as_of else self._latest_date()
+        window = timedelta(days=window_days)
+
+        cur_jobs, cur_counts, _, _ = self._window(as_of - window, as_of)
+        prev_jobs, prev_counts, _, _ = self._window(as_of - 2 * window, as_of - window)
+
+        results = []
+        for skill in set(cur_counts) | set(prev_counts):
+            if cur_counts[skill] + prev_counts[skill] < min_count:
+                continue
+            cur_share = cur_counts[skill] / cur_jobs * 100 if cur_jobs else 0
+            prev_share = prev_counts[skill] / prev_jobs * 100 if prev_jobs else 0
+            results.append({
+                'skill': skill,
+                'current_count': cur_counts[skill],
+                'previous_count': prev_counts[skill],
+                'current_percentage': cur_share,
+                'previous_percentage': prev_share,
+                'delta_percentage_points': cur_share - prev_share
+            })
+
+        results.sort(key=lambda x: x['delta_percentage_points'], reverse=True)
+        return results[:top_n]
+
+    def role_skill_percentages(self, role, window_days=None, as_of=None):
+        """
+        Persentase lowongan role yang membutuhkan setiap skill dalam window
+        """
+        as_of = _to_date(as_of) if as_of else self._latest_date()
+        start = as_of - timedelta(days=window_days) if window_days else date.min
+
+        _, _, role_jobs, role_skill_counts = self._window(start, as_of)
+        total = role_jobs.get(role, 0)
+        if not total:
+            return {}
+
+        return {
+            skill: count / total * 100
+            for skill, count in role_skill_counts[role].most_common()
+        }
+
+def main():
+    parser = argparse.ArgumentParser(description='Agregat tren skill per time bucket')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    ingest = subparsers.add_parser('ingest', help='Ingest hasil ekstraksi sebagai batch baru')
+    ingest.add_argument('--input', default='extracted_skills_database.json')
+    ingest.add_argument('--date', help='Tanggal scrape (YYYY-MM-DD), default hari ini')
+    ingest.add_argument('--batch-id')
+    ingest.add_argument('--bucket', choices=['day', 'week'], default='week')
+
+    growing = subparsers.add_parser('top-growing', help='Skill dengan pertumbuhan terbesar')
+    growing.add_argument('--days', type=int, default=90)
+    growing.add_argument('--top', type=int, default=20)
+
+    role = subparsers.add_parser('role', help='Persentase skill untuk satu role')
+    role.add_argument('name')
+    role.add_argument('--days', type=int)
+
+    args = parser.parse_args()
+
+    if args.command == 'ingest':
+        aggregator = SkillTrendAggregator(bucket=args.bucket)
+        extracted_jobs = load_json(args.input)
+        if extracted_jobs is None:
+            print(f"❌ File {args.input} tidak ditemukan. Jalankan Fase 2 terlebih dahulu.")
+            return
+        aggregator.ingest_batch(extracted_jobs, batch_id=args.batch_id,
+                                default_date=args.date)
+        aggregator.save()
+
+    elif args.command == 'top-growing':
+        aggregator = SkillTrendAggregator()
+        print(f"\n📈 TOP GROWING SKILLS ({args.days} HARI TERAKHIR)")
+        print("="*70)
+        print(f"{'Skill':<25} {'Sekarang':>10} {'Sebelum':>10} {'Delta':>10}")
+        print("-" * 70)
+        for item in aggregator.top_growing_skills(window_days=args.days, top_n=args.top):
+            print(f"{item['skill']:<25} {item['current_percentage']:>9.1f}% "
+                  f"{item['previous_percentage']:>9.1f}% {item['delta_percentage_points']:>+9.1f}")
+
+    elif args.command == 'role':
+        aggregator = SkillTrendAggregator()
+        role = default_role_key()({'job_title': args.name})
+        percentages = aggregator.role_skill_percentages(role, window_days=args.days)
+        if not percentages:
+            print(f"❌ Tidak ada data untuk role '{args.name}'")
+            return
+        for skill, percentage in list(percentages.items())[:20]:
+            print(f"   • {skill}: {percentage:.1f}%")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+SNAPSHOT DIFF: Perbandingan Dua Snapshot Ekstraksi
+Menyelaraskan vocabulary dua job-skill matrix lalu menghitung perubahan
+prevalensi skill (overall dan per role) beserta uji signifikansi
+"""
+
+import argparse
+
+import numpy as np
+from scipy import sparse
+from scipy.special import erfc
+
+from artifact_io import atomic_write_json
+from job_skill_matrix import JobSkillSnapshot, role_ids, group_counts, UNASSIGNED_ROLE
+from title_normalization import TitleRoleTable
+
+DIFF_FILE = 'snapshot_diff.json'
+
+def align_columns(snapshot, vocabulary):
+    """
+    Remap kolom matrix snapshot ke vocabulary gabungan (sorted)
+    """
+    matrix = snapshot.matrix.tocsr()
+    column_map = np.searchsorted(vocabulary, np.asarray(snapshot.skills, dtype=str))
+    return sparse.csr_matrix(
+        (matrix.data, column_map[matrix.indices], matrix.indptr),
+        shape=(matrix.shape[0], len(vocabulary))
+    )
+
+def two_proportion_test(count_a, n_a, count_b, n_b):
+    """
+    Two-proportion z-test (pooled), vektor; return (delta, z, p_value)
+    """
+    count_a = np.asarray(count_a, dtype=np.float64)
+    count_b = np.asarray(count_b, dtype=np.float64)
+    n_a = np.asarray(n_a, dtype=np.float64)
+    n_b = np.asarray(n_b, dtype=np.float64)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p_a = np.where(n_a > 0, count_a / n_a, 0.0)
+        p_b = np.where(n_b > 0, count_b / n_b, 0.0)
+        pooled = (count_a + count_b) / (n_a + n_b)
+        se = np.sqrt(pooled * (1 - pooled) * (1 / n_a + 1 / n_b))
+        z = np.where(se > 0, (p_b - p_a) / se, 0.0)
+
+    p_value = erfc(np.abs(z) / np.sqrt(2))
+    return p_b - p_a, z, p_value
+
+def _rows(skills, count_a, n_a, count_b, n_b, min_count, alpha):
+    delta, z, p_value = two_proportion_test(count_a, n_a, count_b, n_b)
+    keep = np.flatnonzero((count_a + count_b) >= min_count)
+    order = keep[np.argsort(-delta[keep], kind='stable')]
+
+    return [{
+        'skill': skills[i],
+        'old_count': int(count_a[i]),
+        'new_count': int(count_b[i]),
+        'old_percentage': float(count_a[i] / n_a * 100) if n_a else 0.0,
+        'new_percentage': float(count_b[i] / n_b * 100) if n_b else 0.0,
+        'delta_percentage_points': float(delta[i] * 100),
+        'z_score': float(z[i]),
+        'p_value': float(p_value[i]),
+        'significant': bool(p_value[i] < alpha)
+    } for i in order]
+
+def diff_snapshots(old, new, by_role=True, min_count=5, min_role_jobs=30, alpha=0.05):
+    """
+    Bandingkan dua JobSkillSnapshot (old → new)
+    """
+    vocabulary = np.union1d(np.asarray(old.skills, dtype=str), np.asarray(new.skills, dtype=str))
+    skills = vocabulary.tolist()
+    old_matrix = align_columns(old, vocabulary)
+    new_matrix = align_columns(new, vocabulary)
+
+    n_old, n_new = old_matrix.shape[0], new_matrix.shape[0]
+    old_counts = np.asarray(old_matrix.sum(axis=0)).ravel()
+    new_counts = np.asarray(new_matrix.sum(axis=0)).ravel()
+
+    result = {
+        'old_jobs': n_old,
+        'new_jobs': n_new,
+        'added_skills': sorted(set(new.skills) - set(old.skills)),
+        'removed_skills': sorted(set(old.skills) - set(new.skills)),
+        'params': {'min_count': min_count, 'min_role_jobs': min_role_jobs, 'alpha': alpha},
+        'skills': _rows(skills, old_counts, n_old, new_counts, n_new, min_count, alpha),
+        'roles': {}
+    }
+
+    if by_role:
+        title_table = TitleRoleTable.load()
+        roles = sorted(title_table.role_keywords) + [UNASSIGNED_ROLE]
+        old_role_jobs, old_role_counts = group_counts(
+            old_matrix, role_ids(old.job_titles, title_table, roles), len(roles))
+        new_role_jobs, new_role_counts = group_counts(
+            new_matrix, role_ids(new.job_titles, title_table, roles), len(roles))
+
+        for r, role in enumerate(roles):
+            if role == UNASSIGNED_ROLE or min(old_role_jobs[r], new_role_jobs[r]) < min_role_jobs:
+                continue
+            result['roles'][role] = {
+                'old_jobs': int(old_role_jobs[r]),
+                'new_jobs': int(new_role_jobs[r]),
+                'skills': _rows(skills, old_role_counts[r], old_role_jobs[r],
+                                new_role_counts[r], new_role_jobs[r], min_count, alpha)
+            }
+
+    return result
+
+def _print_movers(rows, top_n):
+    # rows sudah terurut berdasarkan delta (naik terbesar → turun terbesar)
+    rising = [row for row in rows if row['significant'] and row['delta_percentage_points'] > 0]
+    falling = [row for row in rows if row['significant'] and row['delta_percentage_points'] < 0]
+    print(f"{'Skill':<25} {'Lama':>8} {'Baru':>8} {'Delta':>8} {'p-value':>10}")
+    print("-" * 63)
+    for row in rising[:top_n] + falling[::-1][:top_n]:
+        print(f"{row['skill']:<25} {row['old_percentage']:>7.1f}% {row['new_percentage']:>7.1f}% "
+              f"{row['delta_percentage_points']:>+8.1f} {row['p_value']:>10.2g}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Diff dua snapshot job-skill matrix')
+    parser.add_argument('old_dir', help='Direktori snapshot lama')
+    parser.add_argument('new_dir', help='Direktori snapshot baru')
+    parser.add_argument('--min-count', type=int, default=5)
+    parser.add_argument('--min-role-jobs', type=int, default=30)
+    parser.add_argument('--alpha', type=float, default=0.05)
+    parser.add_argument('--no-roles', action='store_true', help='Tanpa breakdown per role')
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--output', default=DIFF_FILE)
+    args = parser.parse_args()
+
+    print("🔀 SNAPSHOT DIFF")
+    print("="*50)
+    old = JobSkillSnapshot.load(args.old_dir)
+    new = JobSkillSnapshot.load(args.new_dir)
+    result = diff_snapshots(old, new, by_role=not args.no_roles, min_count=args.min_count,
+                            min_role_jobs=args.min_role_jobs, alpha=args.alpha)
+
+    print(f"📊 {result['old_jobs']:,} → {result['new_jobs']:,} lowongan")
+    print(f"➕ Skill baru: {len(result['added_skills'])} | ➖ Skill hilang: {len(result['removed_skills'])}")
+    print(f"\n📈 PERUBAHAN SIGNIFIKAN (alpha={args.alpha})")
+    _print_movers(result['skills'], args.top)
+
+    for role, role_diff in result['roles'].items():
+        if any(row['significant'] for row in role_diff['skills']):
+            print(f"\n👔 {role} ({role_diff['old_jobs']:,} → {role_diff['new_jobs']:,} lowongan)")
+            _print_movers(role_diff['skills'], args.top)
+
+    atomic_write_json(args.output, result)
+    print(f"\n💾 Disimpan ke: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""
+TITLE NORMALIZATION: Tabel Normalisasi Judul & Role Cluster
+Normalisasi setiap judul lowongan unik satu kali dan petakan ke role
+cluster kanonik yang di-seed dari job_keyword.txt
+"""
+
+import re
+import argparse
+from collections import Counter
+
+from artifact_io import content_hash, load_json, atomic_write_json
+
+TITLE_TABLE_FILE = 'title_role_table.json'
+JOB_KEYWORD_FILE = 'job_keyword.txt'
+
+# Token noise pada judul (senioritas, mode kerja, dll)
+NOISE_TOKENS = {
+    'sr', 'senior', 'jr', 'junior', 'mid', 'middle', 'lead', 'head', 'principal',
+    'remote', 'wfh', 'wfo', 'hybrid', 'onsite', 'urgent', 'hiring', 'contract',
+    'kontrak', 'freelance', 'fulltime', 'parttime',
+    'i', 'ii', 'iii', 'iv'
+}
+
+# Sinonim Bahasa Indonesia → token Inggris yang dipakai di job_keyword.txt
+TITLE_SYNONYMS = {
+    'gudang': 'warehouse',
+    'perawat': 'nurse',
+    'dokter': 'doctor',
+    'apoteker': 'pharmacist',
+    'guru': 'teacher',
+    'pengajar': 'teacher',
+    'koki': 'cook',
+    'pelayan': 'waiter',
+    'akuntan': 'accounting',
+    'akuntansi': 'accounting',
+    'keuangan': 'finance',
+    'pajak': 'tax',
+    'pemasaran': 'marketing',
+    'penjualan': 'sales',
+    'resepsionis': 'receptionist',
+    'satpam': 'security',
+    'staf': 'staff',
+    'pengembang': 'developer',
+    'programmer': 'developer',
+    'analis': 'analyst',
+    'konsultan': 'consultant',
+    'perekrut': 'recruiter',
+    'arsitek': 'architect',
+    'teknisi': 'technician'
+}
+
+# Token yang terlalu umum untuk menentukan cluster dari partial overlap
+GENERIC_TOKENS = {
+    'staff', 'manager', 'specialist', 'officer', 'engineer', 'developer', 'analyst',
+    'executive', 'assistant', 'designer', 'consultant', 'admin', 'support', 'lead',
+    'supervisor', 'coordinator', 'associate', 'intern'
+}
+
+# Partial match menghasilkan skor lebih kecil dari full match apa pun
+PARTIAL_MATCH_WEIGHT = 0.5
+
+def load_role_keywords(file_path=JOB_KEYWORD_FILE):
+    """
+    Ambil daftar role kanonik dari job_keyword.txt (unik, urutan dipertahankan)
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    return list(dict.fromkeys(re.findall(r'"([^"]+)"', content)))
+
+def normalize_title(title):
+    """
+    Normalisasi judul: lowercase, buang isi kurung, tanda baca, token noise,
+    dan terjemahkan sinonim Bahasa Indonesia
+    """
+    title = str(title).lower()
+    title = re.sub(r'\([^)]*\)|\[[^\]]*\]', ' ', title)
+    title = re.sub(r'[^\w\s\+\#]', ' ', title)
+
+    tokens = []
+    for token in title.split():
+        token = TITLE_SYNONYMS.get(token, token)
+        if token not in NOISE_TOKENS and not token.isdigit():
+            tokens.append(token)
+
+    return ' '.join(tokens)
+
+class TitleRoleTable:
+    """
+    Lookup table: judul mentah → judul ternormalisasi → role cluster
+    """
+
+    def __init__(self, role_keywords=None, table=None):
+        self.role_keywords = role_keywords if role_keywords is not None else load_role_keywords()
+        self._role_tokens = [
+            (role, normalize_title(role).split()) for role in self.role_keywords
+        ]
+        self.table = table or {}
+
+    @property
+    def keywords_hash(self):
+        # Sinonim ikut di-hash: judul ternormalisasi yang di-cache ikut berubah
+        return content_hash({'roles': self.role_keywords, 'synonyms': TITLE_SYNONYMS})
+
+    def _score_roles(self, normalized_title):
+        """
+        Skor setiap role cluster yang cocok: list (role, skor, full_match)
+        """
+        title_tokens = normalized_title.split()
+        title_set = set(title_tokens)
+        padded_title = f" {normalized_title} "
+
+        scored = []
+        for role, role_tokens in self._role_tokens:
+            if not role_tokens:
+                continue
+
+            overlap = title_set.intersection(role_tokens)
+            if len(overlap) == len(set(role_tokens)):
+                score = len(role_tokens)
+                if f" {' '.join(role_tokens)} " in padded_title:
+                    score += 0.5  # frasa utuh berurutan
+                scored.append((role, score, True))
+            elif overlap - GENERIC_TOKENS:
+                scored.append((role, len(overlap) * PARTIAL_MATCH_WEIGHT, False))
+
+        return scored
+
+    def match_role(self, normalized_title):
+        """
+        Role cluster terbaik untuk sebuah judul ternormalisasi (None jika tidak ada)
+        """
+        best_role, best_score = None, 0
+        for role, score, _ in self._score_roles(normalized_title):
+            if score > best_score:
+                best_role, best_score = role, score
+
+        return best_role
+
+    def role_for_title(self, title):
+        """
+        Lookup role cluster untuk judul mentah (dihitung dan di-cache jika belum ada)
+        """
+        entry = self.table.get(title)
+        if entry is None:
+            normalized = normalize_title(title)
+            entry = {'normalized': normalized, 'role_cluster': self.match_role(normalized)}
+            self.table[title] = entry
+        return entry['role_cluster']
+
+    def resolve_target(self, target_position):
+        """
+        Role cluster untuk posisi target user. Partial match yang ambigu
+        (mis. 'data' cocok ke beberapa cluster) menghasilkan None agar caller
+        kembali ke fuzzy match pada judul, bukan memilih cluster pertama
+        """
+        scored = self._score_roles(normalize_title(target_position))
+        if not scored:
+            return None
+
+        best_score = max(score for _, score, _ in scored)
+        best = [(role, full) for role, score, full in scored if score == best_score]
+        if len(best) > 1 and not any(full for _, full in best):
+            return None
+        return best[0][0]
+
+    def build(self, titles):
+        """
+        Normalisasi setiap judul unik satu kali
+        """
+        distinct_titles = set(str(title) for title in titles)
+        for title in distinct_titles:
+            self.role_for_title(title)
+        return len(distinct_titles)
+
+    def cluster_sizes(self):
+        return Counter(entry['role_cluster'] for entry in self.table.values())
+
+    def save(self, file_path=TITLE_TABLE_FILE):
+        atomic_write_json(file_path, {
+            'keywords_hash': self.keywords_hash,
+            'role_keywords': self.role_keywords,
+            'titles': self.table
+        })
+
+    @classmethod
+    def load(cls, file_path=TITLE_TABLE_FILE, role_keywords=None):
+        """
+        Load tabel tersimpan; tabel dibuang jika job_keyword.txt sudah berubah
+        """
+        data = load_json(file_path)
+        table = cls(role_keywords=role_keywords)
+        if data and data.get('keywords_hash') == table.keywords_hash:
+            table.table = data['titles']
+        return table
+
+def build_title_role_table(extracted_file='extracted_skills_database.json',
+                           output_file=TITLE_TABLE_FILE):
+    """
+    Offline stage: bangun tabel normalisasi judul dari hasil ekstraksi
+    """
+    print("🏷️ BUILD TITLE NORMALIZATION & ROLE CLUSTER TABLE")
+    print("="*60)
+
+    extracted_jobs = load_json(extracted_file)
+    if extracted_jobs is None:
+        print(f"❌ File {extracted_file} tidak ditemukan. Jalankan Fase 2 terlebih dahulu.")
+        return None
+
+    table = TitleRoleTable.load(output_file)
+    known = len(table.table)
+    distinct = table.build(job['job_title'] for job in extracted_jobs)
+    table.save(output_file)
+
+    clusters = table.cluster_sizes()
+    unclustered = clusters.pop(None, 0)
+
+    print(f"✅ {len(extracted_jobs):,} lowongan → {distinct:,} judul unik ({len(table.table) - known:,} baru)")
+    print(f"📊 Role clusters terpakai: {len(clusters)} | Judul tanpa cluster: {unclustered:,}")
+    for role, count in clusters.most_common(10):
+        print(f"   • {role}: {count} judul")
+    print(f"💾 Disimpan ke: {output_file}")
+
+    return table
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Build title normalization & role cluster table')
+    parser.add_argument('--input', default='extracted_skills_database.json')
+    parser.add_argument('--output', default=TITLE_TABLE_FILE)
+    args = parser.parse_args()
+
+    build_title_role_table(extracted_file=args.input, output_file=args.output)
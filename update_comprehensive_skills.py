@@ -4,16 +4,11 @@ UPDATE: Tambah Non-Tech Categories ke Comprehensive Skills Database
 
 import json
 
-def add_non_tech_categories():
+def get_non_tech_categories():
     """
-    Tambah specific non-tech categories yang relevan dengan job market
+    Daftar non-tech categories yang relevan dengan job market
+    (dipakai juga oleh build_skills_database.py sebagai salah satu sumber)
     """
-    
-    # Load existing comprehensive skills
-    with open('comprehensive_skills_database.json', 'r', encoding='utf-8') as f:
-        skills_db = json.load(f)
-    
-    # Add new non-tech categories
     non_tech_categories = {
         "finance_accounting": [
             # Accounting & Finance
@@ -186,6 +181,20 @@ def add_non_tech_categories():
         ]
     }
     
+    return non_tech_categories
+
+def add_non_tech_categories():
+    """
+    Tambah specific non-tech categories yang relevan dengan job market
+    """
+    
+    # Load existing comprehensive skills
+    with open('comprehensive_skills_database.json', 'r', encoding='utf-8') as f:
+        skills_db = json.load(f)
+    
+    # Add new non-tech categories
+    non_tech_categories = get_non_tech_categories()
+    
     # Merge with existing database
     skills_db.update(non_tech_categories)
     